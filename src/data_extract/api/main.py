@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncIterator
@@ -34,6 +35,7 @@ REMOTE_BIND_MIN_API_KEY_LENGTH_ENV = "DATA_EXTRACT_API_REMOTE_BIND_MIN_API_KEY_L
 REMOTE_BIND_MIN_SESSION_SECRET_LENGTH_ENV = "DATA_EXTRACT_API_REMOTE_BIND_MIN_SESSION_SECRET_LENGTH"
 REMOTE_BIND_MIN_API_KEY_LENGTH_DEFAULT = 32
 REMOTE_BIND_MIN_SESSION_SECRET_LENGTH_DEFAULT = 32
+PREWARM_NLP_ENV = "DATA_EXTRACT_API_PREWARM_NLP"
 
 
 def _env_flag_enabled(name: str, default: bool = False) -> bool:
@@ -91,6 +93,31 @@ def _remote_security_errors() -> list[str]:
     return errors
 
 
+def _start_nlp_prewarm() -> threading.Thread | None:
+    """Load the sentence model in the background so the first job does not pay for it.
+
+    Jobs that start before the load finishes wait on the model registry lock
+    rather than loading a second copy.
+    """
+    if not _env_flag_enabled(PREWARM_NLP_ENV, default=True):
+        return None
+    try:
+        from data_extract.utils.nlp import warm_nlp_models
+    except ImportError:
+        return None
+
+    def _warm() -> None:
+        try:
+            warm_nlp_models()
+        except Exception:
+            # Load failures are logged by utils.nlp; jobs retry through the lazy path.
+            pass
+
+    thread = threading.Thread(target=_warm, name="nlp-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
 def startup_event() -> None:
     """Initialize persistence and worker runtime."""
     security_errors = _remote_security_errors()
@@ -98,6 +125,7 @@ def startup_event() -> None:
         raise RuntimeError("Remote bind security policy violation: " + " ".join(security_errors))
     runtime.start()
     runtime.set_readiness_report(evaluate_runtime_readiness())
+    _start_nlp_prewarm()
 
 
 def shutdown_event() -> None:
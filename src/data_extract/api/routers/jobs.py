@@ -8,17 +8,17 @@ import shutil
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, cast
 
 from fastapi import APIRouter, Body, HTTPException, Query, Request, UploadFile
 from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from sqlalchemy import delete, select
 
 from data_extract.api.database import JOBS_HOME, SessionLocal, with_sqlite_lock_retry
 from data_extract.api.models import AppSetting, Job, JobEvent, JobFile
 from data_extract.api.state import QueueCapacityError, runtime
-from data_extract.contracts import ProcessJobRequest, RetryRequest
+from data_extract.contracts import ExecutorMode, ProcessJobRequest, RetryRequest
 
 router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
 
@@ -282,6 +282,7 @@ async def _build_process_request_from_form(request: Request, job_id: str) -> Pro
             chunk_size=_to_int(form.get("chunk_size"), 512),
             recursive=_to_bool(form.get("recursive")),
             incremental=_to_bool(form.get("incremental")),
+            paranoid=_to_bool(form.get("paranoid")),
             force=_to_bool(form.get("force")),
             resume=_to_bool(form.get("resume")),
             resume_session=_optional_str(form.get("resume_session")),
@@ -324,7 +325,17 @@ async def _build_process_request_from_form(request: Request, job_id: str) -> Pro
                 else None
             ),
             pipeline_profile=_optional_str(form.get("pipeline_profile")),
+            workers=(
+                _to_int(form.get("workers"), 1) if form.get("workers") not in (None, "") else None
+            ),
+            # The model rejects unknown executors; the cast only satisfies mypy.
+            executor=cast(Optional[ExecutorMode], _optional_str(form.get("executor"))),
+            segmentation_backend=_optional_str(form.get("segmentation_backend")),
         )
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=422, detail=exc.errors(include_url=False, include_context=False)
+        ) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid numeric input: {exc}") from exc
 
@@ -376,7 +387,12 @@ async def enqueue_process_job(
                 payload = await request.json()
             except Exception as exc:
                 raise HTTPException(status_code=400, detail=f"Invalid JSON payload: {exc}") from exc
-            process_request = ProcessJobRequest(**payload)
+            try:
+                process_request = ProcessJobRequest(**payload)
+            except ValidationError as exc:
+                raise HTTPException(
+                    status_code=422, detail=exc.errors(include_url=False, include_context=False)
+                ) from exc
     if process_request is None:
         raise HTTPException(status_code=400, detail="Missing process request payload")
     if not is_multipart:
@@ -18,6 +18,9 @@ __all__ = [
     "ChunkMetadata",
     "QualityScore",
     "MetadataEnricher",
+    "ChunkingEngineRegistry",
+    "get_chunking_engine_registry",
+    "get_shared_chunking_engine",
 ]
 
 _LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
@@ -27,6 +30,12 @@ _LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
     "ChunkMetadata": ("data_extract.chunk.models", "ChunkMetadata"),
     "QualityScore": ("data_extract.chunk.quality", "QualityScore"),
     "MetadataEnricher": ("data_extract.chunk.metadata_enricher", "MetadataEnricher"),
+    "ChunkingEngineRegistry": ("data_extract.chunk.registry", "ChunkingEngineRegistry"),
+    "get_chunking_engine_registry": (
+        "data_extract.chunk.registry",
+        "get_chunking_engine_registry",
+    ),
+    "get_shared_chunking_engine": ("data_extract.chunk.registry", "get_shared_chunking_engine"),
 }
 
 
@@ -20,7 +20,7 @@ Compliance:
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 import structlog
 
@@ -42,6 +42,8 @@ class ChunkingConfig:
         overlap_pct: Overlap percentage as float (0.0-0.5, default 0.15)
         entity_aware: Enable entity-aware chunking (default False)
         quality_enrichment: Enable quality metadata enrichment (default True)
+        segmentation_backend: Sentence segmentation backend used when no segmenter
+            is injected: parser, senter, sentencizer or heuristic (default parser)
 
     Example:
         >>> config = ChunkingConfig(chunk_size=1024, overlap_pct=0.25)
@@ -52,6 +54,7 @@ class ChunkingConfig:
     overlap_pct: float = 0.15
     entity_aware: bool = False
     quality_enrichment: bool = True
+    segmentation_backend: str = "parser"
 
 
 class ChunkingEngine:
@@ -66,6 +69,9 @@ class ChunkingEngine:
         - Deterministic Processing: Same input always produces identical chunks
         - Immutable Output: Chunks are Pydantic models (validation + serialization)
         - PipelineStage Protocol: Implements process(Document, Context) -> List[Chunk]
+        - Reentrant: Configuration is fixed at construction and per-document state
+          stays in method locals, so one instance can chunk many documents
+          concurrently (shared per config via chunk.registry)
 
     Attributes:
         segmenter: SentenceSegmenter instance for sentence boundary detection
@@ -86,6 +92,9 @@ class ChunkingEngine:
         - NFR-P4: 100% deterministic (same input → same chunks)
     """
 
+    # Chunks worth of buffered sentences before chunk_stream() runs the window
+    STREAM_FLUSH_CHUNKS = 4
+
     def __init__(
         self,
         config: Optional[ChunkingConfig] = None,
@@ -106,7 +115,8 @@ class ChunkingEngine:
             config: ChunkingConfig instance (new pattern, Story 3.3). If provided, overrides
                 individual parameters.
             segmenter: SentenceSegmenter instance for sentence boundary detection.
-                If None, creates default SentenceSegmenter.
+                If None, creates a SentenceSegmenter using the config's
+                segmentation_backend (parser for the legacy pattern).
             chunk_size: Target chunk size in tokens. Range: 128-2048. Default: 512.
             overlap_pct: Overlap percentage as float. Range: 0.0-0.5. Default: 0.15.
             entity_aware: Enable entity-aware chunking (Story 3.2). Default: False.
@@ -131,12 +141,14 @@ class ChunkingEngine:
             _overlap_pct = config.overlap_pct
             _entity_aware = config.entity_aware
             _quality_enrichment = config.quality_enrichment
+            _segmentation_backend = config.segmentation_backend
         else:
             # Legacy pattern: Use individual parameters
             _chunk_size = chunk_size if chunk_size is not None else 512
             _overlap_pct = overlap_pct if overlap_pct is not None else 0.15
             _entity_aware = entity_aware if entity_aware is not None else False
             _quality_enrichment = quality_enrichment if quality_enrichment is not None else True
+            _segmentation_backend = "parser"
 
         # Validate configuration (AC-3.1-3, AC-3.1-4)
         if _chunk_size < 1:
@@ -148,7 +160,7 @@ class ChunkingEngine:
         if segmenter is None:
             from .sentence_segmenter import SentenceSegmenter
 
-            segmenter = SentenceSegmenter()
+            segmenter = SentenceSegmenter(backend=_segmentation_backend)
 
         self.segmenter = segmenter
         self.chunk_size = _chunk_size
@@ -332,17 +344,66 @@ class ChunkingEngine:
                 )
             return
 
-        # Extract normalized text
-        text = document.text
-
         # Get sentences using segmenter (AC-3.1-5)
         try:
-            sentences = self.segmenter.segment(text)
+            sentences = self.segmenter.segment(document.text)
         except Exception as e:
             raise ProcessingError(
                 f"Sentence segmentation failed for document {document.id}: {e}"
             ) from e
 
+        yield from self._chunk_sentences(document, sentences, context)
+
+    def chunk_documents(
+        self, documents: Sequence[Document], context: ProcessingContext
+    ) -> List[List[Chunk]]:
+        """Chunk several documents, segmenting all of their text in one batch.
+
+        Produces the same chunks as calling :meth:`process` on each document,
+        but sentence segmentation runs once over the whole batch (one
+        ``nlp.pipe`` pass) instead of once per document. Segmenters without a
+        ``segment_batch`` method are called per document.
+
+        Args:
+            documents: Normalized documents from Epic 2
+            context: Processing context (config, logger, metrics)
+
+        Returns:
+            One list of chunks per document, in input order
+
+        Raises:
+            ProcessingError: If batch sentence segmentation fails
+        """
+        texts = [
+            document.text if document.text and document.text.strip() else ""
+            for document in documents
+        ]
+        segment_batch = getattr(self.segmenter, "segment_batch", None)
+        try:
+            if callable(segment_batch):
+                batch_sentences = segment_batch(texts)
+            else:
+                batch_sentences = [self.segmenter.segment(text) if text else [] for text in texts]
+        except Exception as e:
+            raise ProcessingError(
+                f"Sentence segmentation failed for batch of {len(texts)} documents: {e}"
+            ) from e
+
+        results: List[List[Chunk]] = []
+        for document, text, sentences in zip(documents, texts, batch_sentences):
+            if not text:
+                # Same empty-document handling (and logging) as chunk_document
+                results.append(self.process(document, context))
+            else:
+                results.append(list(self._chunk_sentences(document, sentences, context)))
+        return results
+
+    def _chunk_sentences(
+        self, document: Document, sentences: List[str], context: ProcessingContext
+    ) -> Iterator[Chunk]:
+        """Build chunks for ``document`` from its already segmented ``sentences``."""
+        text = document.text
+
         if not sentences:
             if context.logger:
                 context.logger.info(
@@ -385,55 +446,134 @@ class ChunkingEngine:
             document,
             context,
         ):
-            # Generate deterministic chunk ID (AC-3.1-7)
-            source_stem = Path(document.metadata.source_file).stem
-            chunk_id = f"{source_stem}_chunk_{chunk_index:03d}"
-
-            # Calculate token and word counts
-            token_count = len(chunk_text) // 4  # Industry standard approximation
-            word_count = len(chunk_text.split())
-
-            # Extract entities in this chunk (preserve from document)
-            chunk_entities = self._extract_chunk_entities(
-                chunk_text, document.entities, chunk_index
-            )
+            yield self._build_chunk(document, chunk_text, chunk_metadata, chunk_index, context)
+            chunk_index += 1
 
-            # Create chunk with metadata (entity metadata in chunk_metadata dict)
-            chunk = Chunk(
-                id=chunk_id,
-                text=chunk_text,
+        if context.logger:
+            context.logger.info(
+                "Document chunking complete",
                 document_id=document.id,
-                position_index=chunk_index,
-                token_count=token_count,
-                word_count=word_count,
-                entities=chunk_entities,
-                section_context=chunk_metadata.get("section_context", ""),
-                quality_score=0.0,  # Placeholder for Story 3.3
-                readability_scores={},  # Placeholder for Story 3.3
-                metadata=self._create_chunk_metadata(
-                    document,
-                    chunk_id,
-                    chunk_index,
-                    token_count,
-                    word_count,
-                    context,
-                    chunk_metadata,
-                ),
+                total_chunks=chunk_index,
+                chunk_size=self.chunk_size,
+                overlap_pct=self.overlap_pct,
+                entity_aware=self.entity_aware,
             )
 
-            yield chunk
-            chunk_index += 1
+    def chunk_stream(
+        self,
+        fragments: Iterable[str],
+        document: Document,
+        context: ProcessingContext,
+    ) -> Iterator[Chunk]:
+        """Chunk text that arrives incrementally (e.g. one PDF page at a time).
+
+        Each fragment is segmented on arrival and its sentences are buffered until
+        roughly ``STREAM_FLUSH_CHUNKS`` chunks worth of tokens are available. The
+        buffer is then run through the normal sliding window; every complete chunk
+        is yielded immediately and only the unfinished tail is carried into the
+        next window, so memory is bounded by the window rather than the document.
+
+        Fragment boundaries are treated as sentence boundaries. Because entity
+        analysis and section hierarchy need the whole text, chunks produced here
+        carry no entity references or section breadcrumbs; use
+        :meth:`chunk_document` when those are required.
+
+        Args:
+            fragments: Iterable of text fragments in document order
+            document: Document supplying id and metadata (``text`` may be empty)
+            context: Processing context
+
+        Yields:
+            Chunk: Chunks identical in shape to those from :meth:`chunk_document`
+        """
+        flush_tokens = self.chunk_size * self.STREAM_FLUSH_CHUNKS
+        pending: List[str] = []
+        pending_tokens = 0
+        chunk_index = 0
+        fragment_count = 0
+
+        def _flush(final: bool) -> Iterator[Chunk]:
+            nonlocal pending, pending_tokens, chunk_index
+            carry: Optional[List[str]] = None if final else []
+            for chunk_text, chunk_metadata in self._generate_chunks(
+                pending, [], [], [], {}, document, context, carry=carry
+            ):
+                yield self._build_chunk(document, chunk_text, chunk_metadata, chunk_index, context)
+                chunk_index += 1
+            pending = carry or []
+            pending_tokens = sum(len(sentence) // 4 for sentence in pending)
+
+        for fragment in fragments:
+            fragment_count += 1
+            if not fragment or not fragment.strip():
+                continue
+            try:
+                sentences = self.segmenter.segment(fragment)
+            except Exception as e:
+                raise ProcessingError(
+                    f"Sentence segmentation failed for document {document.id}: {e}"
+                ) from e
+            pending.extend(sentences)
+            pending_tokens += sum(len(sentence) // 4 for sentence in sentences)
+            if pending_tokens >= flush_tokens:
+                yield from _flush(final=False)
+
+        if pending:
+            yield from _flush(final=True)
 
         if context.logger:
             context.logger.info(
-                "Document chunking complete",
+                "Streaming chunking complete",
                 document_id=document.id,
+                fragments=fragment_count,
                 total_chunks=chunk_index,
                 chunk_size=self.chunk_size,
                 overlap_pct=self.overlap_pct,
-                entity_aware=self.entity_aware,
             )
 
+    def _build_chunk(
+        self,
+        document: Document,
+        chunk_text: str,
+        chunk_metadata: Dict[str, Any],
+        chunk_index: int,
+        context: ProcessingContext,
+    ) -> Chunk:
+        """Build a Chunk model from generated chunk text and metadata."""
+        # Generate deterministic chunk ID (AC-3.1-7)
+        source_stem = Path(document.metadata.source_file).stem
+        chunk_id = f"{source_stem}_chunk_{chunk_index:03d}"
+
+        # Calculate token and word counts
+        token_count = len(chunk_text) // 4  # Industry standard approximation
+        word_count = len(chunk_text.split())
+
+        # Extract entities in this chunk (preserve from document)
+        chunk_entities = self._extract_chunk_entities(chunk_text, document.entities, chunk_index)
+
+        # Create chunk with metadata (entity metadata in chunk_metadata dict)
+        return Chunk(
+            id=chunk_id,
+            text=chunk_text,
+            document_id=document.id,
+            position_index=chunk_index,
+            token_count=token_count,
+            word_count=word_count,
+            entities=chunk_entities,
+            section_context=chunk_metadata.get("section_context", ""),
+            quality_score=0.0,  # Placeholder for Story 3.3
+            readability_scores={},  # Placeholder for Story 3.3
+            metadata=self._create_chunk_metadata(
+                document,
+                chunk_id,
+                chunk_index,
+                token_count,
+                word_count,
+                context,
+                chunk_metadata,
+            ),
+        )
+
     def _build_section_hierarchy(self, document: Document, sentences: List[str]) -> Dict[int, str]:
         """Build section hierarchy map (sentence_idx -> breadcrumb).
 
@@ -679,6 +819,7 @@ class ChunkingEngine:
         section_hierarchy: Dict[int, str],
         document: Document,
         context: ProcessingContext,
+        carry: Optional[List[str]] = None,
     ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """Generate chunks using sliding window with sentence boundaries.
 
@@ -699,6 +840,8 @@ class ChunkingEngine:
             section_hierarchy: Map of sentence index to section breadcrumb
             document: Source document
             context: Processing context
+            carry: When given, the unfinished final chunk is not yielded; its
+                sentences are appended here so a streaming caller can continue it
 
         Yields:
             Tuple of (chunk_text, chunk_metadata dict)
@@ -873,6 +1016,11 @@ class ChunkingEngine:
                     current_chunk = []
                     current_token_count = 0
 
+        # Hand the unfinished chunk back to a streaming caller
+        if current_chunk and carry is not None:
+            carry.extend(current_chunk)
+            return
+
         # Yield final chunk if not empty
         if current_chunk:
             chunk_text = " ".join(current_chunk)
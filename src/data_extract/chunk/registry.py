@@ -0,0 +1,104 @@
+"""Process-wide registry of shared ChunkingEngine instances.
+
+A ``ChunkingEngine`` holds only its configuration and stateless helpers
+(sentence segmenter, entity preserver, metadata enricher); everything it
+computes for a document lives in locals of ``chunk_document``/``chunk_stream``.
+One engine per ``ChunkingConfig`` can therefore chunk many documents at once,
+from any number of threads, instead of being rebuilt (and re-logging its
+initialization) for every file.
+
+Process-pool workers each get their own registry; the lock is reset after a
+fork so a child never inherits it held.
+
+Key functions:
+- get_shared_chunking_engine(): ChunkingEngine for a config, built on first use
+- get_chunking_engine_registry(): The process-wide registry
+"""
+
+import dataclasses
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from .engine import ChunkingConfig, ChunkingEngine
+
+logger = structlog.get_logger(__name__)
+
+# Distinct configs kept before the oldest engine is dropped (chunk_size is a
+# per-run option, so long-lived services can see many values).
+MAX_ENGINES = 16
+
+EngineKey = Tuple[Any, ...]
+
+
+class ChunkingEngineRegistry:
+    """Thread-safe cache of ``ChunkingEngine`` instances keyed by ``ChunkingConfig`` values."""
+
+    def __init__(self, max_engines: int = MAX_ENGINES) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[EngineKey, ChunkingEngine] = {}
+        self.max_engines = max(1, max_engines)
+        self.loads = 0
+        self.hits = 0
+
+    def acquire(self, config: Optional[ChunkingConfig] = None) -> Tuple[ChunkingEngine, float]:
+        """Return the shared engine for ``config`` and the build time it cost.
+
+        The build time (milliseconds) is non-zero only for the caller that
+        constructed the engine. Concurrent callers for the same config wait
+        for a single build.
+        """
+        config = config or ChunkingConfig()
+        key = dataclasses.astuple(config)
+        with self._lock:
+            engine = self._entries.get(key)
+            if engine is not None:
+                self.hits += 1
+                return engine, 0.0
+
+            start = time.perf_counter()
+            # Copy so later mutation of the caller's config cannot desync the key.
+            engine = ChunkingEngine(config=dataclasses.replace(config))
+            load_ms = (time.perf_counter() - start) * 1000
+            while len(self._entries) >= self.max_engines:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = engine
+            self.loads += 1
+
+        logger.debug("chunking_engine_loaded", load_ms=round(load_ms, 2))
+        return engine, load_ms
+
+    def get(self, config: Optional[ChunkingConfig] = None) -> ChunkingEngine:
+        """Return the shared engine for ``config``."""
+        return self.acquire(config)[0]
+
+    def clear(self) -> None:
+        """Drop all cached engines (the next lookup rebuilds)."""
+        with self._lock:
+            self._entries.clear()
+
+
+_registry = ChunkingEngineRegistry()
+
+
+def get_chunking_engine_registry() -> ChunkingEngineRegistry:
+    """Return the process-wide chunking engine registry."""
+    return _registry
+
+
+def get_shared_chunking_engine(config: Optional[ChunkingConfig] = None) -> ChunkingEngine:
+    """Return the process-wide engine for ``config`` (default config if omitted)."""
+    return _registry.get(config)
+
+
+def _reset_registry_lock_after_fork() -> None:
+    # Same reasoning as normalize/registry.py: cached engines are safe to
+    # inherit, a lock held by another thread at fork time is not.
+    _registry._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_registry_lock_after_fork)
@@ -3,16 +3,29 @@
 Wraps the spaCy-based sentence boundary detection utility for dependency injection.
 """
 
-from typing import List
+from typing import List, Sequence
 
-from ..utils.nlp import get_sentence_boundaries
+from ..utils.nlp import (
+    DEFAULT_SEGMENTATION_BACKEND,
+    DEFAULT_SENTENCE_BATCH_SIZE,
+    get_segmentation_backend,
+)
 
 
 class SentenceSegmenter:
     """Sentence segmentation using spaCy for semantic chunking.
 
-    Wraps get_sentence_boundaries() utility to provide a clean interface
-    for dependency injection in ChunkingEngine.
+    Wraps the sentence boundary backends in utils.nlp to provide a clean
+    interface for dependency injection in ChunkingEngine. Backends trade
+    accuracy for throughput: ``parser`` (full en_core_web_md, default),
+    ``senter`` (the model's statistical sentence recognizer only),
+    ``sentencizer`` (spaCy punctuation rules) and ``heuristic`` (compiled
+    regexes, no spaCy pipeline).
+
+    Attributes:
+        backend: Name of the segmentation backend
+        batch_size: Texts per spaCy batch in segment_batch()
+        n_process: spaCy worker processes for segment_batch() (1 = in-process)
 
     Example:
         >>> segmenter = SentenceSegmenter()
@@ -21,6 +34,27 @@ class SentenceSegmenter:
         ['First sentence.', 'Second sentence.']
     """
 
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_SENTENCE_BATCH_SIZE,
+        n_process: int = 1,
+        backend: str = DEFAULT_SEGMENTATION_BACKEND,
+    ) -> None:
+        """Initialize segmenter with a backend and batch settings for segment_batch().
+
+        Raises:
+            ValueError: If batch_size or n_process is less than 1, or the
+                backend is not registered
+        """
+        self._boundaries = get_segmentation_backend(backend)
+        self.backend = backend.strip().lower()
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if n_process < 1:
+            raise ValueError(f"n_process must be >= 1, got {n_process}")
+        self.batch_size = batch_size
+        self.n_process = n_process
+
     def segment(self, text: str) -> List[str]:
         """Segment text into sentences using spaCy.
 
@@ -38,9 +72,30 @@ class SentenceSegmenter:
             return []
 
         # Get sentence boundary positions
-        boundaries = get_sentence_boundaries(text)
+        boundaries = self._boundaries([text], self.batch_size, 1)[0]
+        return self._split(text, boundaries)
+
+    def segment_batch(self, texts: Sequence[str]) -> List[List[str]]:
+        """Segment many texts into sentences with one batched spaCy pass.
+
+        Args:
+            texts: Input texts to segment
+
+        Returns:
+            One list of sentence strings per text, in input order (empty for
+            empty or whitespace-only texts)
+
+        Raises:
+            OSError: If en_core_web_md model is not installed in frozen mode
+        """
+        boundaries = self._boundaries(texts, self.batch_size, self.n_process)
+        return [
+            self._split(text, text_boundaries) for text, text_boundaries in zip(texts, boundaries)
+        ]
 
-        # Extract sentence texts
+    @staticmethod
+    def _split(text: str, boundaries: List[int]) -> List[str]:
+        """Extract stripped, non-empty sentence texts ending at ``boundaries``."""
         sentences: List[str] = []
         start = 0
         for end in boundaries:
@@ -19,17 +19,19 @@ Usage:
 """
 
 import fnmatch
+import itertools
 import json
 import os
 import platform
 import sys
 from pathlib import Path
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Iterator, Optional, cast
 
 import typer
 from rich.console import Console
 
 from data_extract import __version__
+from data_extract.contracts import MAX_PIPELINE_WORKERS, ExecutorMode
 
 # CLI integration imports (Story 5-4, 5-5, 5-7)
 from .config import validate_config_file
@@ -46,6 +48,7 @@ CLI_UX_VERSION = "0.2.0"
 LEGACY_EPIC_LABEL = "Epic 3, Story 3.5"
 CURRENT_EPIC_LABEL = "Epic 5 - Enhanced CLI UX"
 VALID_PIPELINE_PROFILES = {"auto", "legacy", "advanced"}
+VALID_EXECUTORS = {"thread", "process", "staged"}
 OCR_SENSITIVE_EXTENSIONS = {
     ".pdf",
     ".png",
@@ -112,6 +115,24 @@ def _normalize_pipeline_profile(pipeline_profile: str) -> str:
     return normalized
 
 
+def _normalize_executor(executor: str) -> ExecutorMode:
+    normalized = str(executor or "thread").strip().lower()
+    if normalized not in VALID_EXECUTORS:
+        raise ValueError(
+            f"Invalid executor '{executor}'. Must be one of: {', '.join(sorted(VALID_EXECUTORS))}"
+        )
+    return cast(ExecutorMode, normalized)
+
+
+def _normalize_segmentation_backend(segmentation_backend: Optional[str]) -> Optional[str]:
+    if segmentation_backend is None:
+        return None
+    from data_extract.utils.nlp import get_segmentation_backend
+
+    get_segmentation_backend(segmentation_backend)
+    return segmentation_backend.strip().lower()
+
+
 def _show_ocr_readiness_guidance(files: list[Path], quiet: bool) -> None:
     if quiet:
         return
@@ -259,6 +280,9 @@ def create_app() -> typer.Typer:
     # Register status command (Typer-native)
     _register_status_command(app)
 
+    # Register watch command (Typer-native)
+    _register_watch_command(app)
+
     # Register local UI launcher command
     _register_ui_command(app)
 
@@ -449,6 +473,14 @@ def _register_process_command(app: typer.Typer) -> None:
                 help="Process only new and modified files, skip unchanged files.",
             ),
         ] = False,
+        paranoid: Annotated[
+            bool,
+            typer.Option(
+                "--paranoid",
+                help="With --incremental, re-hash every tracked file instead of "
+                "trusting unchanged size/mtime/inode.",
+            ),
+        ] = False,
         force: Annotated[
             bool,
             typer.Option(
@@ -479,6 +511,28 @@ def _register_process_command(app: typer.Typer) -> None:
                 help="Pipeline profile routing: auto, legacy, advanced.",
             ),
         ] = "auto",
+        workers: Annotated[
+            int,
+            typer.Option(
+                "--workers",
+                help="Number of parallel workers for file processing.",
+            ),
+        ] = 1,
+        executor: Annotated[
+            str,
+            typer.Option(
+                "--executor",
+                help="Parallel executor: thread, process, or staged (overlaps pipeline stages).",
+            ),
+        ] = "thread",
+        segmentation_backend: Annotated[
+            Optional[str],
+            typer.Option(
+                "--segmentation-backend",
+                help="Sentence segmentation backend: parser, senter, sentencizer, or heuristic "
+                "(default: the pipeline profile's backend).",
+            ),
+        ] = None,
         semantic_report: Annotated[
             bool,
             typer.Option(
@@ -589,10 +643,19 @@ def _register_process_command(app: typer.Typer) -> None:
             raise typer.Exit(code=EXIT_CONFIG_ERROR)
         try:
             normalized_pipeline_profile = _normalize_pipeline_profile(pipeline_profile)
+            normalized_executor = _normalize_executor(executor)
+            normalized_segmentation_backend = _normalize_segmentation_backend(segmentation_backend)
         except ValueError as exc:
             console.print(f"[red]Configuration error:[/red] {exc}")
             raise typer.Exit(code=EXIT_CONFIG_ERROR) from exc
 
+        if not 1 <= workers <= MAX_PIPELINE_WORKERS:
+            console.print(
+                f"[red]Configuration error:[/red] Invalid worker count: {workers} "
+                f"(must be 1-{MAX_PIPELINE_WORKERS})"
+            )
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+
         if organize and not strategy:
             typer.echo("Error: --organize flag requires --strategy option", err=True)
             raise typer.Exit(code=1)
@@ -697,6 +760,7 @@ def _register_process_command(app: typer.Typer) -> None:
             delimiter=delimiter,
             recursive=recursive,
             incremental=incremental,
+            paranoid=paranoid,
             force=force,
             resume=resume,
             resume_session=resume_session,
@@ -714,6 +778,9 @@ def _register_process_command(app: typer.Typer) -> None:
             semantic_n_components=semantic_n_components,
             semantic_min_quality=semantic_min_quality,
             pipeline_profile=normalized_pipeline_profile,
+            workers=workers,
+            executor=normalized_executor,
+            segmentation_backend=normalized_segmentation_backend,
             continue_on_error=True,
         )
 
@@ -890,6 +957,7 @@ def _register_process_command(app: typer.Typer) -> None:
         """Extract content from documents without semantic enrichment."""
         from data_extract.cli.exit_codes import determine_exit_code
         from data_extract.services import FileDiscoveryService, PipelineService
+        from data_extract.services.pipeline_service import PipelineFileResult, PipelineOutcome
 
         global_quiet = bool(ctx.parent.params.get("quiet", False)) if ctx.parent else False
         effective_quiet = quiet or global_quiet
@@ -926,6 +994,12 @@ def _register_process_command(app: typer.Typer) -> None:
             output_file_override = output.resolve()
             output_dir = output_file_override.parent
 
+        def _print_outcome(outcome: PipelineOutcome) -> None:
+            if isinstance(outcome, PipelineFileResult):
+                console.print(f"[green]{outcome.source_path.name}[/green] -> {outcome.output_path}")
+            else:
+                console.print(f"[red]{outcome.source_path.name}[/red]: {outcome.error_message}")
+
         run = pipeline.process_files(
             files=files,
             output_dir=output_dir,
@@ -936,16 +1010,9 @@ def _register_process_command(app: typer.Typer) -> None:
             source_root=input_path.parent if input_path.is_file() else input_path,
             pipeline_profile=normalized_pipeline_profile,
             output_file_override=output_file_override,
+            on_result=_print_outcome if verbose and not effective_quiet else None,
         )
 
-        if verbose and not effective_quiet:
-            for processed in run.processed:
-                console.print(
-                    f"[green]{processed.source_path.name}[/green] -> {processed.output_path}"
-                )
-            for failed in run.failed:
-                console.print(f"[red]{failed.source_path.name}[/red]: {failed.error_message}")
-
         if not effective_quiet:
             total_done = len(run.processed) + len(run.failed)
             total_files = len(files) if files else total_done
@@ -1014,9 +1081,16 @@ def _register_process_command(app: typer.Typer) -> None:
             int,
             typer.Option(
                 "--workers",
-                help="Number of worker threads for batch processing.",
+                help="Number of parallel workers for batch processing.",
             ),
         ] = 1,
+        executor: Annotated[
+            str,
+            typer.Option(
+                "--executor",
+                help="Parallel executor: thread, process, or staged (overlaps pipeline stages).",
+            ),
+        ] = "thread",
         quiet: Annotated[
             bool,
             typer.Option(
@@ -1031,6 +1105,14 @@ def _register_process_command(app: typer.Typer) -> None:
                 help="Pipeline profile routing: auto, legacy, advanced.",
             ),
         ] = "auto",
+        segmentation_backend: Annotated[
+            Optional[str],
+            typer.Option(
+                "--segmentation-backend",
+                help="Sentence segmentation backend: parser, senter, sentencizer, or heuristic "
+                "(default: the pipeline profile's backend).",
+            ),
+        ] = None,
     ) -> None:
         """Batch process documents in a directory."""
         from data_extract.cli.exit_codes import determine_exit_code
@@ -1047,34 +1129,60 @@ def _register_process_command(app: typer.Typer) -> None:
             raise typer.Exit(code=1)
         try:
             normalized_pipeline_profile = _normalize_pipeline_profile(pipeline_profile)
+            normalized_executor = _normalize_executor(executor)
+            normalized_segmentation_backend = _normalize_segmentation_backend(segmentation_backend)
         except ValueError as exc:
             console.print(f"[red]Configuration error:[/red] {exc}")
             raise typer.Exit(code=1) from exc
 
+        if not 1 <= workers <= MAX_PIPELINE_WORKERS:
+            console.print(
+                f"[red]Configuration error:[/red] Invalid worker count: {workers} "
+                f"(must be 1-{MAX_PIPELINE_WORKERS})"
+            )
+            raise typer.Exit(code=1)
+
         discovery = FileDiscoveryService()
         pipeline = PipelineService()
 
-        files, source_dir = discovery.discover(str(input_path), recursive=recursive)
-        if pattern:
-            files = [file_path for file_path in files if fnmatch.fnmatch(file_path.name, pattern)]
+        source_dir = discovery.source_dir_for(input_path)
+        matched: set[Path] = set()
 
-        if not files:
+        def _matched_files() -> Iterator[Path]:
+            # Hand files to the pipeline as the walk finds them. A file reachable
+            # through several symlinks is processed once, and the OCR guidance is
+            # shown for the first file that needs it.
+            ocr_checked = False
+            for file_path in discovery.iter_files(str(input_path), recursive=recursive):
+                if pattern and not fnmatch.fnmatch(file_path.name, pattern):
+                    continue
+                if file_path in matched:
+                    continue
+                matched.add(file_path)
+                if not ocr_checked and file_path.suffix.lower() in OCR_SENSITIVE_EXTENSIONS:
+                    ocr_checked = True
+                    _show_ocr_readiness_guidance([file_path], quiet=effective_quiet)
+                yield file_path
+
+        file_stream = _matched_files()
+        first_file = next(file_stream, None)
+        if first_file is None:
             console.print("[yellow]No files matched batch criteria.[/yellow]")
             raise typer.Exit(code=1)
 
-        _show_ocr_readiness_guidance(files, quiet=effective_quiet)
-
         output_dir = output.resolve()
         run = pipeline.process_files(
-            files=files,
+            files=itertools.chain([first_file], file_stream),
             output_dir=output_dir,
             output_format=output_format,
             chunk_size=500000,
             workers=workers,
+            executor=normalized_executor,
             include_semantic=False,
             continue_on_error=True,
             source_root=source_dir,
             pipeline_profile=normalized_pipeline_profile,
+            segmentation_backend=normalized_segmentation_backend,
         )
 
         if not effective_quiet:
@@ -1084,7 +1192,7 @@ def _register_process_command(app: typer.Typer) -> None:
             console.print(f"[cyan]Output:[/cyan] {output_dir}")
 
         exit_code = determine_exit_code(
-            total_files=len(files),
+            total_files=len(matched),
             processed_count=len(run.processed),
             failed_count=len(run.failed),
             config_error=False,
@@ -2379,6 +2487,138 @@ def _register_session_commands(app: typer.Typer) -> None:
     app.add_typer(session_app)
 
 
+def _register_watch_command(app: typer.Typer) -> None:
+    """Register long-running watch command backed by incremental processing."""
+
+    @app.command()
+    def watch(
+        input_path: Annotated[
+            Path,
+            typer.Argument(
+                help="Source directory to watch (recursively).",
+                exists=True,
+                file_okay=False,
+            ),
+        ],
+        output: Annotated[
+            Optional[Path],
+            typer.Option(
+                "--output",
+                "-o",
+                help="Output directory (default: <source>/output).",
+            ),
+        ] = None,
+        format: Annotated[
+            str,
+            typer.Option(
+                "--format",
+                "-f",
+                help="Output format: json, csv, or txt.",
+            ),
+        ] = "json",
+        chunk_size: Annotated[
+            int,
+            typer.Option(
+                "--chunk-size",
+                help="Maximum tokens per chunk.",
+            ),
+        ] = 512,
+        debounce: Annotated[
+            float,
+            typer.Option(
+                "--debounce",
+                help="Seconds without new changes before a batch is processed.",
+            ),
+        ] = 1.0,
+        backend: Annotated[
+            Optional[str],
+            typer.Option(
+                "--backend",
+                help="Change detection: auto, inotify, or poll "
+                "(default: DATA_EXTRACT_WATCH_BACKEND or auto).",
+            ),
+        ] = None,
+        poll_interval: Annotated[
+            float,
+            typer.Option(
+                "--poll-interval",
+                help="Seconds between directory scans with the poll backend.",
+            ),
+        ] = 2.0,
+        quiet: Annotated[
+            bool,
+            typer.Option(
+                "--quiet",
+                "-q",
+                help="Suppress all output except errors.",
+            ),
+        ] = False,
+    ) -> None:
+        """Watch a directory and process new or modified files as they appear."""
+        from data_extract.cli.batch import IncrementalProcessor, ProcessingResult
+        from data_extract.cli.exit_codes import EXIT_CONFIG_ERROR
+        from data_extract.cli.watch import WatchLoop, create_watcher
+
+        output_format = format.lower()
+        if output_format not in {"json", "csv", "txt"}:
+            console.print(
+                f"[red]Configuration error:[/red] Invalid format '{format}'. "
+                "Must be one of: csv, json, txt"
+            )
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        if chunk_size <= 0 or debounce < 0 or poll_interval <= 0:
+            console.print(
+                "[red]Configuration error:[/red] --chunk-size and --poll-interval must be "
+                "positive and --debounce non-negative."
+            )
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+
+        source = input_path.resolve()
+        output_dir = (output or source / "output").resolve()
+        try:
+            # Start watching before the catch-up pass so nothing written meanwhile is missed.
+            watcher = create_watcher(
+                source, exclude_paths=[output_dir], backend=backend, poll_interval=poll_interval
+            )
+        except (OSError, ValueError) as exc:
+            console.print(f"[red]Configuration error:[/red] {exc}")
+            raise typer.Exit(code=EXIT_CONFIG_ERROR) from exc
+
+        def report(files: list[Path], result: ProcessingResult) -> None:
+            if quiet:
+                return
+            console.print(
+                f"[green]Processed batch:[/green] {len(files)} changed, "
+                f"{result.successful} succeeded, {result.failed} failed, "
+                f"{result.skipped} unchanged"
+            )
+
+        loop = WatchLoop(
+            IncrementalProcessor(
+                source, output_dir, output_format=output_format, chunk_size=chunk_size
+            ),
+            watcher,
+            debounce_seconds=debounce,
+            on_batch=report,
+        )
+        loop.warm_up()
+        initial = loop.catch_up()
+        if not quiet:
+            console.print(
+                f"[cyan]Catch-up:[/cyan] {initial.successful} processed, "
+                f"{initial.failed} failed, {initial.skipped} unchanged"
+            )
+            console.print(
+                f"[cyan]Watching:[/cyan] {source} ({watcher.backend}) -> {output_dir}. "
+                "Press Ctrl+C to stop."
+            )
+        try:
+            loop.run()
+        except KeyboardInterrupt:
+            if not quiet:
+                console.print("[yellow]Watch stopped.[/yellow]")
+
+
 def _register_ui_command(app: typer.Typer) -> None:
     """Register local UI launcher command."""
 
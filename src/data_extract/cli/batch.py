@@ -2,7 +2,7 @@
 
 Provides incremental processing capabilities with:
 - SHA256 file hashing for change detection
-- State file persistence for tracking processed files
+- SQLite state store for tracking processed files (legacy JSON state is migrated)
 - Glob pattern expansion for batch input
 - Corpus sync status tracking
 
@@ -11,19 +11,25 @@ Reference: docs/tech-spec-epic-5.md
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import shutil
+import sqlite3
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from data_extract.services.file_discovery_service import DirectoryWalker
+from data_extract.services.fingerprint_service import FingerprintService, get_fingerprint_service
 from data_extract.services.pipeline_service import PipelineService
 
+PARANOID_ENV = "DATA_EXTRACT_INCREMENTAL_PARANOID"
+
 # ==============================================================================
 # Enums and Type Definitions
 # ==============================================================================
@@ -138,11 +144,13 @@ class FileHasher:
     CHUNK_SIZE = 8192  # 8KB chunks for efficient reading
 
     @staticmethod
-    def compute_hash(file_path: Path) -> str:
+    def compute_hash(file_path: Path, use_cache: bool = True) -> str:
         """Compute SHA256 hash of file contents.
 
         Args:
             file_path: Path to file to hash
+            use_cache: Reuse the fingerprint cache when the file's stat identity
+                is unchanged; False always reads and hashes the content
 
         Returns:
             Hexadecimal SHA256 hash string
@@ -155,19 +163,15 @@ class FileHasher:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        hasher = hashlib.sha256()
-
         try:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(FileHasher.CHUNK_SIZE):
-                    hasher.update(chunk)
+            return get_fingerprint_service().fingerprint(
+                file_path, FileHasher.CHUNK_SIZE, use_cache=use_cache
+            )
         except PermissionError as e:
             raise PermissionError(f"Permission denied reading file: {file_path}") from e
         except OSError as e:
             raise OSError(f"Error reading file {file_path}: {e}") from e
 
-        return hasher.hexdigest()
-
 
 # ==============================================================================
 # State File Management
@@ -175,7 +179,11 @@ class FileHasher:
 
 
 class StateFile:
-    """Manages incremental state persistence.
+    """Legacy JSON incremental state file.
+
+    Incremental processing now persists state in :class:`StateStore`; this class
+    reads (and can still write) the original single-document format, which the
+    store migrates automatically.
 
     State file schema:
     {
@@ -189,11 +197,16 @@ class StateFile:
                 "hash": "sha256...",
                 "processed_at": "2025-11-25T15:40:00Z",
                 "output_path": "/path/to/output/doc1.json",
-                "size_bytes": 102400
+                "size_bytes": 102400,
+                "mtime_ns": 1764085200000000000,
+                "inode": 1234567
             }
         }
     }
 
+    ``mtime_ns``/``inode`` are optional; entries without them (older state files,
+    or files modified moments before they were recorded) are always re-hashed.
+
     Attributes:
         STATE_FILE_NAME: Name of the state file
         SCHEMA_VERSION: Current schema version for compatibility
@@ -287,34 +300,308 @@ class StateFile:
         return self.state_path
 
 
+class StateStore:
+    """Transactional SQLite store for incremental state.
+
+    Replaces rewriting one JSON document per save: each processed file is a row,
+    updated in bulk with an upsert, and every processing run gets an id so
+    "which files changed since run X" is an indexed query. ``load()`` returns
+    the same dictionary shape as :class:`StateFile`, so change detection and
+    status reporting are unaffected.
+
+    A legacy ``incremental-state.json`` found next to a missing database is
+    imported on first use and renamed to ``incremental-state.json.migrated``.
+
+    Attributes:
+        STATE_DB_NAME: Name of the SQLite database file
+        SCHEMA_VERSION: Value written to ``version`` for new state
+    """
+
+    STATE_DB_NAME = "incremental-state.sqlite3"
+    SCHEMA_VERSION = StateFile.SCHEMA_VERSION
+    MIGRATED_SUFFIX = ".migrated"
+    _FILE_COLUMNS = ("hash", "processed_at", "output_path", "size_bytes", "mtime_ns", "inode")
+
+    def __init__(self, work_dir: Path) -> None:
+        """Initialize the state store.
+
+        Args:
+            work_dir: Working directory (database stored in .data-extract-session subdirectory)
+        """
+        self.work_dir = work_dir
+        self.legacy_file = StateFile(work_dir)
+        self.session_dir = self.legacy_file.session_dir
+        self.state_path = self.session_dir / self.STATE_DB_NAME
+
+    def load(self) -> dict[str, Any] | None:
+        """Load the full state, migrating a legacy JSON state file if needed.
+
+        Returns:
+            State dictionary in the :class:`StateFile` schema, or None if no state
+            exists or the database is unreadable
+        """
+        if not self.state_path.exists() and not self._migrate_legacy():
+            return None
+
+        try:
+            connection = self._connect()
+            try:
+                meta_rows = connection.execute("SELECT key, value FROM meta").fetchall()
+                file_rows = connection.execute(
+                    "SELECT path, hash, processed_at, output_path, size_bytes, mtime_ns, "
+                    "inode, extra FROM files"
+                ).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            # Corrupted or unreadable state - treat as missing
+            return None
+
+        state: dict[str, Any] = {key: json.loads(value) for key, value in meta_rows}
+        files: dict[str, Any] = {}
+        for row in file_rows:
+            entry = json.loads(row[7]) if row[7] else {}
+            for column, value in zip(self._FILE_COLUMNS, row[1:7]):
+                if value is not None:
+                    entry[column] = value
+            files[row[0]] = entry
+        state["files"] = files
+        return state
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Replace the whole stored state in one transaction.
+
+        Prefer :meth:`upsert_files` for incremental updates; this exists for
+        migration and callers that hold a complete state dictionary.
+
+        Args:
+            state: State dictionary in the :class:`StateFile` schema
+
+        Raises:
+            sqlite3.Error: If the write fails
+        """
+        self._replace_state(self.state_path, state)
+
+    def begin_run(self, config_hash: str | None = None) -> int:
+        """Record the start of a processing run.
+
+        Returns:
+            Monotonically increasing run id stamped on files upserted by the run
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO runs (started_at, config_hash) VALUES (?, ?)",
+                    (datetime.now().isoformat(), config_hash),
+                )
+            return int(cursor.lastrowid or 0)
+        finally:
+            connection.close()
+
+    def upsert_files(
+        self,
+        entries: dict[str, dict[str, Any]],
+        run_id: int | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        """Insert or update many file entries (and top-level fields) in one transaction.
+
+        Args:
+            entries: Mapping of source path to entry in the :class:`StateFile` schema
+            run_id: Run that produced the entries (see :meth:`begin_run`)
+            meta: Top-level state fields to set, e.g. ``processed_at``
+
+        Raises:
+            sqlite3.Error: If the write fails
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                if meta:
+                    self._write_meta(connection, meta)
+                self._write_files(connection, entries, run_id)
+        finally:
+            connection.close()
+
+    def changed_since(self, run_id: int) -> list[Path]:
+        """Return files (re)recorded by any run after ``run_id``, sorted by path."""
+        if not self.state_path.exists():
+            return []
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT path FROM files WHERE run_id > ? ORDER BY path", (run_id,)
+            ).fetchall()
+        finally:
+            connection.close()
+        return [Path(row[0]) for row in rows]
+
+    def latest_run_id(self) -> int | None:
+        """Return the id of the most recent run, or None if no run was recorded."""
+        if not self.state_path.exists():
+            return None
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        finally:
+            connection.close()
+        return int(row[0]) if row and row[0] is not None else None
+
+    def exists(self) -> bool:
+        """Check if state exists (database or a legacy JSON file awaiting migration).
+
+        Returns:
+            True if state exists, False otherwise
+        """
+        return self.state_path.exists() or self.legacy_file.exists()
+
+    def get_path(self) -> Path:
+        """Get path to the state database.
+
+        Returns:
+            Path to the database (may not exist)
+        """
+        return self.state_path
+
+    def _connect(self, db_path: Path | None = None) -> sqlite3.Connection:
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(db_path or self.state_path), timeout=30.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id INTEGER PRIMARY KEY AUTOINCREMENT, started_at TEXT NOT NULL, "
+            "config_hash TEXT);"
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, hash TEXT, processed_at TEXT, output_path TEXT, "
+            "size_bytes INTEGER, mtime_ns INTEGER, inode INTEGER, run_id INTEGER, extra TEXT);"
+            "CREATE INDEX IF NOT EXISTS idx_files_run_id ON files (run_id);"
+        )
+        return connection
+
+    def _replace_state(self, db_path: Path, state: dict[str, Any]) -> None:
+        connection = self._connect(db_path)
+        try:
+            with connection:
+                connection.execute("DELETE FROM meta")
+                connection.execute("DELETE FROM files")
+                self._write_meta(
+                    connection, {key: value for key, value in state.items() if key != "files"}
+                )
+                self._write_files(connection, state.get("files", {}), run_id=None)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _write_meta(connection: sqlite3.Connection, meta: dict[str, Any]) -> None:
+        connection.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in meta.items()],
+        )
+
+    @classmethod
+    def _write_files(
+        cls,
+        connection: sqlite3.Connection,
+        entries: dict[str, dict[str, Any]],
+        run_id: int | None,
+    ) -> None:
+        rows = []
+        for path, entry in entries.items():
+            extra = {key: value for key, value in entry.items() if key not in cls._FILE_COLUMNS}
+            rows.append(
+                (
+                    path,
+                    *(entry.get(column) for column in cls._FILE_COLUMNS),
+                    run_id,
+                    json.dumps(extra, ensure_ascii=False) if extra else None,
+                )
+            )
+        connection.executemany(
+            "INSERT INTO files (path, hash, processed_at, output_path, size_bytes, mtime_ns, "
+            "inode, run_id, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET hash = excluded.hash, "
+            "processed_at = excluded.processed_at, output_path = excluded.output_path, "
+            "size_bytes = excluded.size_bytes, mtime_ns = excluded.mtime_ns, "
+            "inode = excluded.inode, run_id = excluded.run_id, extra = excluded.extra",
+            rows,
+        )
+
+    def _migrate_legacy(self) -> bool:
+        """Import a legacy JSON state file into the database.
+
+        Returns:
+            True if state was migrated, False if there was nothing usable to migrate
+        """
+        legacy_state = self.legacy_file.load()
+        if legacy_state is None:
+            return False
+        # Build the database aside so a crash mid-import never leaves a partial store.
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.migrating")
+        try:
+            self._replace_state(tmp_path, legacy_state)
+            os.replace(tmp_path, self.state_path)
+        except (sqlite3.Error, OSError):
+            tmp_path.unlink(missing_ok=True)
+            return False
+        legacy_path = self.legacy_file.get_path()
+        try:
+            legacy_path.replace(legacy_path.with_name(legacy_path.name + self.MIGRATED_SUFFIX))
+        except OSError:
+            # The database now takes precedence; a leftover JSON file is harmless.
+            pass
+        return True
+
+
 # ==============================================================================
 # Change Detection
 # ==============================================================================
 
 
 class ChangeDetector:
-    """Detects file changes by comparing hashes.
+    """Detects file changes by comparing stat identity and hashes.
+
+    A tracked file whose size, ``mtime_ns`` and inode all match its state entry
+    is treated as unchanged without reading it. Anything else (or every tracked
+    file in paranoid mode) is re-hashed, in parallel, and compared by hash.
+    Paranoid mode also bypasses the fingerprint cache and reads every file.
 
     Attributes:
         state: Previously loaded state dictionary
         hasher: FileHasher instance for computing hashes
+        paranoid: Always compare hashes, ignoring stat identity
+        hash_workers: Threads used to hash files that need it
     """
 
-    def __init__(self, state: dict[str, Any] | None, hasher: FileHasher) -> None:
+    def __init__(
+        self,
+        state: dict[str, Any] | None,
+        hasher: FileHasher,
+        paranoid: bool = False,
+        hash_workers: int | None = None,
+    ) -> None:
         """Initialize change detector.
 
         Args:
             state: Previously loaded state (None if no state exists)
             hasher: FileHasher instance
+            paranoid: If True, hash every tracked file even when its stat matches
+            hash_workers: Hashing threads (default: ThreadPoolExecutor's I/O default)
         """
         self.state = state or {}
         self.hasher = hasher
+        self.paranoid = paranoid
+        self.hash_workers = hash_workers
 
     def detect_changes(self, files: list[Path]) -> ChangeSummary:
         """Compare current files against saved state.
 
         For each file:
         - Not in state → NEW
+        - In state with matching size/mtime_ns/inode (not paranoid) → UNCHANGED
         - In state but hash differs → MODIFIED
         - In state and hash matches → UNCHANGED
 
@@ -327,49 +614,77 @@ class ChangeDetector:
         Returns:
             ChangeSummary with categorized files
         """
-        new_files: list[Path] = []
-        modified_files: list[Path] = []
-        unchanged_files: list[Path] = []
-
         # Get previous file records
         previous_files = self.state.get("files", {})
 
-        # Check current files against state
+        status: dict[Path, ChangeType] = {}
+        to_hash: list[Path] = []
         for file_path in files:
-            file_path_str = str(file_path)
-
-            if file_path_str not in previous_files:
-                # New file
-                new_files.append(file_path)
+            entry = previous_files.get(str(file_path))
+            if entry is None:
+                status[file_path] = ChangeType.NEW
+            elif not self.paranoid and self._stat_matches(file_path, entry):
+                status[file_path] = ChangeType.UNCHANGED
             else:
-                # File exists in state - check hash
-                try:
-                    current_hash = self.hasher.compute_hash(file_path)
-                    previous_hash = previous_files[file_path_str].get("hash", "")
+                to_hash.append(file_path)
 
-                    if current_hash != previous_hash:
-                        modified_files.append(file_path)
-                    else:
-                        unchanged_files.append(file_path)
-                except (FileNotFoundError, PermissionError, OSError):
-                    # File became inaccessible - treat as modified to retry
-                    modified_files.append(file_path)
+        for file_path, current_hash in self._hash_files(to_hash):
+            previous_hash = previous_files[str(file_path)].get("hash", "")
+            # Inaccessible files (hash None) are treated as modified to retry
+            if current_hash is None or current_hash != previous_hash:
+                status[file_path] = ChangeType.MODIFIED
+            else:
+                status[file_path] = ChangeType.UNCHANGED
 
         # Check for deleted files (in state but not in current files)
         current_paths = {str(f) for f in files}
-        deleted_files: list[Path] = []
-
-        for previous_path in previous_files.keys():
-            if previous_path not in current_paths:
-                deleted_files.append(Path(previous_path))
+        deleted_files = [
+            Path(previous_path)
+            for previous_path in previous_files.keys()
+            if previous_path not in current_paths
+        ]
 
         return ChangeSummary(
-            new_files=new_files,
-            modified_files=modified_files,
-            unchanged_files=unchanged_files,
+            new_files=[f for f in files if status[f] is ChangeType.NEW],
+            modified_files=[f for f in files if status[f] is ChangeType.MODIFIED],
+            unchanged_files=[f for f in files if status[f] is ChangeType.UNCHANGED],
             deleted_files=deleted_files,
         )
 
+    @staticmethod
+    def _stat_matches(file_path: Path, entry: dict[str, Any]) -> bool:
+        """Return True when the file's stat identity equals the recorded one."""
+        if entry.get("mtime_ns") is None or entry.get("inode") is None:
+            return False
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return (
+            stat.st_size == entry.get("size_bytes")
+            and stat.st_mtime_ns == entry["mtime_ns"]
+            and stat.st_ino == entry["inode"]
+        )
+
+    def _hash_files(self, files: list[Path]) -> list[tuple[Path, str | None]]:
+        """Hash files concurrently; hashing releases the GIL on large reads."""
+
+        def _hash(file_path: Path) -> tuple[Path, str | None]:
+            try:
+                if self.paranoid:
+                    # Paranoid mode distrusts stat identity, including the fingerprint cache's
+                    return file_path, self.hasher.compute_hash(file_path, use_cache=False)
+                return file_path, self.hasher.compute_hash(file_path)
+            except (FileNotFoundError, PermissionError, OSError):
+                return file_path, None
+
+        if len(files) <= 1 or self.hash_workers == 1:
+            return [_hash(file_path) for file_path in files]
+        with ThreadPoolExecutor(
+            max_workers=self.hash_workers, thread_name_prefix="data-extract-hash"
+        ) as executor:
+            return list(executor.map(_hash, files))
+
 
 # ==============================================================================
 # Glob Pattern Expansion
@@ -409,16 +724,15 @@ class GlobPatternExpander:
             ValueError: If pattern is invalid
         """
         try:
-            # Use rglob for ** patterns, glob otherwise
+            # Walk the tree with parallel scandir for ** patterns, glob otherwise
             if "**" in pattern:
-                # Remove ** from pattern for rglob
+                # Remove ** and match the rest against path tails, as rglob would
                 sub_pattern = pattern.replace("**/", "")
-                matches = list(self.base_dir.rglob(sub_pattern))
+                walker = DirectoryWalker(resolve=False)
+                files = [p for p in walker.walk(self.base_dir) if p.match(sub_pattern)]
             else:
-                matches = list(self.base_dir.glob(pattern))
-
-            # Filter to files only (exclude directories)
-            files = [p for p in matches if p.is_file()]
+                # Filter to files only (exclude directories)
+                files = [p for p in self.base_dir.glob(pattern) if p.is_file()]
 
             # Sort for deterministic order
             return sorted(files)
@@ -455,6 +769,7 @@ class IncrementalProcessor:
         output_format: str = "json",
         chunk_size: int = 512,
         include_semantic: bool = False,
+        paranoid: bool | None = None,
     ) -> None:
         """Initialize incremental processor.
 
@@ -462,6 +777,8 @@ class IncrementalProcessor:
             source_dir: Source directory path
             output_dir: Output directory path
             config_hash: Optional configuration hash for invalidation
+            paranoid: Re-hash every tracked file instead of trusting size/mtime/inode.
+                ``None`` reads ``DATA_EXTRACT_INCREMENTAL_PARANOID``.
         """
         self.source_dir = source_dir.resolve()
         self.output_dir = output_dir.resolve()
@@ -469,17 +786,26 @@ class IncrementalProcessor:
         self.output_format = output_format
         self.chunk_size = chunk_size
         self.include_semantic = include_semantic
+        if paranoid is None:
+            paranoid = os.environ.get(PARANOID_ENV, "").strip().lower() in {
+                "1",
+                "true",
+                "yes",
+                "on",
+            }
+        self.paranoid = paranoid
 
         # Initialize components
-        self.state_file = StateFile(self.source_dir.parent)
+        self.state_file = StateStore(self.source_dir.parent)
         self.hasher = FileHasher()
         self.pipeline = PipelineService()
 
-        # Load existing state
+        # Load existing state (migrates a legacy JSON state file on first use)
         self._state = self.state_file.load()
+        self.last_run_id: int | None = None
 
         # Initialize change detector
-        self.change_detector = ChangeDetector(self._state, self.hasher)
+        self.change_detector = ChangeDetector(self._state, self.hasher, paranoid=self.paranoid)
 
     def analyze(self) -> ChangeSummary:
         """Analyze changes without processing.
@@ -557,6 +883,10 @@ class IncrementalProcessor:
             return
         self._update_state(processed_files)
 
+    def changed_since(self, run_id: int) -> list[Path]:
+        """Return files recorded by runs after ``run_id`` (see ``last_run_id``)."""
+        return self.state_file.changed_since(run_id)
+
     def get_status(self) -> dict[str, Any]:
         """Get current corpus sync status.
 
@@ -610,21 +940,15 @@ class IncrementalProcessor:
         Returns:
             List of all files (recursively)
         """
-        files: list[Path] = []
-        output_dir_resolved = self.output_dir.resolve()
-
-        for item in self.source_dir.rglob("*"):
-            if not item.is_file():
-                continue
-            resolved_item = item.resolve()
-            if output_dir_resolved in resolved_item.parents:
-                continue
-            files.append(resolved_item)
-
-        return sorted(files)
+        # The output directory is pruned during the walk instead of filtered afterwards.
+        walker = DirectoryWalker(exclude_paths=[self.output_dir])
+        return sorted(set(walker.walk(self.source_dir)))
 
     def _update_state(self, processed_files: list[Path]) -> None:
-        """Update state file with newly processed files.
+        """Upsert state rows for newly processed files.
+
+        Only the processed files are written; the rest of the store is untouched.
+        Hashes normally come from the fingerprint cache filled during extraction.
 
         Args:
             processed_files: List of files that were processed
@@ -637,22 +961,27 @@ class IncrementalProcessor:
                 "output_dir": str(self.output_dir),
                 "files": {},
             }
+            # Later detect_changes calls (e.g. watch mode) must see the new state.
+            self.change_detector.state = self._state
 
         # Update timestamp
         now = datetime.now().isoformat()
-        self._state["processed_at"] = now
+        meta = {key: value for key, value in self._state.items() if key != "files"}
+        meta["processed_at"] = now
 
         # Update config hash
         if self.config_hash:
-            self._state["config_hash"] = self.config_hash
+            meta["config_hash"] = self.config_hash
+        self._state.update(meta)
 
         # Update file records
         files_dict = self._state.setdefault("files", {})
+        updated: dict[str, dict[str, Any]] = {}
 
         for file_path in processed_files:
             try:
+                stat = file_path.stat()
                 file_hash = self.hasher.compute_hash(file_path)
-                file_size = file_path.stat().st_size
 
                 try:
                     relative = file_path.relative_to(self.source_dir)
@@ -660,15 +989,25 @@ class IncrementalProcessor:
                     relative = Path(file_path.name)
                 output_path = self.output_dir / relative.with_suffix(f".{self.output_format}")
 
-                files_dict[str(file_path)] = {
+                entry: dict[str, Any] = {
                     "hash": file_hash,
                     "processed_at": now,
                     "output_path": str(output_path),
-                    "size_bytes": file_size,
+                    "size_bytes": stat.st_size,
                 }
+                # Only trust stat identity once the mtime is outside the window in
+                # which a same-size rewrite could leave it unchanged.
+                if time.time_ns() - stat.st_mtime_ns >= FingerprintService.RACY_WINDOW_NS:
+                    entry["mtime_ns"] = stat.st_mtime_ns
+                    entry["inode"] = stat.st_ino
+                updated[str(file_path)] = entry
             except (FileNotFoundError, PermissionError, OSError):
                 # Skip files that can't be hashed
                 continue
 
-        # Save state
-        self.state_file.save(self._state)
+        files_dict.update(updated)
+
+        # Persist only the changed rows
+        run_id = self.state_file.begin_run(self.config_hash)
+        self.state_file.upsert_files(updated, run_id=run_id, meta=meta)
+        self.last_run_id = run_id
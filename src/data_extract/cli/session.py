@@ -6,6 +6,10 @@ Provides session state persistence for:
 - Failed file tracking with retry support
 - Session cleanup and archival
 
+Per-file outcomes are appended to a journal (``session-<id>.journal``, one JSON
+record per line) rather than rewriting the snapshot each time; the journal is
+replayed on load and folded into the snapshot on every save.
+
 Reference: docs/tech-spec-epic-5.md
 """
 
@@ -15,6 +19,8 @@ import json
 import os
 import shutil
 import tempfile
+import threading
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
@@ -223,10 +229,16 @@ class SessionManager:
 
     Attributes:
         SESSION_DIR: Name of session directory (.data-extract-session)
+        JOURNAL_GROUP_COMMIT_RECORDS: Journal records written per fsync
+        JOURNAL_GROUP_COMMIT_SECONDS: Longest time an appended record waits for fsync
+        JOURNAL_COMPACT_RECORDS: Journal length that triggers a snapshot rewrite
         archive_retention_days: Days to retain archived sessions (default: 7)
     """
 
     SESSION_DIR = ".data-extract-session"
+    JOURNAL_GROUP_COMMIT_RECORDS = 32
+    JOURNAL_GROUP_COMMIT_SECONDS = 0.5
+    JOURNAL_COMPACT_RECORDS = 2000
 
     def __init__(
         self,
@@ -248,6 +260,12 @@ class SessionManager:
         self.archive_retention_days = 7
         self._current_session: Optional[SessionState] = None
         self._dry_run = False
+        self._journal_lock = threading.RLock()
+        self._journal_fd: Optional[int] = None
+        self._journal_seq = 0
+        self._journal_records = 0
+        self._journal_unsynced = 0
+        self._journal_last_sync = time.monotonic()
 
     @property
     def session_id(self) -> Optional[str]:
@@ -293,6 +311,8 @@ class SessionManager:
         # Create session directory
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        self._close_journal(reset=True)
+
         # Create session state
         self._current_session = SessionState(
             source_directory=source_dir,
@@ -323,6 +343,8 @@ class SessionManager:
         # Create session directory
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        self._close_journal(reset=True)
+
         # Create session state
         self._current_session = SessionState(
             source_directory=source_directory,
@@ -346,11 +368,24 @@ class SessionManager:
         2. Rename to final location
         3. Cleanup temp file on success
 
-        This ensures the session file is never in a partial state.
+        This ensures the session file is never in a partial state. The snapshot
+        records the last journal sequence number it contains, so the journal can
+        then be discarded; a crash in between only leaves records that replay skips.
         """
         if self._dry_run or self._current_session is None:
             return
 
+        with self._journal_lock:
+            self._write_snapshot()
+            # Every journaled record is now part of the snapshot.
+            self._close_journal()
+            self._journal_path(self._current_session.session_id).unlink(missing_ok=True)
+            self._journal_records = 0
+
+    def _write_snapshot(self) -> None:
+        """Atomically write the full session snapshot (caller holds the journal lock)."""
+        assert self._current_session is not None
+
         # Ensure directory exists
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -359,6 +394,7 @@ class SessionManager:
 
         # Get JSON content
         state_dict = self._current_session.model_dump_json_compatible()
+        state_dict["journal_seq"] = self._journal_seq
         json_content = json.dumps(state_dict, indent=2)
 
         # Target file path
@@ -394,6 +430,127 @@ class SessionManager:
                 Path(temp_path).unlink()
             raise
 
+    def flush_journal(self) -> None:
+        """Force every appended journal record to durable storage."""
+        with self._journal_lock:
+            if self._journal_fd is not None and self._journal_unsynced:
+                os.fsync(self._journal_fd)
+            self._journal_unsynced = 0
+            self._journal_last_sync = time.monotonic()
+
+    def _journal_path(self, session_id: str) -> Path:
+        return self.session_dir / f"session-{session_id}.journal"
+
+    def _append_journal(self, record: dict[str, Any]) -> None:
+        """Append one outcome record to the journal.
+
+        The write reaches the OS immediately, so a crashed process loses nothing;
+        fsync is group-committed every ``JOURNAL_GROUP_COMMIT_RECORDS`` records or
+        ``JOURNAL_GROUP_COMMIT_SECONDS``, and the journal is compacted into the
+        snapshot once it reaches ``JOURNAL_COMPACT_RECORDS`` records.
+        """
+        if self._dry_run or self._current_session is None:
+            return
+
+        with self._journal_lock:
+            journal_fd = self._ensure_journal()
+            self._journal_seq += 1
+            line = json.dumps({"seq": self._journal_seq, **record}, ensure_ascii=False)
+            os.write(journal_fd, (line + "\n").encode("utf-8"))
+            self._journal_records += 1
+            self._journal_unsynced += 1
+
+            if self._journal_records >= self.JOURNAL_COMPACT_RECORDS:
+                self.save_session()
+            elif (
+                self._journal_unsynced >= self.JOURNAL_GROUP_COMMIT_RECORDS
+                or time.monotonic() - self._journal_last_sync >= self.JOURNAL_GROUP_COMMIT_SECONDS
+            ):
+                self.flush_journal()
+
+    def _ensure_journal(self) -> int:
+        """Open the current session's journal, writing a base snapshot if none exists."""
+        assert self._current_session is not None
+        with self._journal_lock:
+            if self._journal_fd is None:
+                session_id = self._current_session.session_id
+                if not (self.session_dir / f"session-{session_id}.json").exists():
+                    # Journal records are replayed on top of a snapshot, so write one first.
+                    self._write_snapshot()
+                self._journal_fd = self._open_journal(self._journal_path(session_id))
+            return self._journal_fd
+
+    @staticmethod
+    def _open_journal(journal_file: Path) -> int:
+        fd = os.open(str(journal_file), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        # Terminate a record torn by a crash so the next one starts on its own line.
+        size = os.fstat(fd).st_size
+        if size:
+            with journal_file.open("rb") as handle:
+                handle.seek(size - 1)
+                if handle.read(1) != b"\n":
+                    os.write(fd, b"\n")
+        return fd
+
+    def _close_journal(self, reset: bool = False) -> None:
+        with self._journal_lock:
+            if self._journal_fd is not None:
+                if self._journal_unsynced:
+                    os.fsync(self._journal_fd)
+                os.close(self._journal_fd)
+                self._journal_fd = None
+            self._journal_unsynced = 0
+            self._journal_last_sync = time.monotonic()
+            if reset:
+                self._journal_seq = 0
+                self._journal_records = 0
+
+    def _replay_journal(self, state: SessionState, snapshot_seq: int) -> tuple[int, int]:
+        """Apply journal records newer than the snapshot to ``state``.
+
+        Returns:
+            Tuple of (last sequence number seen, number of records applied)
+        """
+        journal_file = self._journal_path(state.session_id)
+        last_seq, applied = snapshot_seq, 0
+        try:
+            lines = journal_file.read_bytes().splitlines()
+        except OSError:
+            return last_seq, applied
+
+        for raw_line in lines:
+            try:
+                record = json.loads(raw_line)
+                seq = int(record["seq"])
+            except (ValueError, TypeError, KeyError):
+                # A record torn by a crash mid-append; later records are still valid.
+                continue
+            if seq <= snapshot_seq:
+                continue
+            self._apply_record(state, record)
+            last_seq = max(last_seq, seq)
+            applied += 1
+        return last_seq, applied
+
+    @staticmethod
+    def _apply_record(state: SessionState, record: dict[str, Any]) -> None:
+        """Apply one journal record to in-memory session state."""
+        op = record.get("op")
+        if op == "processed":
+            state.processed_files.append(record["entry"])
+            state.statistics.processed_count += 1
+        elif op == "failed":
+            state.failed_files.append(record["entry"])
+            state.statistics.failed_count += 1
+        elif op == "retry":
+            for failed_file in state.failed_files:
+                if failed_file["path"] == record["path"]:
+                    failed_file["retry_count"] = failed_file.get("retry_count", 0) + 1
+                    break
+        timestamp = record.get("timestamp")
+        if timestamp:
+            state.updated_at = datetime.fromisoformat(timestamp)
+
     def get_session_state(self) -> dict[str, Any]:
         """Get current session state as dictionary.
 
@@ -522,6 +679,16 @@ class SessionManager:
                     skipped_count=skipped_count,
                 ),
             )
+            snapshot_seq = self._parse_non_negative_int(
+                state_dict.get("journal_seq", 0),
+                field_name="journal_seq",
+                session_file=session_file,
+            )
+
+            self._close_journal(reset=True)
+            self._journal_seq, self._journal_records = self._replay_journal(
+                self._current_session, snapshot_seq
+            )
 
             return self._current_session
 
@@ -632,7 +799,7 @@ class SessionManager:
         file_hash: str,
         source_key: Optional[str] = None,
     ) -> None:
-        """Record a successfully processed file.
+        """Record a successfully processed file (an O(1) journal append).
 
         Args:
             file_path: Path to processed file
@@ -642,17 +809,18 @@ class SessionManager:
         if self._current_session is None:
             return
 
-        self._current_session.processed_files.append(
+        self._record(
             {
-                "path": str(file_path.name if isinstance(file_path, Path) else file_path),
-                "source_path": str(file_path if isinstance(file_path, Path) else file_path),
-                "source_key": source_key,
-                "hash": file_hash,
-                "output": str(output_path),
+                "op": "processed",
+                "entry": {
+                    "path": str(file_path.name if isinstance(file_path, Path) else file_path),
+                    "source_path": str(file_path if isinstance(file_path, Path) else file_path),
+                    "source_key": source_key,
+                    "hash": file_hash,
+                    "output": str(output_path),
+                },
             }
         )
-        self._current_session.statistics.processed_count += 1
-        self._current_session.updated_at = datetime.now()
 
     def record_failed_file(
         self,
@@ -665,7 +833,7 @@ class SessionManager:
         retry_count: int = 0,
         source_key: Optional[str] = None,
     ) -> None:
-        """Record a failed file.
+        """Record a failed file (an O(1) journal append).
 
         Args:
             file_path: Path to failed file
@@ -698,9 +866,7 @@ class SessionManager:
         if self.debug and stack_trace:
             failed_info["stack_trace"] = stack_trace
 
-        self._current_session.failed_files.append(failed_info)
-        self._current_session.statistics.failed_count += 1
-        self._current_session.updated_at = datetime.now()
+        self._record({"op": "failed", "entry": failed_info})
 
     def increment_retry_count(self, file_path: Path) -> None:
         """Increment retry count for a failed file.
@@ -711,11 +877,18 @@ class SessionManager:
         if self._current_session is None:
             return
 
-        file_path_str = str(file_path)
-        for failed_file in self._current_session.failed_files:
-            if failed_file["path"] == file_path_str:
-                failed_file["retry_count"] = failed_file.get("retry_count", 0) + 1
-                break
+        self._record({"op": "retry", "path": str(file_path)})
+
+    def _record(self, record: dict[str, Any]) -> None:
+        """Apply an outcome record to the current session and journal it."""
+        assert self._current_session is not None
+        record["timestamp"] = datetime.now().isoformat()
+        with self._journal_lock:
+            if not self._dry_run:
+                # The base snapshot must not already contain this record.
+                self._ensure_journal()
+            self._apply_record(self._current_session, record)
+            self._append_journal(record)
 
     def can_retry(self, file_path: Path) -> bool:
         """Check if a file can be retried.
@@ -819,20 +992,20 @@ class SessionManager:
                 if session_source == normalized_source:
                     # Check if in_progress
                     if state_dict.get("status") in ("in_progress", "interrupted"):
-                        sessions.append(
-                            SessionState(
-                                session_id=state_dict["session_id"],
-                                status=state_dict["status"],
-                                source_directory=Path(state_dict["source_directory"]),
-                                updated_at=datetime.fromisoformat(state_dict["updated_at"]),
-                                started_at=datetime.fromisoformat(state_dict["started_at"]),
-                                processed_files=state_dict.get("processed_files", []),
-                                failed_files=state_dict.get("failed_files", []),
-                                configuration=state_dict.get("configuration", {}),
-                                statistics=SessionStatistics(**state_dict.get("statistics", {})),
-                            )
+                        session = SessionState(
+                            session_id=state_dict["session_id"],
+                            status=state_dict["status"],
+                            source_directory=Path(state_dict["source_directory"]),
+                            updated_at=datetime.fromisoformat(state_dict["updated_at"]),
+                            started_at=datetime.fromisoformat(state_dict["started_at"]),
+                            processed_files=state_dict.get("processed_files", []),
+                            failed_files=state_dict.get("failed_files", []),
+                            configuration=state_dict.get("configuration", {}),
+                            statistics=SessionStatistics(**state_dict.get("statistics", {})),
                         )
-            except (json.JSONDecodeError, KeyError, ValueError):
+                        self._replay_journal(session, int(state_dict.get("journal_seq", 0)))
+                        sessions.append(session)
+            except (json.JSONDecodeError, KeyError, ValueError, TypeError):
                 # Skip corrupted files
                 continue
 
@@ -940,7 +1113,11 @@ class SessionManager:
                 continue
 
             try:
-                if session_file.stat().st_mtime < cutoff:
+                journal_file = session_file.with_suffix(".journal")
+                last_write = session_file.stat().st_mtime
+                if journal_file.exists():
+                    last_write = max(last_write, journal_file.stat().st_mtime)
+                if last_write < cutoff:
                     state_dict = json.loads(session_file.read_text())
                     if state_dict.get("status") == "in_progress":
                         orphaned.append(
@@ -1004,11 +1181,10 @@ class SessionManager:
 
         session_file = self.session_dir / f"session-{session_id}.json"
 
-        if not session_file.exists():
-            return CleanupResult(success=True)
-
         try:
-            session_file.unlink()
+            self._journal_path(session_id).unlink(missing_ok=True)
+            if session_file.exists():
+                session_file.unlink()
             return CleanupResult(success=True)
         except OSError as e:
             return CleanupResult(success=False, error=str(e))
@@ -0,0 +1,410 @@
+"""Watch mode: continuous incremental processing of a source tree.
+
+Provides a long-running loop on top of ``IncrementalProcessor`` with:
+- Linux inotify change notification (via ctypes, no extra dependency)
+- A scandir polling fallback comparing size/mtime_ns/inode snapshots
+- Debouncing so bursts of writes become one processing batch
+- One warm ``PipelineService`` (normalizer and spaCy model) for the whole session
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import structlog
+
+from data_extract.cli.batch import IncrementalProcessor, ProcessingResult
+from data_extract.services.file_discovery_service import DirectoryWalker, is_supported_name
+
+logger = structlog.get_logger(__name__)
+
+WATCH_BACKEND_ENV = "DATA_EXTRACT_WATCH_BACKEND"
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+
+# ==============================================================================
+# Change Sources
+# ==============================================================================
+
+
+class PollingWatcher:
+    """Detect new and modified files by diffing periodic directory snapshots.
+
+    Each scan lists the tree with ``DirectoryWalker`` and records
+    ``(size, mtime_ns, inode)`` per supported file; a file is reported when it
+    appears or any of those fields change. Deletions are not reported.
+    """
+
+    backend = "poll"
+
+    def __init__(
+        self,
+        root: Path,
+        exclude_paths: Iterable[Path] | None = None,
+        interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the watcher and take the baseline snapshot.
+
+        Args:
+            root: Directory to watch (recursively)
+            exclude_paths: Directories to prune, such as the output directory
+            interval: Minimum seconds between scans
+        """
+        self.root = root.resolve()
+        self.interval = interval
+        self._walker = DirectoryWalker(
+            exclude_paths=list(exclude_paths or []), file_filter=is_supported_name
+        )
+        self._snapshot = self._scan()
+        self._last_scan = time.monotonic()
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Wait up to ``timeout`` seconds and return files changed since the last scan."""
+        remaining = self.interval - (time.monotonic() - self._last_scan)
+        if remaining > 0:
+            time.sleep(min(timeout, remaining))
+            if timeout < remaining:
+                return set()
+
+        snapshot = self._scan()
+        self._last_scan = time.monotonic()
+        changed = {
+            Path(path)
+            for path, identity in snapshot.items()
+            if self._snapshot.get(path) != identity
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """Release resources (nothing to release for polling)."""
+
+    def _scan(self) -> dict[str, tuple[int, int, int]]:
+        snapshot: dict[str, tuple[int, int, int]] = {}
+        for file_path in self._walker.walk(self.root):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[str(file_path)] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        return snapshot
+
+
+class InotifyWatcher:
+    """Receive file change events from the Linux kernel via inotify.
+
+    One watch is registered per directory. Files are reported when they are
+    closed after writing or moved into the tree; new directories are watched
+    and their existing contents reported. If the kernel event queue overflows
+    the whole tree is reported so nothing is missed.
+
+    Raises:
+        OSError: If inotify is unavailable (non-Linux) or the watch limit is hit
+    """
+
+    backend = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0x00000800
+    IN_CLOEXEC = 0x00080000
+
+    WATCH_MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+    _EVENT = struct.Struct("iIII")
+    _READ_SIZE = 64 * 1024
+
+    def __init__(self, root: Path, exclude_paths: Iterable[Path] | None = None) -> None:
+        """Initialize inotify and watch every directory under ``root``.
+
+        Args:
+            root: Directory to watch (recursively)
+            exclude_paths: Directories to prune, such as the output directory
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self.root = root.resolve()
+        self._exclude_paths = list(exclude_paths or [])
+        self._excluded = {str(path.resolve()) for path in self._exclude_paths}
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._watches: dict[int, str] = {}
+        try:
+            self._add_tree(str(self.root))
+        except OSError:
+            self.close()
+            raise
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Wait up to ``timeout`` seconds and return files changed since the last poll."""
+        changed: set[Path] = set()
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        if not readable:
+            return changed
+
+        while True:
+            try:
+                data = os.read(self._fd, self._READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            self._handle_events(data, changed)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor (removing all watches)."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+
+    def _handle_events(self, data: bytes, changed: set[Path]) -> None:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                logger.warning("watch_event_queue_overflow", root=str(self.root))
+                changed.update(self._files_under(str(self.root)))
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and path not in self._excluded:
+                    # Files may land in a new directory before its watch exists.
+                    self._add_tree(path)
+                    changed.update(self._files_under(path))
+                continue
+            if is_supported_name(name) and path not in self._excluded:
+                changed.add(Path(path))
+
+    def _add_tree(self, root: str) -> None:
+        for directory, subdirs, _files in os.walk(root):
+            subdirs[:] = [
+                subdir
+                for subdir in subdirs
+                if os.path.join(directory, subdir) not in self._excluded
+            ]
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), self.WATCH_MASK | self.IN_ONLYDIR
+            )
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error in (errno.ENOENT, errno.ENOTDIR):
+                    continue
+                raise OSError(error, f"inotify_add_watch failed: {os.strerror(error)}")
+            self._watches[wd] = directory
+
+    def _files_under(self, directory: str) -> set[Path]:
+        walker = DirectoryWalker(exclude_paths=self._exclude_paths, file_filter=is_supported_name)
+        return set(walker.walk(Path(directory)))
+
+
+def resolve_watch_backend() -> str:
+    """Resolve the change source from ``DATA_EXTRACT_WATCH_BACKEND`` (default ``auto``)."""
+    backend = os.environ.get(WATCH_BACKEND_ENV, "").strip().lower() or "auto"
+    return backend if backend in WATCH_BACKENDS else "auto"
+
+
+def create_watcher(
+    root: Path,
+    exclude_paths: Iterable[Path] | None = None,
+    backend: str | None = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+) -> InotifyWatcher | PollingWatcher:
+    """Create a change source for ``root``.
+
+    ``auto`` uses inotify where available and falls back to polling otherwise
+    (non-Linux, or the inotify watch limit is exhausted).
+
+    Raises:
+        ValueError: If ``backend`` is not one of auto, inotify, poll
+        OSError: If ``inotify`` is requested explicitly but unavailable
+    """
+    selected = (backend or resolve_watch_backend()).lower()
+    if selected not in WATCH_BACKENDS:
+        raise ValueError(
+            f"Invalid watch backend '{backend}'. Use one of: {', '.join(WATCH_BACKENDS)}"
+        )
+    excludes = list(exclude_paths or [])
+    if selected in {"auto", "inotify"}:
+        try:
+            return InotifyWatcher(root, exclude_paths=excludes)
+        except (OSError, AttributeError) as exc:
+            if selected == "inotify":
+                raise OSError(f"inotify unavailable: {exc}") from exc
+            logger.info("watch_inotify_unavailable", error=str(exc))
+    return PollingWatcher(root, exclude_paths=excludes, interval=poll_interval)
+
+
+# ==============================================================================
+# Debouncing and Processing Loop
+# ==============================================================================
+
+
+class Debouncer:
+    """Coalesce bursts of change events into one batch.
+
+    A batch is ready once no event has arrived for ``quiet_seconds``, or
+    ``max_delay_seconds`` after its first event so a tree that is written to
+    continuously still makes progress.
+    """
+
+    def __init__(
+        self,
+        quiet_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+    ) -> None:
+        self.quiet_seconds = quiet_seconds
+        self.max_delay_seconds = max(max_delay_seconds, quiet_seconds)
+        self._pending: set[Path] = set()
+        self._first_event: Optional[float] = None
+        self._last_event: Optional[float] = None
+
+    def add(self, paths: Iterable[Path], now: float) -> None:
+        """Record changed paths observed at ``now``."""
+        paths = set(paths)
+        if not paths:
+            return
+        if self._first_event is None:
+            self._first_event = now
+        self._last_event = now
+        self._pending.update(paths)
+
+    def time_until_ready(self, now: float) -> Optional[float]:
+        """Seconds until the pending batch is ready, or None when nothing is pending."""
+        if self._first_event is None or self._last_event is None:
+            return None
+        deadline = min(
+            self._last_event + self.quiet_seconds,
+            self._first_event + self.max_delay_seconds,
+        )
+        return max(deadline - now, 0.0)
+
+    def ready(self, now: float) -> bool:
+        """Return True when a pending batch should be processed."""
+        return self.time_until_ready(now) == 0.0
+
+    def drain(self) -> list[Path]:
+        """Return and clear the pending paths (sorted)."""
+        batch = sorted(self._pending)
+        self._pending.clear()
+        self._first_event = None
+        self._last_event = None
+        return batch
+
+
+class WatchLoop:
+    """Feed debounced change batches from a watcher into an ``IncrementalProcessor``.
+
+    The processor (and its ``PipelineService``) lives for the whole loop, so
+    models are loaded once and each batch only pays for the files it contains.
+    Change detection still goes through the incremental state, so touched but
+    unchanged files are skipped.
+    """
+
+    IDLE_POLL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        processor: IncrementalProcessor,
+        watcher: InotifyWatcher | PollingWatcher,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        on_batch: Optional[Callable[[list[Path], ProcessingResult], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the loop.
+
+        Args:
+            processor: Incremental processor for the watched source directory
+            watcher: Change source (see ``create_watcher``)
+            debounce_seconds: Quiet period before a batch is processed
+            max_delay_seconds: Upper bound on how long a batch is held back
+            on_batch: Called with (files, result) after each processed batch
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.processor = processor
+        self.watcher = watcher
+        self.debouncer = Debouncer(debounce_seconds, max_delay_seconds)
+        self.on_batch = on_batch
+        self.clock = clock
+        self.batches = 0
+
+    def warm_up(self) -> None:
+        """Load pipeline models before the first change arrives."""
+        self.processor.pipeline.warm_up()
+
+    def catch_up(self) -> ProcessingResult:
+        """Process everything that changed while nothing was watching."""
+        return self.processor.process()
+
+    def run_once(self, timeout: float = IDLE_POLL_SECONDS) -> Optional[ProcessingResult]:
+        """Wait for changes for up to ``timeout`` seconds and process a ready batch.
+
+        Returns:
+            The batch result, or None if no batch was ready
+        """
+        wait = self.debouncer.time_until_ready(self.clock())
+        changed = self.watcher.poll(timeout if wait is None else min(timeout, wait))
+        self.debouncer.add(changed, self.clock())
+        if not self.debouncer.ready(self.clock()):
+            return None
+
+        files = [path for path in self.debouncer.drain() if path.is_file()]
+        if not files:
+            return None
+        result = self.processor.process(files=files)
+        self.batches += 1
+        if self.on_batch is not None:
+            self.on_batch(files, result)
+        return result
+
+    def run(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        max_batches: Optional[int] = None,
+    ) -> None:
+        """Process batches until ``stop_event`` is set or ``max_batches`` ran."""
+        stop_event = stop_event or threading.Event()
+        try:
+            while not stop_event.is_set():
+                if max_batches is not None and self.batches >= max_batches:
+                    break
+                self.run_once()
+        finally:
+            self.watcher.close()
@@ -1,7 +1,9 @@
 """Shared contract models for CLI, API, and UI."""
 
 from .models import (
+    MAX_PIPELINE_WORKERS,
     EvaluationVerdict,
+    ExecutorMode,
     FileFailure,
     GovernanceCheckResult,
     GovernanceEvaluationOutcome,
@@ -19,7 +21,9 @@ from .models import (
 
 __all__ = [
     "EvaluationVerdict",
+    "ExecutorMode",
     "JobStatus",
+    "MAX_PIPELINE_WORKERS",
     "ProcessJobRequest",
     "ProcessJobResult",
     "ProcessedFileOutcome",
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+ExecutorMode = Literal["thread", "process", "staged"]
+# Upper bound on pipeline workers a single request may ask for.
+MAX_PIPELINE_WORKERS = 64
+
 
 class JobStatus(str, Enum):
     """Processing job lifecycle state."""
@@ -133,6 +137,7 @@ class ProcessJobRequest(BaseModel):
     delimiter: str = "━━━ CHUNK {{n}} ━━━"
     recursive: bool = False
     incremental: bool = False
+    paranoid: bool = False
     force: bool = False
     resume: bool = False
     resume_session: Optional[str] = None
@@ -152,6 +157,9 @@ class ProcessJobRequest(BaseModel):
     semantic_n_components: Optional[int] = None
     semantic_min_quality: Optional[float] = None
     pipeline_profile: Optional[str] = None
+    workers: Optional[int] = Field(default=None, ge=1, le=MAX_PIPELINE_WORKERS)
+    executor: Optional[ExecutorMode] = None
+    segmentation_backend: Optional[str] = None
     continue_on_error: bool = True
     source_files: List[str] = Field(default_factory=list)
     idempotency_key: Optional[str] = None
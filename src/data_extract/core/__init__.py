@@ -8,9 +8,11 @@ Exports:
 - Chunk: Semantic chunk for RAG
 - ProcessingContext: Shared pipeline state
 - PipelineStage: Pipeline stage protocol (when implemented)
+- StagedPipeline / StageSpec: Streaming stage scheduler with bounded queues
 """
 
 from .models import Chunk, Document, Entity, EntityType, Metadata, ProcessingContext
+from .pipeline import StagedPipeline, StageSpec
 
 __all__ = [
     "EntityType",
@@ -19,4 +21,6 @@ __all__ = [
     "Document",
     "Chunk",
     "ProcessingContext",
+    "StagedPipeline",
+    "StageSpec",
 ]
@@ -3,12 +3,18 @@
 This module defines the protocol-based pipeline architecture:
 - PipelineStage: Protocol defining contract for all pipeline stages
 - Pipeline: Orchestrator class that chains multiple stages together
+- StagedPipeline: Streaming scheduler running each stage in its own worker pool
+  with bounded queues between stages
 
 All pipeline stages implement the PipelineStage protocol with Generic[Input, Output]
 type parameters for compile-time type safety.
 """
 
-from typing import Any, Generic, List, Protocol, TypeVar
+import threading
+import time
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from typing import Any, Dict, Generator, Generic, Iterable, List, Optional, Protocol, TypeVar
 
 from data_extract.core.models import ProcessingContext
 
@@ -127,3 +133,298 @@ class Pipeline:
             current_data = stage.process(current_data, context)
 
         return current_data
+
+
+@dataclass
+class StageSpec:
+    """Scheduling settings for one stage of a StagedPipeline.
+
+    Attributes:
+        name: Stage name used for metrics and failure reporting
+        stage: PipelineStage implementation (shared by all of the stage's workers)
+        workers: Number of worker threads pulling from the stage's input queue
+        queue_size: Capacity of the bounded queue feeding this stage
+    """
+
+    name: str
+    stage: PipelineStage[Any, Any]
+    workers: int = 1
+    queue_size: int = 4
+
+
+@dataclass
+class StageMetrics:
+    """Latency and queue-depth counters for one stage of a StagedPipeline."""
+
+    name: str
+    processed: int = 0
+    failed: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Mean latency of completed (successful or failed) stage calls."""
+        completed = self.processed + self.failed
+        return self.total_latency_ms / completed if completed else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Serialize counters for reporting."""
+        return {
+            "processed": float(self.processed),
+            "failed": float(self.failed),
+            "total_latency_ms": self.total_latency_ms,
+            "avg_latency_ms": self.avg_latency_ms,
+            "max_latency_ms": self.max_latency_ms,
+            "max_queue_depth": float(self.max_queue_depth),
+        }
+
+
+@dataclass
+class StagedItem:
+    """Envelope carried between stages of a StagedPipeline.
+
+    Attributes:
+        index: Position of the item in the input iterable
+        payload: Current stage input/output value
+        error: Exception raised by the failing stage, if any
+        failed_stage: Name of the stage that raised ``error``
+    """
+
+    index: int
+    payload: Any
+    error: Optional[BaseException] = None
+    failed_stage: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True when every stage completed for this item."""
+        return self.error is None
+
+
+_END = object()
+
+
+@dataclass
+class _StageRuntime:
+    spec: StageSpec
+    inbox: "Queue[Any]"
+    metrics: StageMetrics
+    alive_workers: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class StagedPipeline:
+    """Streaming scheduler that overlaps pipeline stages across items.
+
+    Each stage gets its own worker pool and a bounded input queue. While one item
+    is in stage 1, another can be in stage 2 and a third in stage 3. Producers
+    block when the downstream queue is full, so the number of in-flight items
+    (and therefore memory) is capped at ``sum(queue_size + workers)`` over all
+    stages plus the output queue.
+
+    Items that raise in a stage are not retried; their envelope carries the
+    exception past the remaining stages and is yielded like any other result.
+    Results are yielded in completion order, not input order.
+
+    Example:
+        >>> staged = StagedPipeline([
+        ...     StageSpec("extract", ExtractStage(), workers=4),
+        ...     StageSpec("chunk", ChunkStage(), workers=1),
+        ... ])
+        >>> for item in staged.run(paths, ProcessingContext()):
+        ...     handle(item.payload if item.ok else item.error)
+        >>> staged.metrics["extract"].max_queue_depth
+        4
+    """
+
+    def __init__(self, stages: List[StageSpec], output_queue_size: int = 4) -> None:
+        """Initialize scheduler with ordered stage specifications.
+
+        Args:
+            stages: Stage specs executed in order; each stage's output type must match
+                the next stage's input type.
+            output_queue_size: Capacity of the queue holding finished items until the
+                consumer reads them.
+        """
+        if not stages:
+            raise ValueError("StagedPipeline requires at least one stage")
+        self.stages = stages
+        self.output_queue_size = max(1, int(output_queue_size))
+        self._metrics: Dict[str, StageMetrics] = {
+            spec.name: StageMetrics(name=spec.name) for spec in stages
+        }
+
+    @property
+    def metrics(self) -> Dict[str, StageMetrics]:
+        """Per-stage counters from the most recent run."""
+        return self._metrics
+
+    def run(
+        self, inputs: Iterable[Any], context: ProcessingContext
+    ) -> Generator[StagedItem, None, None]:
+        """Stream inputs through all stages and yield finished envelopes.
+
+        Closing the returned generator early stops feeding new inputs and shuts
+        the worker threads down; items already in flight are discarded.
+
+        Args:
+            inputs: Items for the first stage (consumed lazily)
+            context: Shared processing context passed to every stage call
+
+        Yields:
+            StagedItem envelopes in completion order
+        """
+        stop = threading.Event()
+        self._metrics = {spec.name: StageMetrics(name=spec.name) for spec in self.stages}
+        runtimes = [
+            _StageRuntime(
+                spec=spec,
+                inbox=Queue(maxsize=max(1, int(spec.queue_size))),
+                metrics=self._metrics[spec.name],
+                alive_workers=max(1, int(spec.workers)),
+            )
+            for spec in self.stages
+        ]
+        outbox: "Queue[Any]" = Queue(maxsize=self.output_queue_size)
+        feed_errors: List[BaseException] = []
+        threads: List[threading.Thread] = []
+
+        for position, runtime in enumerate(runtimes):
+            downstream = runtimes[position + 1] if position + 1 < len(runtimes) else None
+            for worker_index in range(runtime.alive_workers):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    args=(runtime, downstream, outbox, context, stop),
+                    name=f"data-extract-stage-{runtime.spec.name}-{worker_index + 1}",
+                    daemon=True,
+                )
+                threads.append(thread)
+                thread.start()
+
+        feeder = threading.Thread(
+            target=self._feed,
+            args=(inputs, runtimes[0], stop, feed_errors),
+            name="data-extract-stage-feeder",
+            daemon=True,
+        )
+        threads.append(feeder)
+        feeder.start()
+
+        try:
+            while True:
+                try:
+                    item = outbox.get(timeout=0.1)
+                except Empty:
+                    if stop.is_set():
+                        return
+                    continue
+                if item is _END:
+                    if feed_errors:
+                        raise feed_errors[0]
+                    return
+                yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=2)
+
+    def _feed(
+        self,
+        inputs: Iterable[Any],
+        first: _StageRuntime,
+        stop: threading.Event,
+        errors: List[BaseException],
+    ) -> None:
+        try:
+            for index, payload in enumerate(inputs):
+                if not self._put(first, StagedItem(index=index, payload=payload), stop):
+                    return
+        except Exception as exc:
+            # Surface input iteration failures to the consumer once in-flight items drain.
+            errors.append(exc)
+        finally:
+            for _ in range(first.alive_workers):
+                if not self._put(first, _END, stop):
+                    return
+
+    def _worker_loop(
+        self,
+        runtime: _StageRuntime,
+        downstream: Optional[_StageRuntime],
+        outbox: "Queue[Any]",
+        context: ProcessingContext,
+        stop: threading.Event,
+    ) -> None:
+        while not stop.is_set():
+            try:
+                item = runtime.inbox.get(timeout=0.1)
+            except Empty:
+                continue
+
+            if item is _END:
+                with runtime.lock:
+                    runtime.alive_workers -= 1
+                    last_worker = runtime.alive_workers == 0
+                if last_worker:
+                    # Last worker out propagates shutdown to the next stage.
+                    if downstream is None:
+                        self._put_output(outbox, _END, stop)
+                    else:
+                        for _ in range(downstream.alive_workers):
+                            if not self._put(downstream, _END, stop):
+                                break
+                return
+
+            if item.ok:
+                start = time.perf_counter()
+                try:
+                    item.payload = runtime.spec.stage.process(item.payload, context)
+                    failed = False
+                except Exception as exc:
+                    item.error = exc
+                    item.failed_stage = runtime.spec.name
+                    failed = True
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with runtime.lock:
+                    metrics = runtime.metrics
+                    if failed:
+                        metrics.failed += 1
+                    else:
+                        metrics.processed += 1
+                    metrics.total_latency_ms += elapsed_ms
+                    metrics.max_latency_ms = max(metrics.max_latency_ms, elapsed_ms)
+
+            if downstream is None:
+                if not self._put_output(outbox, item, stop):
+                    return
+            elif not self._put(downstream, item, stop):
+                return
+
+    @staticmethod
+    def _put(runtime: _StageRuntime, item: Any, stop: threading.Event) -> bool:
+        """Blocking put that honours shutdown; returns False when stopped."""
+        while not stop.is_set():
+            try:
+                runtime.inbox.put(item, timeout=0.1)
+            except Full:
+                continue
+            if item is not _END:
+                depth = runtime.inbox.qsize()
+                with runtime.lock:
+                    runtime.metrics.queue_depth = depth
+                    runtime.metrics.max_queue_depth = max(runtime.metrics.max_queue_depth, depth)
+            return True
+        return False
+
+    @staticmethod
+    def _put_output(outbox: "Queue[Any]", item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
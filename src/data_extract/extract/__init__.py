@@ -9,7 +9,7 @@ from data_extract.extract.adapter import ExtractorAdapter
 from data_extract.extract.csv import CsvExtractorAdapter
 from data_extract.extract.docx import DocxExtractorAdapter
 from data_extract.extract.excel import ExcelExtractorAdapter
-from data_extract.extract.pdf import PdfExtractorAdapter
+from data_extract.extract.pdf import PdfExtractorAdapter, PdfPage
 from data_extract.extract.pptx import PptxExtractorAdapter
 from data_extract.extract.txt import TxtExtractorAdapter
 
@@ -51,6 +51,7 @@ def is_supported(file_path: Path) -> bool:
 __all__ = [
     "ExtractorAdapter",
     "PdfExtractorAdapter",
+    "PdfPage",
     "DocxExtractorAdapter",
     "ExcelExtractorAdapter",
     "PptxExtractorAdapter",
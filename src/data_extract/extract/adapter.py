@@ -6,15 +6,15 @@ current greenfield Document model.
 
 from __future__ import annotations
 
-import hashlib
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 from uuid import uuid4
 
 from data_extract import __version__
 from data_extract.core.models import Document, DocumentType, Metadata
+from data_extract.utils.fingerprint import get_fingerprint_service
 
 
 class ExtractorAdapter(ABC):
@@ -108,11 +108,29 @@ class ExtractorAdapter(ABC):
     @staticmethod
     def _compute_file_hash(file_path: Path) -> str:
         """Compute SHA256 hash for provenance and retry change checks."""
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return get_fingerprint_service().fingerprint(file_path)
+
+    @staticmethod
+    def _read_text(file_path: Path) -> str:
+        """Read a text file, fingerprinting it from the same read."""
+        raw = get_fingerprint_service().read_bytes(file_path)
+        # Match Path.read_text(errors="ignore"), including universal newlines.
+        text = raw.decode("utf-8", errors="ignore")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    @staticmethod
+    def _join_blocks(blocks: Sequence[str], separator: str) -> Tuple[str, List[List[int]]]:
+        """Join page/slide/sheet texts, returning each one's [start, end] span in the result.
+
+        The spans are stored as ``structure["text_blocks"]`` so normalization can
+        process blocks in parallel and map results back to document offsets.
+        """
+        spans: List[List[int]] = []
+        position = 0
+        for block in blocks:
+            spans.append([position, position + len(block)])
+            position += len(block) + len(separator)
+        return separator.join(blocks), spans
 
     @staticmethod
     def _generate_document_id(file_path: Path) -> str:
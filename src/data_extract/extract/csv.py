@@ -16,7 +16,7 @@ class CsvExtractorAdapter(ExtractorAdapter):
         super().__init__(format_name="csv")
 
     def extract(self, file_path: Path) -> Tuple[str, Dict[str, Any], Dict[str, float]]:
-        raw = file_path.read_text(encoding="utf-8", errors="ignore")
+        raw = self._read_text(file_path)
         sample = raw[:2048]
         delimiter = ","
         try:
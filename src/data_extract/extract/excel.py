@@ -21,12 +21,12 @@ class ExcelExtractorAdapter(ExtractorAdapter):
             raise RuntimeError("openpyxl is required for Excel extraction") from exc
 
         workbook = load_workbook(filename=str(file_path), data_only=True, read_only=True)
-        sheet_lines = []
+        sheet_texts = []
         row_count = 0
         max_cols = 0
 
         for sheet in workbook.worksheets:
-            sheet_lines.append(f"# Sheet: {sheet.title}")
+            sheet_lines = [f"# Sheet: {sheet.title}"]
             for row in sheet.iter_rows(values_only=True):
                 row_values = ["" if cell is None else str(cell) for cell in row]
                 while row_values and row_values[-1] == "":
@@ -36,12 +36,14 @@ class ExcelExtractorAdapter(ExtractorAdapter):
                 sheet_lines.append(" | ".join(row_values))
                 row_count += 1
                 max_cols = max(max_cols, len(row_values))
+            sheet_texts.append("\n".join(sheet_lines))
 
-        text = "\n".join(sheet_lines)
+        text, text_blocks = self._join_blocks(sheet_texts, "\n")
         structure = {
             "sheet_count": len(workbook.worksheets),
             "row_count": row_count,
             "column_count": max_cols,
+            "text_blocks": text_blocks,
         }
         quality = {
             "extraction_confidence": 1.0,
@@ -0,0 +1,176 @@
+"""Content-addressed on-disk cache for OCR results.
+
+Entries are keyed by a hash of the rasterised page image plus every setting that
+affects Tesseract output (DPI, preprocessing tier, Tesseract version), so a hit is
+valid regardless of which file or run produced the page. Each entry is a small
+JSON file written atomically, which keeps the cache safe to share between the
+page-range worker processes of one run and across runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+OCR_CACHE_DIR_ENV = "DATA_EXTRACT_OCR_CACHE_DIR"
+OCR_CACHE_MAX_MB_ENV = "DATA_EXTRACT_OCR_CACHE_MAX_MB"
+DEFAULT_OCR_CACHE_DIR = Path(".data-extract-cache/ocr/")
+DEFAULT_OCR_CACHE_MAX_MB = 256
+CACHE_FORMAT_VERSION = "ocr_v1"
+
+
+class OcrCache:
+    """Size-bounded LRU cache of ``(text, confidence)`` per rasterised page.
+
+    Recency is tracked with file modification times (refreshed on every hit), so
+    eviction order survives restarts without a separate index file.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_bytes: Size bound; least recently used entries are evicted beyond it
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_size: Optional[int] = None
+
+    @staticmethod
+    def image_digest(image: Any) -> str:
+        """Hash the pixel content of a rasterised page."""
+        hasher = hashlib.sha256()
+        tobytes = getattr(image, "tobytes", None)
+        if callable(tobytes):
+            hasher.update(f"{getattr(image, 'mode', '')}|{getattr(image, 'size', '')}|".encode())
+            hasher.update(tobytes())
+        else:
+            hasher.update(repr(image).encode("utf-8"))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def make_key(image_digest: str, dpi: int, tier: str, tesseract_version: str) -> str:
+        """Build the cache key for one OCR tier of one page image."""
+        hasher = hashlib.sha256()
+        for component in (CACHE_FORMAT_VERSION, image_digest, dpi, tier, tesseract_version):
+            hasher.update(f"{component}\0".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Return cached ``(text, confidence)`` or ``None`` on a miss."""
+        entry_path = self._entry_path(key)
+        try:
+            payload = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        confidence = payload.get("confidence")
+        return str(payload.get("text", "")), float(confidence) if confidence is not None else None
+
+    def put(self, key: str, text: str, confidence: Optional[float]) -> None:
+        """Store an OCR result, evicting old entries when over the size bound."""
+        entry_path = self._entry_path(key)
+        payload = json.dumps({"text": text, "confidence": confidence}, ensure_ascii=False)
+        tmp_path = entry_path.with_name(
+            f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._approx_size is None:
+                self._approx_size = self._scan_size()
+            else:
+                self._approx_size += len(payload.encode("utf-8"))
+            if self._approx_size > self.max_bytes:
+                self._approx_size = self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count and total size on disk."""
+        entries = self._entries()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "num_entries": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[Tuple[Path, int, float]]:
+        entries: list[Tuple[Path, int, float]] = []
+        if not self.cache_dir.is_dir():
+            return entries
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> int:
+        """Remove least recently used entries down to 90% of the bound."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        return total
+
+
+_cache_lock = threading.Lock()
+_caches: Dict[Tuple[str, int], OcrCache] = {}
+
+
+def get_ocr_cache() -> Optional[OcrCache]:
+    """Return the process-wide OCR cache configured from the environment.
+
+    ``DATA_EXTRACT_OCR_CACHE_DIR`` selects the directory and
+    ``DATA_EXTRACT_OCR_CACHE_MAX_MB`` the size bound; ``0`` disables caching.
+    """
+    raw_max = os.environ.get(OCR_CACHE_MAX_MB_ENV, "").strip()
+    try:
+        max_mb = int(raw_max) if raw_max else DEFAULT_OCR_CACHE_MAX_MB
+    except ValueError:
+        max_mb = DEFAULT_OCR_CACHE_MAX_MB
+    if max_mb <= 0:
+        return None
+
+    cache_dir = os.environ.get(OCR_CACHE_DIR_ENV, "").strip() or str(DEFAULT_OCR_CACHE_DIR)
+    cache_key = (cache_dir, max_mb)
+    with _cache_lock:
+        cache = _caches.get(cache_key)
+        if cache is None:
+            cache = OcrCache(Path(cache_dir), max_mb * 1024 * 1024)
+            _caches[cache_key] = cache
+        return cache
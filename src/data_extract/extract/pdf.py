@@ -5,13 +5,21 @@ from __future__ import annotations
 import os
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import TimeoutError as FutureTimeoutError
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 from data_extract.extract.adapter import ExtractorAdapter
+from data_extract.extract.ocr_cache import OcrCache, get_ocr_cache
+
+PAGE_WORKERS_ENV = "DATA_EXTRACT_PDF_PAGE_WORKERS"
+OCR_WORKERS_ENV = "DATA_EXTRACT_OCR_WORKERS"
+DEFAULT_MAX_OCR_WORKERS = 4
 
 
 @dataclass
@@ -19,17 +27,84 @@ class _OcrDependencies:
     pytesseract: Any
     convert_from_path: Any
     poppler_path: Optional[str]
+    tesseract_version: str = ""
+
+
+@dataclass
+class _OcrOutcome:
+    """Best OCR result for one page so far, plus the work spent getting it."""
+
+    text: str = ""
+    confidence: Optional[float] = None
+    tier: Optional[str] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+@dataclass
+class PdfPage:
+    """Extraction outcome for one PDF page.
+
+    Yielded by :meth:`PdfExtractorAdapter.iter_pages` and returned by page-range
+    workers, so it must stay picklable.
+    """
+
+    page_num: int
+    text: str
+    entry: Dict[str, Any]
+    ocr_confidence: Optional[float]
+    scanned: bool
+    ocr_cache_hits: int = 0
+    ocr_cache_misses: int = 0
 
 
 class PdfExtractorAdapter(ExtractorAdapter):
     """Extractor for PDF files using pypdf."""
 
-    OCR_DPI = 300
+    # Adaptive OCR ladder: (dpi, preprocessing) tried in order, stopping as soon as
+    # a page reaches OCR_EARLY_EXIT_CONFIDENCE. Tiers sharing a DPI reuse one
+    # rasterised image.
+    OCR_TIERS: Tuple[Tuple[int, str], ...] = (
+        (150, "none"),
+        (300, "none"),
+        (300, "grayscale_contrast"),
+    )
+    # Mean Tesseract word confidence on clean scans sits around 0.85-0.92, so the
+    # QualityValidator quarantine threshold (0.95) would push nearly every page
+    # through all tiers.
+    OCR_EARLY_EXIT_CONFIDENCE = 0.85
     OCR_TIMEOUT_SECONDS = 15.0
+    OCR_BATCH_PAGES = 8
     MIN_NATIVE_WORDS = 8
+    PARALLEL_MIN_PAGES = 64
+    PAGE_SHARD_SIZE = 32
+    STREAM_SHARDS_PER_WORKER = 2
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        page_workers: Optional[int] = None,
+        ocr_confidence_threshold: Optional[float] = None,
+        ocr_cache: Optional[OcrCache] = None,
+    ) -> None:
+        """Create the adapter.
+
+        Args:
+            page_workers: Worker processes for page-range sharding on PDFs with at
+                least ``PARALLEL_MIN_PAGES`` pages. ``None`` reads
+                ``DATA_EXTRACT_PDF_PAGE_WORKERS`` (default 1, ``0`` = one per CPU).
+            ocr_confidence_threshold: Confidence at which OCR stops escalating
+                through ``OCR_TIERS``. Defaults to ``OCR_EARLY_EXIT_CONFIDENCE``;
+                independent of the ``QualityValidator`` quarantine threshold.
+            ocr_cache: Cache for OCR results. ``None`` uses the process-wide cache
+                configured by ``DATA_EXTRACT_OCR_CACHE_DIR``/``_MAX_MB``; page-range
+                worker processes always use that one.
+        """
         super().__init__(format_name="pdf")
+        self.page_workers = page_workers
+        self.ocr_confidence_threshold = ocr_confidence_threshold
+        self.ocr_cache = ocr_cache
 
     def extract(self, file_path: Path) -> Tuple[str, Dict[str, Any], Dict[str, float]]:
         try:
@@ -39,60 +114,30 @@ class PdfExtractorAdapter(ExtractorAdapter):
 
         try:
             reader = PdfReader(str(file_path))
+            page_count = len(reader.pages)
+            ocr_deps, ocr_unavailable_reason = self._load_ocr_dependencies()
+            page_results = self._iter_page_results(file_path, reader, page_count, ocr_deps)
+
             page_texts: list[str] = []
             pages: list[Dict[str, Any]] = []
             ocr_confidence: Dict[int, float] = {}
+            ocr_cache_hits = 0
+            ocr_cache_misses = 0
             non_empty_pages = 0
             scanned_page_count = 0
-            ocr_deps, ocr_unavailable_reason = self._load_ocr_dependencies()
-
-            for page_num, page in enumerate(reader.pages, start=1):
-                native_text = (page.extract_text() or "").strip()
-                native_words = len(native_text.split())
-                has_images = self._page_has_images(page)
-                should_ocr = bool(ocr_deps) and (
-                    not native_text or native_words < self.MIN_NATIVE_WORDS
-                )
-
-                ocr_text = ""
-                ocr_average_confidence: Optional[float] = None
-                ocr_tier: Optional[str] = None
-                ocr_timed_out = False
-
-                if should_ocr and ocr_deps is not None:
-                    ocr_text, ocr_average_confidence, ocr_tier, ocr_timed_out = self._ocr_page(
-                        file_path=file_path,
-                        page_num=page_num,
-                        deps=ocr_deps,
-                    )
-
-                final_text, extraction_method = self._merge_page_text(native_text, ocr_text)
-                ocr_applied = bool(ocr_text)
-                if ocr_average_confidence is not None and ocr_applied:
-                    ocr_confidence[page_num] = ocr_average_confidence
-
-                if (has_images and native_words < self.MIN_NATIVE_WORDS) or ocr_applied:
+            for page_result in page_results:
+                if page_result.ocr_confidence is not None:
+                    ocr_confidence[page_result.page_num] = page_result.ocr_confidence
+                ocr_cache_hits += page_result.ocr_cache_hits
+                ocr_cache_misses += page_result.ocr_cache_misses
+                if page_result.scanned:
                     scanned_page_count += 1
-
-                if final_text:
+                if page_result.text:
                     non_empty_pages += 1
-                page_texts.append(final_text)
-                pages.append(
-                    {
-                        "page_num": page_num,
-                        "has_images": has_images,
-                        "has_text": bool(final_text),
-                        "text_blocks": 1 if final_text else 0,
-                        "ocr_applied": ocr_applied,
-                        "ocr_confidence": ocr_average_confidence,
-                        "ocr_tier": ocr_tier if ocr_applied else None,
-                        "ocr_timed_out": ocr_timed_out,
-                        "extraction_method": extraction_method,
-                    }
-                )
+                page_texts.append(page_result.text)
+                pages.append(page_result.entry)
 
-            text = "\n\n".join(page_texts)
-            page_count = len(reader.pages)
+            text, text_blocks = self._join_blocks(page_texts, "\n\n")
             confidence = (non_empty_pages / page_count) if page_count else 0.0
 
             structure = {
@@ -101,9 +146,12 @@ class PdfExtractorAdapter(ExtractorAdapter):
                 "scanned_page_count": scanned_page_count,
                 "ocr_pages": len(ocr_confidence),
                 "ocr_confidence": ocr_confidence,
+                "ocr_cache_hits": ocr_cache_hits,
+                "ocr_cache_misses": ocr_cache_misses,
                 "ocr_ready": ocr_deps is not None,
                 "ocr_unavailable_reason": ocr_unavailable_reason,
                 "pages": pages,
+                "text_blocks": text_blocks,
             }
             quality = {
                 "extraction_confidence": confidence,
@@ -117,6 +165,185 @@ class PdfExtractorAdapter(ExtractorAdapter):
             # while still failing for genuinely corrupted binary payloads.
             return self._extract_text_stub(file_path)
 
+    def iter_pages(self, file_path: Path) -> Iterator[PdfPage]:
+        """Yield pages one at a time, in page order, as they are extracted.
+
+        Unlike :meth:`extract`, the document text is never assembled, so callers
+        that consume pages incrementally (for example
+        ``ChunkingEngine.chunk_stream``) keep memory bounded by a page rather than
+        the document. Large PDFs are still sharded across worker processes, with
+        at most ``STREAM_SHARDS_PER_WORKER`` shards per worker in flight.
+
+        Args:
+            file_path: PDF file to read
+
+        Yields:
+            PdfPage: Page text plus the same page entry ``extract`` records
+
+        Raises:
+            ImportError: If pypdf is not installed
+        """
+        from pypdf import PdfReader
+
+        reader = PdfReader(str(file_path))
+        ocr_deps, _ = self._load_ocr_dependencies()
+        yield from self._iter_page_results(file_path, reader, len(reader.pages), ocr_deps)
+
+    def _iter_page_results(
+        self,
+        file_path: Path,
+        reader: Any,
+        page_count: int,
+        ocr_deps: Optional[_OcrDependencies],
+    ) -> Iterator[PdfPage]:
+        """Extract every page, sharding page ranges across processes for large PDFs."""
+        workers = self._resolve_page_workers(page_count)
+        next_page = 1
+        if workers > 1:
+            shards = deque(self._page_shards(page_count, workers))
+            max_in_flight = workers * self.STREAM_SHARDS_PER_WORKER
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    in_flight: deque[Future[list[PdfPage]]] = deque()
+                    while shards or in_flight:
+                        while shards and len(in_flight) < max_in_flight:
+                            first_page, last_page = shards.popleft()
+                            in_flight.append(
+                                executor.submit(
+                                    _extract_page_range,
+                                    str(file_path),
+                                    first_page,
+                                    last_page,
+                                    ocr_deps is not None,
+                                    self.ocr_confidence_threshold,
+                                )
+                            )
+                        # Drain in submission order so page order matches sequential output.
+                        for page_result in in_flight.popleft().result():
+                            try:
+                                yield page_result
+                            except GeneratorExit:
+                                # Consumer stopped early; don't wait on queued shards.
+                                for future in in_flight:
+                                    future.cancel()
+                                raise
+                            next_page = page_result.page_num + 1
+                return
+            except (BrokenProcessPool, OSError):
+                # Process pools are unavailable in some sandboxes/frozen builds; fall
+                # back to the sequential page walk rather than failing extraction.
+                pass
+
+        if next_page <= page_count:
+            yield from self._iter_page_range(file_path, reader, next_page, page_count, ocr_deps)
+
+    def _resolve_page_workers(self, page_count: int) -> int:
+        if page_count < self.PARALLEL_MIN_PAGES:
+            return 1
+        workers = self.page_workers
+        if workers is None:
+            raw_value = os.environ.get(PAGE_WORKERS_ENV, "1").strip()
+            try:
+                workers = int(raw_value)
+            except ValueError:
+                workers = 1
+            if workers <= 0:
+                workers = os.cpu_count() or 1
+        return max(1, min(int(workers), page_count))
+
+    def _page_shards(self, page_count: int, workers: int) -> list[Tuple[int, int]]:
+        """Split 1-based pages into contiguous ranges, several per worker for balance."""
+        shard_size = max(1, min(self.PAGE_SHARD_SIZE, -(-page_count // (workers * 4))))
+        return [
+            (first_page, min(first_page + shard_size - 1, page_count))
+            for first_page in range(1, page_count + 1, shard_size)
+        ]
+
+    def _iter_page_range(
+        self,
+        file_path: Path,
+        reader: Any,
+        first_page: int,
+        last_page: int,
+        ocr_deps: Optional[_OcrDependencies],
+    ) -> Iterator[PdfPage]:
+        """Extract a 1-based page range in blocks of ``OCR_BATCH_PAGES`` pages."""
+        for block_start in range(first_page, last_page + 1, self.OCR_BATCH_PAGES):
+            block_end = min(block_start + self.OCR_BATCH_PAGES - 1, last_page)
+            block = [
+                (page_num, reader.pages[page_num - 1])
+                for page_num in range(block_start, block_end + 1)
+            ]
+            yield from self._extract_page_block(block, file_path, ocr_deps)
+
+    def _extract_page_block(
+        self,
+        pages: Sequence[Tuple[int, Any]],
+        file_path: Path,
+        ocr_deps: Optional[_OcrDependencies],
+    ) -> list[PdfPage]:
+        """Extract native text for a block of pages, then OCR the sparse ones together."""
+        native: list[Tuple[int, str, int, bool]] = []
+        for page_num, page in pages:
+            native_text = (page.extract_text() or "").strip()
+            native.append(
+                (page_num, native_text, len(native_text.split()), self._page_has_images(page))
+            )
+
+        ocr_results: Dict[int, _OcrOutcome] = {}
+        if ocr_deps is not None:
+            ocr_targets = [
+                page_num
+                for page_num, native_text, native_words, _ in native
+                if not native_text or native_words < self.MIN_NATIVE_WORDS
+            ]
+            if ocr_targets:
+                ocr_results = self._ocr_pages(file_path, ocr_targets, ocr_deps)
+
+        return [
+            self._build_page(
+                page_num, native_text, native_words, has_images, ocr_results.get(page_num)
+            )
+            for page_num, native_text, native_words, has_images in native
+        ]
+
+    def _build_page(
+        self,
+        page_num: int,
+        native_text: str,
+        native_words: int,
+        has_images: bool,
+        ocr_result: Optional[_OcrOutcome],
+    ) -> PdfPage:
+        ocr = ocr_result or _OcrOutcome()
+        ocr_text, ocr_average_confidence, ocr_tier = ocr.text, ocr.confidence, ocr.tier
+        final_text, extraction_method = self._merge_page_text(native_text, ocr_text)
+        ocr_applied = bool(ocr_text)
+
+        return PdfPage(
+            page_num=page_num,
+            text=final_text,
+            entry={
+                "page_num": page_num,
+                "has_images": has_images,
+                "has_text": bool(final_text),
+                "text_blocks": 1 if final_text else 0,
+                "ocr_applied": ocr_applied,
+                "ocr_confidence": ocr_average_confidence,
+                "ocr_tier": ocr_tier if ocr_applied else None,
+                "ocr_timed_out": ocr.timed_out,
+                "extraction_method": extraction_method,
+            },
+            ocr_confidence=(
+                ocr_average_confidence
+                if ocr_average_confidence is not None and ocr_applied
+                else None
+            ),
+            scanned=(has_images and native_words < self.MIN_NATIVE_WORDS) or ocr_applied,
+            ocr_cache_hits=ocr.cache_hits,
+            ocr_cache_misses=ocr.cache_misses,
+        )
+
     @staticmethod
     def _merge_page_text(native_text: str, ocr_text: str) -> Tuple[str, str]:
         native_text = native_text.strip()
@@ -174,7 +401,7 @@ class PdfExtractorAdapter(ExtractorAdapter):
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
 
         try:
-            pytesseract.get_tesseract_version()
+            tesseract_version = str(pytesseract.get_tesseract_version())
         except Exception as exc:  # pragma: no cover - depends on host environment
             return None, f"tesseract unavailable: {exc}"
 
@@ -183,6 +410,7 @@ class PdfExtractorAdapter(ExtractorAdapter):
                 pytesseract=pytesseract,
                 convert_from_path=convert_from_path,
                 poppler_path=self._resolve_poppler_path(),
+                tesseract_version=tesseract_version,
             ),
             None,
         )
@@ -212,62 +440,190 @@ class PdfExtractorAdapter(ExtractorAdapter):
 
         return False
 
-    def _ocr_page(
+    def _ocr_pages(
         self,
         file_path: Path,
-        page_num: int,
+        page_nums: Sequence[int],
         deps: _OcrDependencies,
-    ) -> Tuple[str, Optional[float], Optional[str], bool]:
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._ocr_page_impl, file_path, page_num, deps)
-            try:
-                return future.result(timeout=self.OCR_TIMEOUT_SECONDS)
-            except FutureTimeoutError:
-                return "", None, "timeout", True
-            except Exception:
-                return "", None, "error", False
+    ) -> Dict[int, _OcrOutcome]:
+        """OCR pages adaptively, escalating only pages below the confidence threshold.
+
+        Each round rasterises the still-pending pages at one DPI, one poppler call
+        per contiguous run, and hands the images to the shared OCR pool as soon as
+        their run is converted. Every page has ``OCR_TIMEOUT_SECONDS`` of
+        Tesseract time across all rounds.
+        """
+        threshold = self._resolve_ocr_confidence_threshold()
+        cache = self.ocr_cache if self.ocr_cache is not None else get_ocr_cache()
+        results: Dict[int, _OcrOutcome] = {}
+        pending_pages = list(page_nums)
+        pool = _get_ocr_pool()
+
+        for dpi, preprocessing in self._ocr_rounds():
+            pending: list[Tuple[int, Future[_OcrOutcome]]] = []
+            for first_page, last_page in _contiguous_runs(pending_pages):
+                run_pages = range(first_page, last_page + 1)
+                try:
+                    images = deps.convert_from_path(
+                        str(file_path),
+                        dpi=dpi,
+                        first_page=first_page,
+                        last_page=last_page,
+                        poppler_path=deps.poppler_path,
+                        timeout=self.OCR_TIMEOUT_SECONDS * len(run_pages),
+                    )
+                except Exception as exc:
+                    timed_out = _is_timeout_error(exc)
+                    for page_num in run_pages:
+                        previous = results.get(page_num)
+                        if previous is None or timed_out:
+                            results[page_num] = _OcrOutcome(
+                                tier="timeout" if timed_out else "error",
+                                timed_out=timed_out,
+                            )
+                    continue
+
+                for offset, page_num in enumerate(run_pages):
+                    if offset >= len(images):
+                        results.setdefault(page_num, _OcrOutcome())
+                        continue
+                    pending.append(
+                        (
+                            page_num,
+                            pool.submit(
+                                self._ocr_image,
+                                images[offset],
+                                deps,
+                                dpi,
+                                preprocessing,
+                                threshold,
+                                results.get(page_num) or _OcrOutcome(),
+                                cache,
+                            ),
+                        )
+                    )
+
+            for page_num, future in pending:
+                try:
+                    results[page_num] = future.result()
+                except Exception:
+                    results.setdefault(page_num, _OcrOutcome(tier="error"))
+
+            pending_pages = [
+                page_num
+                for page_num in pending_pages
+                if self._needs_ocr_escalation(results.get(page_num), threshold)
+            ]
+            if not pending_pages:
+                break
+
+        return results
+
+    def _ocr_rounds(self) -> list[Tuple[int, list[str]]]:
+        """Group ``OCR_TIERS`` into per-DPI rounds, preserving order."""
+        rounds: list[Tuple[int, list[str]]] = []
+        for dpi, preprocessing in self.OCR_TIERS:
+            if rounds and rounds[-1][0] == dpi:
+                rounds[-1][1].append(preprocessing)
+            else:
+                rounds.append((dpi, [preprocessing]))
+        return rounds
+
+    def _resolve_ocr_confidence_threshold(self) -> float:
+        if self.ocr_confidence_threshold is not None:
+            return self.ocr_confidence_threshold
+        return self.OCR_EARLY_EXIT_CONFIDENCE
+
+    @staticmethod
+    def _needs_ocr_escalation(result: Optional[_OcrOutcome], threshold: float) -> bool:
+        if result is None:
+            return True
+        if result.timed_out:
+            return False
+        return result.confidence is None or result.confidence < threshold
 
-    def _ocr_page_impl(
+    def _ocr_image(
         self,
-        file_path: Path,
-        page_num: int,
+        base_image: Any,
         deps: _OcrDependencies,
-    ) -> Tuple[str, Optional[float], Optional[str], bool]:
-        images = deps.convert_from_path(
-            str(file_path),
-            dpi=self.OCR_DPI,
-            first_page=page_num,
-            last_page=page_num,
-            poppler_path=deps.poppler_path,
+        dpi: int,
+        preprocessing: Sequence[str],
+        threshold: float,
+        best: _OcrOutcome,
+        cache: Optional[OcrCache],
+    ) -> _OcrOutcome:
+        """OCR one rasterised page through the given preprocessing tiers.
+
+        Stops at the first tier whose confidence reaches ``threshold``. Cached
+        tiers are served without running Tesseract; otherwise the page's remaining
+        budget is passed to Tesseract as its process timeout, so a page that runs
+        over has its Tesseract process killed rather than left running.
+
+        Returns:
+            Best outcome so far, including ``best`` from earlier rounds, with the
+            OCR time and cache hits/misses accumulated.
+        """
+        started = time.monotonic()
+        deadline = started + self.OCR_TIMEOUT_SECONDS - best.elapsed
+        outcome = _OcrOutcome(
+            text=best.text,
+            confidence=best.confidence,
+            tier=best.tier,
+            elapsed=best.elapsed,
+            cache_hits=best.cache_hits,
+            cache_misses=best.cache_misses,
         )
-        if not images:
-            return "", None, None, False
-
-        base_image = images[0]
-        tiers: list[Tuple[str, Any]] = [("none", base_image)]
-        preprocessed = self._preprocess_image(base_image)
-        if preprocessed is not None:
-            tiers.append(("grayscale_contrast", preprocessed))
-
-        best_text = ""
-        best_confidence: Optional[float] = None
-        best_tier: Optional[str] = None
-
-        for tier_name, tier_image in tiers:
-            text, confidence = self._run_ocr(tier_image, deps.pytesseract)
-            if not text:
-                continue
-            if self._is_better_ocr_candidate(
+        image_digest = OcrCache.image_digest(base_image) if cache is not None else ""
+
+        for preprocess in preprocessing:
+            tier_name = f"{dpi}dpi" if preprocess == "none" else f"{dpi}dpi_{preprocess}"
+            cache_key = (
+                OcrCache.make_key(image_digest, dpi, preprocess, deps.tesseract_version)
+                if cache is not None
+                else ""
+            )
+            cached = cache.get(cache_key) if cache is not None else None
+            if cached is not None:
+                outcome.cache_hits += 1
+                text, confidence = cached
+            else:
+                tier_image = (
+                    base_image if preprocess == "none" else self._preprocess_image(base_image)
+                )
+                if tier_image is None:
+                    continue
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining <= 0:
+                        raise TimeoutError("OCR page budget exhausted")
+                    text, confidence = self._run_ocr(
+                        tier_image, deps.pytesseract, timeout=remaining
+                    )
+                except TimeoutError:
+                    outcome.timed_out = True
+                    if not outcome.text:
+                        outcome.confidence = None
+                        outcome.tier = "timeout"
+                    break
+                if cache is not None:
+                    outcome.cache_misses += 1
+                    # Empty output may be a transient Tesseract failure; don't pin it.
+                    if text:
+                        cache.put(cache_key, text, confidence)
+            if text and self._is_better_ocr_candidate(
                 text=text,
                 confidence=confidence,
-                current_text=best_text,
-                current_confidence=best_confidence,
+                current_text=outcome.text,
+                current_confidence=outcome.confidence,
             ):
-                best_text = text
-                best_confidence = confidence
-                best_tier = tier_name
+                outcome.text = text
+                outcome.confidence = confidence
+                outcome.tier = tier_name
+            if outcome.confidence is not None and outcome.confidence >= threshold:
+                break
 
-        return best_text, best_confidence, best_tier, False
+        outcome.elapsed += time.monotonic() - started
+        return outcome
 
     @staticmethod
     def _preprocess_image(image: Any) -> Optional[Any]:
@@ -281,14 +637,26 @@ class PdfExtractorAdapter(ExtractorAdapter):
             return None
 
     @staticmethod
-    def _run_ocr(image: Any, pytesseract_module: Any) -> Tuple[str, Optional[float]]:
+    def _run_ocr(
+        image: Any, pytesseract_module: Any, timeout: float = 0
+    ) -> Tuple[str, Optional[float]]:
+        """Run Tesseract on an image, returning text and mean word confidence.
+
+        A positive ``timeout`` caps both Tesseract invocations together; when it
+        is exceeded pytesseract kills the process and ``TimeoutError`` is raised.
+        """
+        deadline = time.monotonic() + timeout if timeout > 0 else None
         try:
             ocr_data = pytesseract_module.image_to_data(
                 image,
                 output_type=pytesseract_module.Output.DICT,
+                timeout=timeout,
             )
-            text = pytesseract_module.image_to_string(image).strip()
-        except Exception:
+            remaining = max(deadline - time.monotonic(), 0.001) if deadline is not None else 0
+            text = pytesseract_module.image_to_string(image, timeout=remaining).strip()
+        except Exception as exc:
+            if _is_timeout_error(exc):
+                raise TimeoutError(str(exc)) from exc
             return "", None
 
         confidence_scores: list[float] = []
@@ -425,3 +793,84 @@ class PdfExtractorAdapter(ExtractorAdapter):
         }
         quality = {"extraction_confidence": 0.25}
         return text, structure, quality
+
+
+def _extract_page_range(
+    file_path: str,
+    first_page: int,
+    last_page: int,
+    use_ocr: bool,
+    ocr_confidence_threshold: Optional[float] = None,
+) -> list[PdfPage]:
+    """Extract a contiguous 1-based page range in a worker process.
+
+    Each worker opens its own PdfReader; pypdf readers are not shareable across
+    processes.
+    """
+    from pypdf import PdfReader
+
+    adapter = PdfExtractorAdapter(page_workers=1, ocr_confidence_threshold=ocr_confidence_threshold)
+    ocr_deps = adapter._load_ocr_dependencies()[0] if use_ocr else None
+    reader = PdfReader(file_path)
+    return list(adapter._iter_page_range(Path(file_path), reader, first_page, last_page, ocr_deps))
+
+
+def _contiguous_runs(page_nums: Iterable[int]) -> list[Tuple[int, int]]:
+    """Collapse sorted page numbers into inclusive ``(first, last)`` runs."""
+    runs: list[Tuple[int, int]] = []
+    for page_num in sorted(page_nums):
+        if runs and runs[-1][1] == page_num - 1:
+            runs[-1] = (runs[-1][0], page_num)
+        else:
+            runs.append((page_num, page_num))
+    return runs
+
+
+def _is_timeout_error(exc: BaseException) -> bool:
+    # pytesseract raises RuntimeError("Tesseract process timeout"); pdf2image
+    # raises PDFPopplerTimeoutError. Both kill the child process first.
+    return isinstance(exc, TimeoutError) or "timeout" in f"{type(exc).__name__} {exc}".lower()
+
+
+def _resolve_ocr_workers() -> int:
+    default = min(DEFAULT_MAX_OCR_WORKERS, os.cpu_count() or 1)
+    raw_value = os.environ.get(OCR_WORKERS_ENV, "").strip()
+    if not raw_value:
+        return default
+    try:
+        workers = int(raw_value)
+    except ValueError:
+        return default
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+_ocr_pool_lock = threading.Lock()
+_ocr_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Return the process-wide OCR pool, creating it on first use.
+
+    Pool threads only feed images to Tesseract subprocesses and wait on them, so
+    threads give real parallelism here; the pool size bounds concurrent
+    Tesseract processes (``DATA_EXTRACT_OCR_WORKERS``).
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ThreadPoolExecutor(
+                max_workers=_resolve_ocr_workers(),
+                thread_name_prefix="data-extract-ocr",
+            )
+        return _ocr_pool
+
+
+def _reset_ocr_pool_after_fork() -> None:
+    # Pool threads do not survive fork(); page-range workers build their own.
+    global _ocr_pool, _ocr_pool_lock
+    _ocr_pool = None
+    _ocr_pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ocr_pool_after_fork)
@@ -21,12 +21,12 @@ class PptxExtractorAdapter(ExtractorAdapter):
             raise RuntimeError("python-pptx is required for PPTX extraction") from exc
 
         presentation = Presentation(str(file_path))
-        lines = []
+        slide_texts = []
         text_box_count = 0
         notes_count = 0
 
         for idx, slide in enumerate(presentation.slides, start=1):
-            lines.append(f"# Slide {idx}")
+            lines = [f"# Slide {idx}"]
             for shape in slide.shapes:
                 if hasattr(shape, "text") and shape.text:
                     content = shape.text.strip()
@@ -39,12 +39,14 @@ class PptxExtractorAdapter(ExtractorAdapter):
             if notes:
                 lines.append(f"Notes: {notes}")
                 notes_count += 1
+            slide_texts.append("\n\n".join(lines))
 
-        text = "\n\n".join(lines)
+        text, text_blocks = self._join_blocks(slide_texts, "\n\n")
         structure = {
             "slide_count": len(presentation.slides),
             "text_box_count": text_box_count,
             "notes_count": notes_count,
+            "text_blocks": text_blocks,
         }
         quality = {
             "extraction_confidence": 1.0,
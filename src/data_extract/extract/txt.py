@@ -15,7 +15,7 @@ class TxtExtractorAdapter(ExtractorAdapter):
         super().__init__(format_name="txt")
 
     def extract(self, file_path: Path) -> Tuple[str, Dict[str, Any], Dict[str, float]]:
-        text = file_path.read_text(encoding="utf-8", errors="ignore")
+        text = self._read_text(file_path)
         line_count = len(text.splitlines())
         structure = {
             "line_count": line_count,
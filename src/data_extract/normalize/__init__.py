@@ -7,6 +7,7 @@ This module contains text cleaning and normalization processors:
 - OCR confidence scoring and validation (Story 2.4)
 - Completeness validation and gap detection (Story 2.5)
 - Metadata enrichment (Story 2.6)
+- Shared, precompiled normalizers per configuration (registry)
 
 Type Contract: Document (raw text) → Document (cleaned text, normalized entities)
 """
@@ -15,6 +16,7 @@ from .cleaning import CleaningResult, TextCleaner
 from .config import NormalizationConfig, load_config, validate_entity_patterns
 from .entities import EntityNormalizer
 from .normalizer import Normalizer, NormalizerFactory
+from .registry import NormalizerRegistry, get_normalizer_registry, get_shared_normalizer
 
 __all__ = [
     "NormalizationConfig",
@@ -25,4 +27,7 @@ __all__ = [
     "EntityNormalizer",
     "Normalizer",
     "NormalizerFactory",
+    "NormalizerRegistry",
+    "get_normalizer_registry",
+    "get_shared_normalizer",
 ]
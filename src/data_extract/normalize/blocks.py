@@ -0,0 +1,272 @@
+"""Block-parallel normalization for documents with page, slide or sheet structure.
+
+Extractors record where each PDF page, PPTX slide or Excel sheet sits in
+``Document.text`` as ``structure["text_blocks"]`` (``[start, end]`` character
+spans). For large documents, ``Normalizer`` cleans each block and recognizes
+its entities in a pool of worker processes. The cleaned blocks are then
+stitched back together with the newline separators the extractor used, and
+entity locations are shifted by each block's offset in the stitched text.
+
+Blocks are processed independently: an OCR artifact pattern cannot match
+across a block boundary, each block's surrounding whitespace is stripped, and
+entity context windows and first-occurrence abbreviation expansion stop at
+the block edge. Cross-references are resolved once, over the merged entities.
+
+Key functions:
+- block_spans(): Validated block spans recorded for a document, or None
+- resolve_block_workers(): Worker count from config or environment
+- normalize_blocks(): Clean and scan the blocks of a large document
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from ..core.models import Document, Entity
+from .cleaning import CleaningResult
+from .config import NormalizationConfig
+
+if TYPE_CHECKING:
+    from .normalizer import Normalizer
+
+BLOCKS_KEY = "text_blocks"
+BLOCK_WORKERS_ENV = "DATA_EXTRACT_NORMALIZE_BLOCK_WORKERS"
+
+# Below this size the pool start-up costs more than it saves.
+PARALLEL_MIN_CHARS = 100_000
+# Several shards per worker keep the pool busy when block sizes are uneven.
+SHARDS_PER_WORKER = 4
+
+
+@dataclass
+class BlockResult:
+    """Cleaning and entity recognition output for one block."""
+
+    text: str
+    cleaning_result: CleaningResult
+    entities: Optional[List[Entity]]
+    expanded_length: int
+    entity_error: Optional[str] = None
+
+
+@dataclass
+class BlockNormalization:
+    """Blocks of a document stitched back into document-level results.
+
+    Entity locations are offsets into the stitched text with abbreviations
+    expanded, as ``EntityNormalizer.process`` reports for whole documents.
+    ``entities`` is None when entity normalization is disabled.
+    """
+
+    text: str
+    cleaning_result: CleaningResult
+    entities: Optional[List[Entity]]
+    entity_error: Optional[str]
+    block_count: int
+    workers: int
+
+
+def block_spans(document: Document) -> Optional[List[Tuple[int, int]]]:
+    """Return the block spans recorded for ``document``, covering its whole text.
+
+    Text before the first and after the last span is folded into those blocks.
+    Returns None when fewer than two blocks are recorded, or when the spans are
+    out of order, out of range, or separated by anything other than newlines.
+    """
+    raw_spans: Any = document.structure.get(BLOCKS_KEY)
+    if not isinstance(raw_spans, list) or len(raw_spans) < 2:
+        return None
+
+    text = document.text
+    spans: List[Tuple[int, int]] = []
+    previous_end = 0
+    for raw_span in raw_spans:
+        try:
+            start, end = (int(value) for value in raw_span)
+        except (TypeError, ValueError):
+            return None
+        if not previous_end <= start <= end <= len(text):
+            return None
+        if spans and (start == previous_end or text[previous_end:start].strip("\n")):
+            return None
+        spans.append((start, end))
+        previous_end = end
+
+    spans[0] = (0, spans[0][1])
+    spans[-1] = (spans[-1][0], len(text))
+    return spans
+
+
+def resolve_block_workers(config: NormalizationConfig) -> int:
+    """Return the worker count for ``config`` (``block_workers``, else the environment)."""
+    workers = config.block_workers
+    if workers is None:
+        raw_value = os.environ.get(BLOCK_WORKERS_ENV, "1").strip()
+        try:
+            workers = int(raw_value)
+        except ValueError:
+            workers = 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def normalize_blocks(normalizer: "Normalizer", document: Document) -> Optional[BlockNormalization]:
+    """Clean ``document`` and recognize its entities block by block.
+
+    Returns None (process the whole text instead) unless the document has
+    recorded blocks, at least ``PARALLEL_MIN_CHARS`` characters, and more than
+    one worker is configured. If worker processes cannot be started, the
+    blocks are processed in this process with the same results.
+    """
+    workers = resolve_block_workers(normalizer.config)
+    if workers <= 1 or len(document.text) < PARALLEL_MIN_CHARS:
+        return None
+    spans = block_spans(document)
+    if spans is None:
+        return None
+
+    blocks = [document.text[start:end] for start, end in spans]
+    separators = [document.text[end:start] for (_, end), (start, _) in zip(spans, spans[1:])]
+    doc_type = document.metadata.document_type
+    shards = _shard_blocks(blocks, workers * SHARDS_PER_WORKER)
+    workers = min(workers, len(shards))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_results = list(
+                executor.map(
+                    _normalize_shard_in_worker, repeat(normalizer.config), repeat(doc_type), shards
+                )
+            )
+    except (BrokenProcessPool, OSError):
+        # Process pools are unavailable in some sandboxes/frozen builds.
+        shard_results = [_normalize_block_list(normalizer, doc_type, shard) for shard in shards]
+        workers = 1
+
+    results = [result for shard_result in shard_results for result in shard_result]
+    return _stitch(normalizer.config, results, separators, workers)
+
+
+def _shard_blocks(blocks: List[str], max_shards: int) -> List[List[str]]:
+    """Split blocks into at most ``max_shards`` contiguous runs of similar size."""
+    target = max(1, -(-sum(len(block) for block in blocks) // max_shards))
+    shards: List[List[str]] = [[]]
+    shard_chars = 0
+    for block in blocks:
+        if shard_chars >= target:
+            shards.append([])
+            shard_chars = 0
+        shards[-1].append(block)
+        shard_chars += len(block)
+    return shards
+
+
+def _normalize_block_list(
+    normalizer: "Normalizer", doc_type: Optional[str], blocks: List[str]
+) -> List[BlockResult]:
+    results = []
+    for block in blocks:
+        cleaned, cleaning_result = normalizer.text_cleaner.clean_text(block, doc_type=doc_type)
+        entities: Optional[List[Entity]] = None
+        expanded_length = len(cleaned)
+        entity_error = None
+        if normalizer.entity_normalizer:
+            try:
+                entities, expanded = normalizer.entity_normalizer.recognize_entities(cleaned)
+                expanded_length = len(expanded)
+            except Exception as e:
+                entity_error = str(e)
+        results.append(
+            BlockResult(cleaned, cleaning_result, entities, expanded_length, entity_error)
+        )
+    return results
+
+
+def _stitch(
+    config: NormalizationConfig,
+    results: List[BlockResult],
+    separators: List[str],
+    workers: int,
+) -> BlockNormalization:
+    """Join cleaned blocks and shift entity locations to stitched-text offsets.
+
+    With whitespace normalization on, blocks that cleaned to nothing are
+    dropped and the newlines around them are capped like any other run of
+    blank lines.
+    """
+    max_newlines = config.whitespace_max_consecutive_newlines
+    drop_empty = config.normalize_whitespace
+    parts: List[str] = []
+    entities: Optional[List[Entity]] = None
+    entity_error = None
+    artifacts_removed = 0
+    whitespace_normalized = False
+    original_length = sum(len(separator) for separator in separators)
+    expanded_offset = 0
+    pending_newlines = 0
+
+    for index, result in enumerate(results):
+        original_length += result.cleaning_result.original_length
+        artifacts_removed += result.cleaning_result.artifacts_removed
+        whitespace_normalized = (
+            whitespace_normalized or result.cleaning_result.whitespace_normalized
+        )
+        entity_error = entity_error or result.entity_error
+        if index:
+            pending_newlines += len(separators[index - 1])
+        if drop_empty and not result.text:
+            whitespace_normalized = (
+                whitespace_normalized or result.cleaning_result.original_length > 0
+            )
+            continue
+
+        if parts:
+            count = min(pending_newlines, max_newlines) if drop_empty else pending_newlines
+            whitespace_normalized = whitespace_normalized or count != pending_newlines
+            parts.append("\n" * count)
+            expanded_offset += count
+        pending_newlines = 0
+        parts.append(result.text)
+
+        if result.entities is not None:
+            if entities is None:
+                entities = []
+            for entity in result.entities:
+                location = {
+                    "start": entity.location["start"] + expanded_offset,
+                    "end": entity.location["end"] + expanded_offset,
+                }
+                entities.append(entity.model_copy(update={"location": location}))
+        expanded_offset += result.expanded_length
+
+    text = "".join(parts)
+    cleaning_result = CleaningResult(
+        original_length=original_length,
+        cleaned_length=len(text),
+        artifacts_removed=artifacts_removed,
+        whitespace_normalized=whitespace_normalized,
+    )
+    return BlockNormalization(
+        text=text,
+        cleaning_result=cleaning_result,
+        entities=entities,
+        entity_error=entity_error,
+        block_count=len(results),
+        workers=workers,
+    )
+
+
+def _normalize_shard_in_worker(
+    config: NormalizationConfig, doc_type: Optional[str], blocks: List[str]
+) -> List[BlockResult]:
+    # Forked workers find the parent's shared normalizer already in the
+    # registry; spawned workers build it on their first shard and reuse it.
+    from .registry import get_shared_normalizer
+
+    return _normalize_block_list(get_shared_normalizer(config), doc_type, blocks)
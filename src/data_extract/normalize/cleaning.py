@@ -16,6 +16,61 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from .config import NormalizationConfig
 
+# Runs of 2+ spaces after line content (leading indentation is preserved). The
+# lookbehind follows the literal so the regex engine can skip ahead to "  ".
+_INNER_SPACES = re.compile(r"  (?<=[^\n ]  ) *")
+_EXCESS_NEWLINES = re.compile(r"\n{3,}")
+
+# (line_local, patterns): a run of line-local patterns applied only to the lines
+# they match in, or a single pattern applied to the whole text.
+_ArtifactPass = Tuple[bool, List[Tuple[re.Pattern[str], str]]]
+
+
+def _combine_patterns(patterns: List[re.Pattern[str]]) -> Optional[re.Pattern[str]]:
+    """Compile one alternation that matches wherever any of ``patterns`` matches.
+
+    Returns None if a pattern uses backreferences (group numbers shift when
+    combined) or the alternation does not compile (e.g. global inline flags).
+    """
+    parts = []
+    for pattern in patterns:
+        if re.search(r"\\[1-9]|\(\?P=|\(\?\(", pattern.pattern):
+            return None
+        flags = "i" if pattern.flags & re.IGNORECASE else ""
+        flags += "s" if pattern.flags & re.DOTALL else ""
+        flags += "m" if pattern.flags & re.MULTILINE else ""
+        flags += "x" if pattern.flags & re.VERBOSE else ""
+        parts.append(f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+def _plan_artifact_passes(
+    patterns: List[Tuple[re.Pattern[str], str]], line_local: List[bool]
+) -> List[_ArtifactPass]:
+    """Group consecutive line-local artifact patterns into one pass over flagged lines.
+
+    A pattern is line-local when its rule declares ``line_local: true``: it only
+    matches non-empty text within one line and is unaffected by neighbouring
+    lines. Replacements containing a newline or group reference are always
+    applied to the whole text.
+    """
+    passes: List[_ArtifactPass] = []
+    run: List[Tuple[re.Pattern[str], str]] = []
+    for (pattern, replacement), local in zip(patterns, line_local):
+        if local and "\\" not in replacement and "\n" not in replacement:
+            run.append((pattern, replacement))
+            continue
+        if run:
+            passes.append((True, run))
+            run = []
+        passes.append((False, [(pattern, replacement)]))
+    if run:
+        passes.append((True, run))
+    return passes
+
 
 class CleaningResult(BaseModel):
     """Audit log of text cleaning transformations (AC-2.1.7).
@@ -70,8 +125,13 @@ class TextCleaner:
         """
         self.config = config
         self._ocr_patterns: List[Tuple[re.Pattern[str], str]] = []
+        self._ocr_line_local: List[bool] = []
         self._header_footer_patterns: List[Tuple[re.Pattern[str], str]] = []
         self._load_cleaning_patterns()
+        self._artifact_passes = _plan_artifact_passes(self._ocr_patterns, self._ocr_line_local)
+        self._header_footer_detector = _combine_patterns(
+            [pattern for pattern, _ in self._header_footer_patterns]
+        )
 
     def _load_cleaning_patterns(self) -> None:
         """Load cleaning patterns from YAML configuration file.
@@ -95,6 +155,7 @@ class TextCleaner:
                     try:
                         compiled_pattern = re.compile(pattern)
                         self._ocr_patterns.append((compiled_pattern, replacement))
+                        self._ocr_line_local.append(bool(artifact.get("line_local", False)))
                     except re.error:
                         # Skip invalid patterns
                         pass
@@ -124,6 +185,8 @@ class TextCleaner:
                 (re.compile(r"={10,}"), ""),  # Long equals
                 (re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]"), ""),  # Control characters
             ]
+            # None of the default patterns can match a newline
+            self._ocr_line_local = [True] * len(self._ocr_patterns)
 
         if not self._header_footer_patterns:
             self._header_footer_patterns = [
@@ -194,14 +257,56 @@ class TextCleaner:
         cleaned = text
         artifacts_removed = 0
 
-        for pattern, replacement in self._ocr_patterns:
-            matches = pattern.findall(cleaned)
-            if matches:
-                artifacts_removed += len(matches)
-                cleaned = pattern.sub(replacement, cleaned)
+        # Patterns apply in order, each to the previous output. A run of
+        # line-local patterns is applied only to the lines any of them matches
+        # in: a line none of them matches is never changed by the run, so the
+        # text and counts equal one whole-text pass per pattern.
+        for line_local, patterns in self._artifact_passes:
+            if line_local:
+                cleaned, count = self._clean_flagged_lines(cleaned, patterns)
+            else:
+                pattern, replacement = patterns[0]
+                cleaned, count = pattern.subn(replacement, cleaned)
+            artifacts_removed += count
 
         return cleaned, artifacts_removed
 
+    @staticmethod
+    def _clean_flagged_lines(
+        text: str, patterns: List[Tuple[re.Pattern[str], str]]
+    ) -> Tuple[str, int]:
+        """Apply line-local ``patterns`` in order to each line one of them matches in."""
+        # Line start -> line end for every line with a match; each pattern's
+        # search skips to the next line after a hit.
+        flagged: Dict[int, int] = {}
+        for pattern, _ in patterns:
+            match = pattern.search(text)
+            while match:
+                start = text.rfind("\n", 0, match.start()) + 1
+                end = text.find("\n", match.end())
+                if end < 0:
+                    end = len(text)
+                flagged[start] = end
+                match = pattern.search(text, end)
+
+        if not flagged:
+            return text, 0
+
+        pieces: List[str] = []
+        position = 0
+        removed = 0
+        for start in sorted(flagged):
+            end = flagged[start]
+            line = text[start:end]
+            for pattern, replacement in patterns:
+                line, count = pattern.subn(replacement, line)
+                removed += count
+            pieces.append(text[position:start])
+            pieces.append(line)
+            position = end
+        pieces.append(text[position:])
+        return "".join(pieces), removed
+
     def normalize_whitespace(self, text: str) -> Tuple[str, bool]:
         """Normalize whitespace while preserving formatting (AC-2.1.2, AC-2.1.5).
 
@@ -228,32 +333,18 @@ class TextCleaner:
             >>> assert "\\n\\n" in normalized  # Paragraph breaks preserved
         """
         original = text
-        cleaned = text
 
         # Normalize tabs to spaces
-        cleaned = cleaned.replace("\t", " " * 4)
-
-        # Normalize multiple spaces to single space (within lines)
-        # But preserve intentional indentation at start of lines
-        lines = cleaned.split("\n")
-        normalized_lines = []
-        for line in lines:
-            # Preserve leading whitespace (for code blocks, lists)
-            leading_space = len(line) - len(line.lstrip(" "))
-            content = line.lstrip(" ")
-
-            # Normalize multiple spaces within content
-            content = re.sub(r" {2,}", " ", content)
-
-            # Reconstruct line with preserved leading space
-            normalized_line = (" " * leading_space) + content if leading_space > 0 else content
-            normalized_lines.append(normalized_line)
+        cleaned = text.replace("\t", " " * 4)
 
-        cleaned = "\n".join(normalized_lines)
+        # Normalize multiple spaces to single space (within lines). Runs at the
+        # start of a line are intentional indentation (code blocks, lists) and
+        # are preserved, so only runs following line content are collapsed.
+        cleaned = _INNER_SPACES.sub(" ", cleaned)
 
         # Normalize multiple newlines (max 2 consecutive = paragraph break)
         max_newlines = self.config.whitespace_max_consecutive_newlines
-        cleaned = re.sub(r"\n{3,}", "\n" * max_newlines, cleaned)
+        cleaned = _EXCESS_NEWLINES.sub("\n" * max_newlines, cleaned)
 
         # Trim leading/trailing whitespace from entire block
         cleaned = cleaned.strip()
@@ -377,8 +468,12 @@ class TextCleaner:
             if footer:
                 cleaned_page = cleaned_page.replace(footer, "")
 
-            # Also apply pattern-based header/footer removal
-            if self.config.remove_headers_footers:
+            # Also apply pattern-based header/footer removal (skipped when one
+            # combined scan finds none of the patterns on the page)
+            if self.config.remove_headers_footers and (
+                self._header_footer_detector is None
+                or self._header_footer_detector.search(cleaned_page)
+            ):
                 for pattern, replacement in self._header_footer_patterns:
                     cleaned_page = pattern.sub(replacement, cleaned_page)
 
@@ -38,6 +38,7 @@ class NormalizationConfig(BaseModel):
         entity_patterns_file: Path to entity patterns YAML (AC-2.2.7)
         entity_dictionary_file: Path to entity dictionary YAML (AC-2.2.3)
         entity_context_window: Context window size for entity disambiguation (AC-2.2.1)
+        block_workers: Worker processes for block-parallel normalization (None reads env)
         ocr_confidence_threshold: Minimum OCR confidence threshold (AC-2.4.2)
         ocr_preprocessing_enabled: Enable image preprocessing before OCR (AC-2.4.3)
         quarantine_low_confidence: Enable quarantine for low confidence (AC-2.4.5)
@@ -95,6 +96,17 @@ class NormalizationConfig(BaseModel):
         description="Context window size for entity disambiguation (AC-2.2.1)",
     )
 
+    # Block-Parallel Normalization
+    block_workers: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Worker processes for cleaning and entity recognition across pages, slides or "
+            "sheets of large documents (1 disables, 0 = one per CPU, None reads "
+            "DATA_EXTRACT_NORMALIZE_BLOCK_WORKERS)"
+        ),
+    )
+
     # Schema Standardization Flags (Story 2.3)
     enable_schema_standardization: bool = Field(
         default=True, description="Enable schema standardization across document types (AC-2.3.2)"
@@ -30,16 +30,87 @@ Implementation Note (Architectural Decision):
     (sentence boundaries, NER), it can be added without breaking the current API.
 """
 
+import bisect
 import hashlib
 import re
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
 from ..core.models import Document, Entity, EntityType, ProcessingContext
 
+_TOKEN_PATTERN = re.compile(r"\S+")
+# Anchors, lookarounds and backreferences behave differently on a word than on
+# the full text (or break when patterns are combined).
+_WORD_SCAN_UNSAFE = re.compile(r"\(\?<?[=!]|\(\?P=|\\[AZz1-9]|(?<![\[\\])\^|(?<!\\)\$")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex matching any of ``words``, factored into a prefix trie.
+
+    Longer words are preferred where one word is a prefix of another.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: Dict[str, Any]) -> str:
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # A word ending here makes the rest optional; greedy matching tries longer words first.
+    return f"(?:{body})?" if "" in node else body
+
+
+def _first_partial_matches(keys: List[str], queries: Iterable[str]) -> Dict[str, str]:
+    """Map each query to the first key (in ``keys`` order) it contains or is contained in.
+
+    Every query must itself be one of ``keys``. Instead of comparing each query
+    with every key, both directions are answered by slicing substrings of the
+    lengths that can occur: a query's substrings at key lengths are looked up in
+    a key index, and each key's substrings at query lengths are looked up in the
+    query set. Cost is linear in the number of keys for bounded mention length.
+    """
+    order = {key: index for index, key in enumerate(keys)}
+    best = {query: order[query] for query in queries}
+    if not best:
+        return {}
+    key_lengths = sorted({len(key) for key in keys})
+    query_lengths = sorted({len(query) for query in best})
+
+    # Keys that are substrings of a query
+    for query, first in best.items():
+        size = len(query)
+        for length in key_lengths:
+            if length >= size:
+                break
+            for start in range(size - length + 1):
+                index = order.get(query[start : start + length])
+                if index is not None and index < first:
+                    first = index
+        best[query] = first
+
+    # Keys that contain a query
+    for index, key in enumerate(keys):
+        size = len(key)
+        for length in query_lengths:
+            if length >= size:
+                break
+            for start in range(size - length + 1):
+                piece = key[start : start + length]
+                if best.get(piece, -1) > index:
+                    best[piece] = index
+
+    return {query: keys[index] for query, index in best.items()}
+
 
 class EntityNormalizer:
     """Entity recognizer and normalizer for audit documents.
@@ -93,8 +164,15 @@ class EntityNormalizer:
         # Load abbreviation dictionary (AC-2.2.3)
         self.dictionary = self._load_dictionary(dictionary_file) if dictionary_file else {}
 
-        # Entity graph for cross-reference resolution (AC-2.2.5)
-        self.entity_graph: Dict[str, List[str]] = defaultdict(list)
+        # Combined entity pattern for whole-text candidate scans (AC-2.2.1)
+        self._scanner_source: Optional[Dict[EntityType, List[Dict[str, Any]]]] = None
+        self._scanner: Optional["re.Pattern[str]"] = None
+
+        # Dictionary-wide abbreviation matcher, compiled on first use (AC-2.2.3)
+        self._matcher_source: Optional[Dict[str, Dict[str, Any]]] = None
+        self._matcher: Optional[
+            Tuple["re.Pattern[str]", Dict[str, str], Dict[str, str], Dict[str, int]]
+        ] = None
 
     def _load_patterns(self, patterns_file: Path) -> Dict[EntityType, List[Dict[str, Any]]]:
         """Load and compile entity recognition patterns from YAML.
@@ -293,6 +371,13 @@ class EntityNormalizer:
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """Expand abbreviations using dictionary with context awareness.
 
+        All dictionary entries are found in one scan of the text with a
+        precompiled matcher (see ``_abbreviation_matcher``). Entries are then
+        applied in dictionary order: each abbreviation is expanded at its first
+        occurrence that passes the context check, where context is read as if
+        earlier entries had already been expanded. Where entries overlap in the
+        text, the longest match wins.
+
         Args:
             text: Input text with abbreviations
             context_window: Words before/after for context checking (AC-2.2.3)
@@ -304,59 +389,168 @@ class EntityNormalizer:
             >>> normalizer.expand_abbreviations("GRC framework review")
             ("Governance, Risk, and Compliance framework review", [...])
         """
-        expanded_text = text
+        matcher = self._abbreviation_matcher()
+        if matcher is None or not text:
+            return text, []
+        pattern, case_sensitive_keys, case_insensitive_keys, order = matcher
+
+        # Single pass: candidate matches per abbreviation, in text order
+        candidates: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for match in pattern.finditer(text):
+            if match.group(1) is not None:
+                abbrev = case_sensitive_keys[match.group()]
+            else:
+                abbrev = case_insensitive_keys[match.group().lower()]
+            spans = candidates[abbrev]
+            # Only context-dependent entries can need more than their first match
+            if not spans or self.dictionary[abbrev].get("context_required", False):
+                spans.append(match.span())
+
+        # Expansions applied so far, sorted by start offset in ``text``
+        starts: List[int] = []
+        applied: List[Tuple[int, int, str]] = []
         expansion_log: List[Dict[str, Any]] = []
 
-        for abbrev, entry in self.dictionary.items():
-            # Build regex pattern for abbreviation
-            case_sensitive = entry.get("case_sensitive", False)
-            flags = 0 if case_sensitive else re.IGNORECASE
-
-            # Try main abbreviation
-            pattern = re.compile(rf"\b{re.escape(abbrev)}\b", flags)
-
-            # Find all matches
-            for match in pattern.finditer(expanded_text):
-                match_pos = match.start()
-                match_text = match.group()
-
+        for abbrev in sorted(candidates, key=order.__getitem__):
+            entry = self.dictionary[abbrev]
+            context_keywords = (
+                entry.get("context_keywords", []) if entry.get("context_required", False) else []
+            )
+            for match_start, match_end in candidates[abbrev]:
                 # Context checking for disambiguation (AC-2.2.3)
-                if entry.get("context_required", False):
-                    context_keywords = entry.get("context_keywords", [])
-                    if context_keywords:
-                        # Get surrounding words
-                        before_text = expanded_text[max(0, match_pos - 50) : match_pos]
-                        after_text = expanded_text[
-                            match_pos : min(len(expanded_text), match_pos + 50)
-                        ]
-                        context_text = (before_text + " " + after_text).lower()
-
-                        # Check if any keyword present
-                        has_context = any(kw.lower() in context_text for kw in context_keywords)
-                        if not has_context:
-                            continue  # Skip expansion due to missing context
+                if context_keywords:
+                    before_text, after_text = self._expanded_context(
+                        text, starts, applied, match_start
+                    )
+                    context_text = (before_text + " " + after_text).lower()
+
+                    # Check if any keyword present
+                    has_context = any(kw.lower() in context_text for kw in context_keywords)
+                    if not has_context:
+                        continue  # Skip expansion due to missing context
 
                 # Perform expansion
                 full_form = entry["full_form"]
-                expanded_text = (
-                    expanded_text[: match.start()] + full_form + expanded_text[match.end() :]
+                index = bisect.bisect_left(starts, match_start)
+                position = match_start + sum(
+                    len(expansion) - (end - start) for start, end, expansion in applied[:index]
                 )
+                starts.insert(index, match_start)
+                applied.insert(index, (match_start, match_end, full_form))
 
                 # Log expansion for audit trail (AC-2.2.3)
                 expansion_log.append(
                     {
-                        "abbreviation": match_text,
+                        "abbreviation": text[match_start:match_end],
                         "expansion": full_form,
-                        "position": match_pos,
+                        "position": position,
                         "category": entry.get("category", "unknown"),
                     }
                 )
 
                 # Note: Only expand first occurrence to avoid conflicts
-                # Re-find matches after modification would be needed for multiple expansions
                 break
 
-        return expanded_text, expansion_log
+        if not applied:
+            return text, expansion_log
+        pieces: List[str] = []
+        cursor = 0
+        for start, end, expansion in applied:
+            pieces.append(text[cursor:start])
+            pieces.append(expansion)
+            cursor = end
+        pieces.append(text[cursor:])
+        return "".join(pieces), expansion_log
+
+    @staticmethod
+    def _expanded_context(
+        text: str,
+        starts: List[int],
+        applied: List[Tuple[int, int, str]],
+        position: int,
+        width: int = 50,
+    ) -> Tuple[str, str]:
+        """Return ``width`` characters before and from ``position`` in the expanded text.
+
+        The expanded text is never materialised; only the pieces around
+        ``position`` are stitched together from ``text`` and ``applied``.
+        """
+        before: List[str] = []
+        length = 0
+        index = bisect.bisect_left(starts, position) - 1
+        cursor = position
+        while length < width:
+            piece_start = applied[index][1] if index >= 0 else 0
+            before.append(text[piece_start:cursor])
+            length += cursor - piece_start
+            if index < 0:
+                break
+            before.append(applied[index][2])
+            length += len(applied[index][2])
+            cursor = applied[index][0]
+            index -= 1
+
+        after: List[str] = []
+        length = 0
+        index = bisect.bisect_right(starts, position)
+        cursor = position
+        while length < width:
+            piece_end = applied[index][0] if index < len(applied) else len(text)
+            after.append(text[cursor:piece_end])
+            length += piece_end - cursor
+            if index >= len(applied):
+                break
+            after.append(applied[index][2])
+            length += len(applied[index][2])
+            cursor = applied[index][1]
+            index += 1
+
+        return "".join(reversed(before))[-width:], "".join(after)[:width]
+
+    def _abbreviation_matcher(
+        self,
+    ) -> Optional[Tuple["re.Pattern[str]", Dict[str, str], Dict[str, str], Dict[str, int]]]:
+        """Return the dictionary-wide matcher, compiling it on first use.
+
+        Keys are folded into prefix tries so the regex engine walks each
+        position character by character instead of trying every entry. Group 1
+        holds case-sensitive matches; the rest are matched case-insensitively.
+        The matcher is rebuilt if ``self.dictionary`` is replaced.
+
+        Returns:
+            (pattern, case-sensitive lookup, lowercased lookup, dictionary order),
+            or None when the dictionary is empty
+        """
+        if self._matcher_source is self.dictionary:
+            return self._matcher
+        case_sensitive_keys: Dict[str, str] = {}
+        case_insensitive_keys: Dict[str, str] = {}
+        order: Dict[str, int] = {}
+        for index, (abbrev, entry) in enumerate(self.dictionary.items()):
+            if not abbrev:
+                continue
+            order[abbrev] = index
+            if entry.get("case_sensitive", False):
+                case_sensitive_keys.setdefault(abbrev, abbrev)
+            else:
+                case_insensitive_keys.setdefault(abbrev.lower(), abbrev)
+
+        matcher = None
+        if order:
+            # Group 1 must exist even when there are no case-sensitive entries.
+            sensitive = _trie_pattern(case_sensitive_keys) or "(?!)"
+            alternatives = [rf"\b({sensitive})\b"]
+            if case_insensitive_keys:
+                alternatives.append(rf"\b(?i:{_trie_pattern(case_insensitive_keys)})\b")
+            matcher = (
+                re.compile("|".join(alternatives)),
+                case_sensitive_keys,
+                case_insensitive_keys,
+                order,
+            )
+        self._matcher_source = self.dictionary
+        self._matcher = matcher
+        return matcher
 
     def resolve_cross_references(self, entities: List[Entity]) -> List[Entity]:
         """Link entity mentions to canonical IDs and build entity graph.
@@ -378,20 +572,19 @@ class EntityNormalizer:
         for entity in entities:
             canonical_map[entity.text.lower()] = entity.id
 
-        # Resolve references
+        # Low-confidence mentions resolve to the first canonical text (in mention
+        # order) that contains them or that they contain.
+        partial_matches = _first_partial_matches(
+            list(canonical_map),
+            {entity.text.lower() for entity in entities if entity.confidence < 0.9},
+        )
+
+        # Resolve references (AC-2.2.5) in one pass
         resolved_entities = []
         for entity in entities:
-            # Check if this is a reference to another entity
-            # (same type, partial text match)
             resolved_id = entity.id
-
-            for canonical_text, canonical_id in canonical_map.items():
-                # Partial match logic
-                if entity.text.lower() in canonical_text or canonical_text in entity.text.lower():
-                    # Use the canonical ID with higher confidence
-                    if entity.confidence < 0.9:
-                        resolved_id = canonical_id
-                        break
+            if entity.confidence < 0.9:
+                resolved_id = canonical_map[partial_matches[entity.text.lower()]]
 
             # Update entity with resolved ID
             resolved_entity = Entity(
@@ -403,11 +596,78 @@ class EntityNormalizer:
             )
             resolved_entities.append(resolved_entity)
 
-            # Build entity graph (AC-2.2.5)
-            self.entity_graph[resolved_id].append(entity.text)
-
         return resolved_entities
 
+    @staticmethod
+    def build_entity_graph(resolved_entities: List[Entity]) -> Dict[str, List[str]]:
+        """Group the mentions of resolved entities by canonical ID (AC-2.2.5).
+
+        Built per call rather than kept on the normalizer, which is shared across
+        documents and threads.
+
+        Args:
+            resolved_entities: Output of ``resolve_cross_references``
+
+        Returns:
+            Canonical entity ID -> mention texts, in mention order
+        """
+        entity_graph: Dict[str, List[str]] = defaultdict(list)
+        for entity in resolved_entities:
+            entity_graph[entity.id].append(entity.text)
+        return dict(entity_graph)
+
+    def _candidate_token_indexes(self, text: str, tokens: List["re.Match[str]"]) -> List[int]:
+        """Return indexes of tokens that any entity pattern can match, in order.
+
+        One combined pattern is searched through the whole text. Each search
+        resumes at the token after the one a match starts in, so a match
+        spanning several words cannot hide a later single-word match. Only
+        these candidates are classified with ``recognize_entity_type``.
+        """
+        scanner = self._entity_scanner()
+        if scanner is None:
+            return list(range(len(tokens))) if self.patterns else []
+
+        starts = [token.start() for token in tokens]
+        candidates: List[int] = []
+        position = 0
+        while True:
+            match = scanner.search(text, position)
+            if match is None:
+                break
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if index >= 0 and match.start() < tokens[index].end():
+                candidates.append(index)
+            if index + 1 >= len(tokens):
+                break
+            position = starts[index + 1]
+        return candidates
+
+    def _entity_scanner(self) -> Optional["re.Pattern[str]"]:
+        """Return all entity patterns combined into one regex, compiled on first use.
+
+        A pattern matching inside a word also matches at the same offset of the
+        full text unless it anchors or looks beyond the word, so such patterns
+        (and ones the combination would break, e.g. backreferences) disable the
+        combined scan; every word is then classified individually.
+        """
+        if self._scanner_source is self.patterns:
+            return self._scanner
+        raw_patterns = [
+            pattern_entry["raw_pattern"]
+            for patterns_list in self.patterns.values()
+            for pattern_entry in patterns_list
+        ]
+        scanner = None
+        if raw_patterns and not any(_WORD_SCAN_UNSAFE.search(raw) for raw in raw_patterns):
+            try:
+                scanner = re.compile("|".join(f"(?:{raw})" for raw in raw_patterns))
+            except re.error:
+                scanner = None
+        self._scanner_source = self.patterns
+        self._scanner = scanner
+        return scanner
+
     def process(self, document: Document, context: ProcessingContext) -> Document:
         """Process document to recognize and normalize entities.
 
@@ -426,7 +686,23 @@ class EntityNormalizer:
             >>> len(normalized.entities)  # Entities recognized
             1
         """
-        text = document.text
+        entities, _ = self.recognize_entities(document.text)
+        return self.annotate(document, entities)
+
+    def recognize_entities(self, text: str) -> Tuple[List[Entity], str]:
+        """Expand abbreviations in ``text`` and recognize entity mentions (AC-2.2.1, AC-2.2.3).
+
+        Cross-references are not resolved here, so mentions recognized in
+        separate blocks of a document can be merged and resolved together by
+        ``annotate``.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Tuple of (entities in text order, expanded text). Entity locations
+            are character offsets into the expanded text.
+        """
         entities: List[Entity] = []
 
         # Step 1: Expand abbreviations (AC-2.2.3)
@@ -438,9 +714,13 @@ class EntityNormalizer:
             )
 
         # Step 2: Recognize entities using patterns (AC-2.2.1)
-        words = expanded_text.split()
-        for i, word in enumerate(words):
-            # Get context window
+        # Tokens are whitespace-delimited words with their true character offsets.
+        tokens = list(_TOKEN_PATTERN.finditer(expanded_text))
+        words = [token.group() for token in tokens]
+        for i in self._candidate_token_indexes(expanded_text, tokens):
+            word = words[i]
+
+            # Get context window (only built for candidate words)
             start_idx = max(0, i - self.context_window)
             end_idx = min(len(words), i + self.context_window + 1)
             context_words = words[start_idx:end_idx]
@@ -449,10 +729,7 @@ class EntityNormalizer:
             result = self.recognize_entity_type(word, context_words)
             if result:
                 entity_type, confidence = result
-
-                # Calculate character position (approximate)
-                char_position = len(" ".join(words[:i]))
-                location = {"start": char_position, "end": char_position + len(word)}
+                location = {"start": tokens[i].start(), "end": tokens[i].end()}
 
                 # Standardize entity ID (AC-2.2.2)
                 canonical_id = self.standardize_entity_id(word, entity_type)
@@ -467,6 +744,18 @@ class EntityNormalizer:
                 )
                 entities.append(entity)
 
+        return entities, expanded_text
+
+    def annotate(self, document: Document, entities: List[Entity]) -> Document:
+        """Resolve cross-references and attach entities to ``document`` (AC-2.2.5, AC-2.2.6).
+
+        Args:
+            document: Document the entities were recognized in
+            entities: Recognized entities in text order
+
+        Returns:
+            Document with resolved entities, ``entity_tags`` and ``entity_counts``
+        """
         # Step 3: Resolve cross-references (AC-2.2.5)
         entities = self.resolve_cross_references(entities)
 
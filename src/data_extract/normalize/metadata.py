@@ -10,7 +10,6 @@ This module provides metadata enrichment functionality for the normalization pip
 All functions support the continue-on-error pattern (ADR-006) and structured logging.
 """
 
-import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -21,6 +20,7 @@ from ..core.models import (
     Metadata,
     ValidationReport,
 )
+from ..utils.fingerprint import get_fingerprint_service
 from .config import NormalizationConfig
 
 
@@ -58,14 +58,8 @@ def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
         raise ProcessingError(f"Path is not a file: {file_path}")
 
     try:
-        sha256_hash = hashlib.sha256()
-
-        with open(file_path, "rb") as f:
-            # Read file in chunks for memory efficiency
-            while chunk := f.read(chunk_size):
-                sha256_hash.update(chunk)
-
-        return sha256_hash.hexdigest()
+        # Shared with extraction and batch state, so each file is read once per run
+        return get_fingerprint_service().fingerprint(file_path, chunk_size)
 
     except PermissionError as e:
         raise ProcessingError(f"Permission denied reading file: {file_path}") from e
@@ -14,6 +14,7 @@ import structlog
 
 from ..core.exceptions import CriticalError, ProcessingError
 from ..core.models import Document, ProcessingContext
+from .blocks import normalize_blocks
 from .cleaning import TextCleaner
 from .config import NormalizationConfig
 from .entities import EntityNormalizer
@@ -30,6 +31,7 @@ class Normalizer:
 
     Orchestrates:
     - Text cleaning via TextCleaner (Story 2.1)
+    - Block-parallel cleaning and entity recognition for large paged documents
     - Entity normalization via EntityNormalizer (Story 2.2)
     - Schema standardization via SchemaStandardizer (Story 2.3)
     - OCR quality validation via QualityValidator (Story 2.4)
@@ -136,10 +138,21 @@ class Normalizer:
             # Extract text from document
             raw_text = document.text
 
-            # Clean text using TextCleaner
-            cleaned_text, cleaning_result = self.text_cleaner.clean_text(
-                raw_text, doc_type=document.metadata.document_type
-            )
+            # Clean text using TextCleaner, page/slide/sheet blocks in parallel
+            # for large structured documents (entities are recognized alongside)
+            block_run = normalize_blocks(self, document)
+            if block_run is None:
+                cleaned_text, cleaning_result = self.text_cleaner.clean_text(
+                    raw_text, doc_type=document.metadata.document_type
+                )
+            else:
+                cleaned_text, cleaning_result = block_run.text, block_run.cleaning_result
+                logger.info(
+                    "block_normalization_complete",
+                    document_id=document.id,
+                    blocks=block_run.block_count,
+                    workers=block_run.workers,
+                )
 
             # Log cleaning metrics
             logger.info(
@@ -184,9 +197,16 @@ class Normalizer:
             # Step 2: Entity normalization (Story 2.2) if enabled
             if self.entity_normalizer:
                 try:
-                    normalized_document = self.entity_normalizer.process(
-                        intermediate_document, context
-                    )
+                    if block_run is None:
+                        normalized_document = self.entity_normalizer.process(
+                            intermediate_document, context
+                        )
+                    elif block_run.entity_error:
+                        raise ProcessingError(block_run.entity_error)
+                    else:
+                        normalized_document = self.entity_normalizer.annotate(
+                            intermediate_document, block_run.entities or []
+                        )
                     logger.info(
                         "entity_normalization_complete",
                         document_id=document.id,
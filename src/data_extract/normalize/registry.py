@@ -0,0 +1,130 @@
+"""Process-wide registry of ready-to-use Normalizer instances.
+
+Building a ``Normalizer`` parses and compiles the cleaning rules, entity
+patterns, abbreviation dictionary and schema templates, and probes for
+Tesseract. The registry does that once per distinct configuration and shares
+the result across documents, threads and ``PipelineService`` instances.
+
+Entries are keyed by the ``NormalizationConfig`` values plus the size and
+modification time of every resource file the config points at, so editing a
+YAML file picks up a freshly compiled normalizer on the next lookup.
+
+Key functions:
+- get_shared_normalizer(): Normalizer for a config, built on first use
+- normalizer_resource_key(): Cache key for a config and its resource files
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+from .config import NormalizationConfig
+from .normalizer import Normalizer
+
+logger = structlog.get_logger(__name__)
+
+# Config fields naming YAML resources that are compiled into the normalizer
+RESOURCE_FILE_FIELDS = (
+    "ocr_artifact_patterns_file",
+    "header_footer_patterns_file",
+    "entity_patterns_file",
+    "entity_dictionary_file",
+    "schema_templates_file",
+)
+
+ResourceKey = Tuple[str, Tuple[Tuple[str, Optional[int], Optional[int]], ...]]
+
+
+def normalizer_resource_key(config: NormalizationConfig) -> ResourceKey:
+    """Return the cache key for ``config``: its values plus resource file stats.
+
+    Missing files are keyed as ``(None, None)`` so creating one later also
+    invalidates the entry.
+    """
+    files: List[Tuple[str, Optional[int], Optional[int]]] = []
+    for field_name in RESOURCE_FILE_FIELDS:
+        path = getattr(config, field_name)
+        if path is None:
+            continue
+        try:
+            stat = os.stat(path)
+            files.append((str(path), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            files.append((str(path), None, None))
+    return config.model_dump_json(), tuple(files)
+
+
+class NormalizerRegistry:
+    """Thread-safe cache of compiled normalizers keyed by ``normalizer_resource_key``.
+
+    Only the newest entry per configuration is kept: when a resource file
+    changes, the stale normalizer is dropped as the new one is stored.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[ResourceKey, Normalizer] = {}
+        self.loads = 0
+        self.hits = 0
+
+    def acquire(self, config: Optional[NormalizationConfig] = None) -> Tuple[Normalizer, float]:
+        """Return the shared normalizer for ``config`` and the load time it cost.
+
+        The load time (milliseconds) is non-zero only for the caller that
+        built the normalizer, so it is reported once per process rather than
+        once per document. Concurrent callers for the same key wait for a
+        single build.
+        """
+        config = config or NormalizationConfig()
+        key = normalizer_resource_key(config)
+        with self._lock:
+            normalizer = self._entries.get(key)
+            if normalizer is not None:
+                self.hits += 1
+                return normalizer, 0.0
+
+            start = time.perf_counter()
+            normalizer = Normalizer(config)
+            load_ms = (time.perf_counter() - start) * 1000
+            for stale_key in [entry for entry in self._entries if entry[0] == key[0]]:
+                del self._entries[stale_key]
+            self._entries[key] = normalizer
+            self.loads += 1
+
+        logger.debug("normalizer_resources_loaded", load_ms=round(load_ms, 2))
+        return normalizer, load_ms
+
+    def get(self, config: Optional[NormalizationConfig] = None) -> Normalizer:
+        """Return the shared normalizer for ``config``."""
+        return self.acquire(config)[0]
+
+    def clear(self) -> None:
+        """Drop all cached normalizers (the next lookup rebuilds)."""
+        with self._lock:
+            self._entries.clear()
+
+
+_registry = NormalizerRegistry()
+
+
+def get_normalizer_registry() -> NormalizerRegistry:
+    """Return the process-wide normalizer registry."""
+    return _registry
+
+
+def get_shared_normalizer(config: Optional[NormalizationConfig] = None) -> Normalizer:
+    """Return the process-wide normalizer for ``config`` (default config if omitted)."""
+    return _registry.get(config)
+
+
+def _reset_registry_lock_after_fork() -> None:
+    # A fork while another thread held the lock would leave it locked forever in
+    # the child; cached normalizers themselves are safe to inherit.
+    _registry._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_registry_lock_after_fork)
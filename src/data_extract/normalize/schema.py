@@ -50,7 +50,6 @@ class SchemaStandardizer(PipelineStage[Document, Document]):
         self.logger = logger or structlog.get_logger(__name__)
         self.enable_standardization = enable_standardization
         self.field_mappings: Dict[str, Any] = {}
-        self.field_mapping_traceability: Dict[str, str] = {}  # source -> output mapping
 
         # Load schema templates from file or dict
         if schema_templates:
@@ -94,22 +93,42 @@ class SchemaStandardizer(PipelineStage[Document, Document]):
         mapping = self._get_field_mapping(doc_type, doc_subtype)
 
         for source_field, value in fields.items():
-            # Try to find mapping for this field
-            standardized_name = mapping.get(source_field, source_field)
+            standardized[self._standardized_name(source_field, mapping)] = value
 
-            # Also check common aliases
-            if standardized_name == source_field and "common_aliases" in self.field_mappings:
-                standardized_name = self.field_mappings["common_aliases"].get(
-                    source_field, source_field
-                )
+        return standardized
 
-            standardized[standardized_name] = value
+    def trace_field_mappings(
+        self,
+        fields: Dict[str, Any],
+        doc_type: DocumentType,
+        doc_subtype: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Report which source fields ``standardize_field_names`` renames.
 
-            # Track mapping for traceability
-            if standardized_name != source_field:
-                self.field_mapping_traceability[source_field] = standardized_name
+        Args:
+            fields: Dictionary of source fields
+            doc_type: Document type (REPORT, MATRIX, EXPORT, IMAGE)
+            doc_subtype: Document subtype (e.g., Archer module name)
 
-        return standardized
+        Returns:
+            Source field name -> standardized name, for renamed fields only
+        """
+        mapping = self._get_field_mapping(doc_type, doc_subtype)
+        traceability = {}
+        for source_field in fields:
+            standardized_name = self._standardized_name(source_field, mapping)
+            if standardized_name != source_field:
+                traceability[source_field] = standardized_name
+        return traceability
+
+    def _standardized_name(self, source_field: str, mapping: Dict[str, Any]) -> Any:
+        """Map one source field name, falling back to the common aliases."""
+        standardized_name = mapping.get(source_field, source_field)
+        if standardized_name == source_field and "common_aliases" in self.field_mappings:
+            standardized_name = self.field_mappings["common_aliases"].get(
+                source_field, source_field
+            )
+        return standardized_name
 
     def _get_field_mapping(
         self, doc_type: DocumentType, doc_subtype: Optional[str] = None
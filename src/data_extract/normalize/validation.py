@@ -37,6 +37,8 @@ from ..core.pipeline import PipelineStage
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_OCR_CONFIDENCE_THRESHOLD = 0.95
+
 
 def _validate_override_path(path_str: str, expected_type: str = "file") -> Optional[Path]:
     """Validate override path is safe and exists.
@@ -224,7 +226,7 @@ class QualityValidator(PipelineStage[Document, Document]):
 
     def __init__(
         self,
-        ocr_confidence_threshold: float = 0.95,
+        ocr_confidence_threshold: float = DEFAULT_OCR_CONFIDENCE_THRESHOLD,
         ocr_preprocessing_enabled: bool = True,
         quarantine_low_confidence: bool = True,
         completeness_threshold: float = 0.90,
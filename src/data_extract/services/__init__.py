@@ -14,6 +14,14 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "data_extract.services.file_discovery_service",
         "FileDiscoveryService",
     ),
+    "FingerprintService": (
+        "data_extract.services.fingerprint_service",
+        "FingerprintService",
+    ),
+    "get_fingerprint_service": (
+        "data_extract.services.fingerprint_service",
+        "get_fingerprint_service",
+    ),
     "PipelineService": ("data_extract.services.pipeline_service", "PipelineService"),
     "JobService": ("data_extract.services.job_service", "JobService"),
     "RetryService": ("data_extract.services.retry_service", "RetryService"),
@@ -3,11 +3,148 @@
 from __future__ import annotations
 
 import glob
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from data_extract.extract import SUPPORTED_EXTENSIONS
 
+DISCOVERY_WORKERS_ENV = "DATA_EXTRACT_DISCOVERY_WORKERS"
+DEFAULT_DISCOVERY_WORKERS = 8
+
+
+def resolve_discovery_workers() -> int:
+    """Resolve directory-scan threads from ``DATA_EXTRACT_DISCOVERY_WORKERS``.
+
+    Directory listing is latency-bound (especially on network shares), so the
+    default is a fixed small pool rather than one derived from the CPU count.
+    """
+    raw_value = os.environ.get(DISCOVERY_WORKERS_ENV, "").strip()
+    try:
+        workers = int(raw_value) if raw_value else DEFAULT_DISCOVERY_WORKERS
+    except ValueError:
+        workers = DEFAULT_DISCOVERY_WORKERS
+    return max(1, workers)
+
+
+class DirectoryWalker:
+    """Walk a directory tree with parallel ``os.scandir`` calls, yielding files as found.
+
+    Each directory is listed by one task on a small thread pool; files are
+    yielded as soon as their directory has been read, so consumers can start
+    work long before the walk finishes. Excluded directories are pruned before
+    they are listed. Symlinked directories are not descended (which also rules
+    out cycles); symlinked files are yielded as their resolved target and are
+    filtered and excluded by that target, not by the link name.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        exclude_paths: Iterable[Path] | None = None,
+        file_filter: Optional[Callable[[str], bool]] = None,
+        resolve: bool = True,
+    ) -> None:
+        """Initialize the walker.
+
+        Args:
+            workers: Scan threads (default: ``resolve_discovery_workers()``)
+            exclude_paths: Directories (pruned) or files (skipped) to leave out
+            file_filter: Predicate on the file name (the target's name for resolved
+                symlinks); rejected files are never stat'ed
+            resolve: Yield resolved paths; when False, paths are joined onto the
+                root as given and symlinked files are yielded as the link itself
+        """
+        self.workers = workers or resolve_discovery_workers()
+        self.excluded = {str(path.resolve()) for path in (exclude_paths or [])}
+        self.file_filter = file_filter
+        self.resolve = resolve
+
+    def walk(self, root: Path, recursive: bool = True) -> Iterator[Path]:
+        """Yield files under ``root`` (in no particular order)."""
+        root_text = str(root.resolve() if self.resolve else root)
+        if self._is_excluded(root_text):
+            return
+        if not recursive or self.workers == 1:
+            yield from self._walk_sequential(root_text, recursive)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="data-extract-discovery"
+        )
+        pending: set[Future[Tuple[List[str], List[str]]]] = {executor.submit(self._scan, root_text)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    for subdir in subdirs:
+                        pending.add(executor.submit(self._scan, subdir))
+                    for file_path in files:
+                        yield Path(file_path)
+        finally:
+            # Closing the generator early abandons the rest of the walk.
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _walk_sequential(self, root_text: str, recursive: bool) -> Iterator[Path]:
+        stack = [root_text]
+        while stack:
+            files, subdirs = self._scan(stack.pop())
+            for file_path in files:
+                yield Path(file_path)
+            if recursive:
+                stack.extend(reversed(subdirs))
+
+    def _scan(self, directory: str) -> Tuple[List[str], List[str]]:
+        """List one directory, returning (files, subdirectories to descend)."""
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Unreadable or vanished directories are skipped, as pathlib globbing does.
+            return files, subdirs
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in self.excluded:
+                            subdirs.append(entry.path)
+                        continue
+                    file_path = entry.path
+                    if self.resolve and entry.is_symlink():
+                        # Judge a symlinked file by its target, which may have another
+                        # suffix or live under an excluded directory.
+                        file_path = os.path.realpath(file_path)
+                        if self._is_excluded(file_path):
+                            continue
+                    name = os.path.basename(file_path)
+                    if self.file_filter is not None and not self.file_filter(name):
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                if file_path not in self.excluded:
+                    files.append(file_path)
+        return files, subdirs
+
+    def _is_excluded(self, path_text: str) -> bool:
+        """Return True when a path is excluded or lies under an excluded directory."""
+        return any(
+            path_text == excluded or path_text.startswith(excluded.rstrip(os.sep) + os.sep)
+            for excluded in self.excluded
+        )
+
+
+def is_supported_name(name: str) -> bool:
+    """Return True when a file name has an extension an extractor supports."""
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS
+
 
 class FileDiscoveryService:
     """Discover source files from paths, directories, and glob patterns."""
@@ -24,30 +161,61 @@ class FileDiscoveryService:
         recursive: bool = False,
         exclude_paths: Iterable[Path] | None = None,
     ) -> Tuple[List[Path], Path]:
-        """Resolve files and return (file_list, source_dir)."""
+        """Resolve files and return (sorted file_list, source_dir)."""
+        files = self.iter_files(input_path, recursive=recursive, exclude_paths=exclude_paths)
+        return sorted(set(files)), self.source_dir_for(input_path)
+
+    def iter_files(
+        self,
+        input_path: str | Path,
+        recursive: bool = False,
+        exclude_paths: Iterable[Path] | None = None,
+    ) -> Iterator[Path]:
+        """Yield resolved supported files as they are found, in no particular order.
+
+        A file reachable through several symlinks may be yielded more than once;
+        ``discover`` de-duplicates. Excluded directories, such as an output directory inside the source
+        tree, are pruned without being listed.
+
+        Raises:
+            FileNotFoundError: If a non-glob input path does not exist
+        """
         excludes = [path.resolve() for path in (exclude_paths or [])]
         input_str = str(input_path)
         if self.is_glob_pattern(input_str):
-            files = self._discover_from_glob(input_str, excludes)
-            return files, self._glob_source_dir(input_str)
+            yield from self._discover_from_glob(input_str, excludes)
+            return
 
         resolved = Path(input_str)
         if not resolved.exists():
             raise FileNotFoundError(f"Source not found: {resolved}")
 
         if resolved.is_file():
-            return self._filter_supported([resolved], excludes), resolved.parent
+            yield from self._filter_supported([resolved], excludes)
+            return
 
-        pattern = "**/*" if recursive else "*"
-        files = [p for p in resolved.glob(pattern) if p.is_file()]
-        return self._filter_supported(files, excludes), resolved
+        walker = DirectoryWalker(exclude_paths=excludes, file_filter=is_supported_name)
+        yield from walker.walk(resolved, recursive=recursive)
 
-    def _discover_from_glob(self, pattern: str, excludes: Iterable[Path]) -> List[Path]:
-        """Expand glob pattern and filter to supported source files."""
+    def source_dir_for(self, input_path: str | Path) -> Path:
+        """Return the source root discovery would report, without walking it."""
+        input_str = str(input_path)
+        if self.is_glob_pattern(input_str):
+            return self._glob_source_dir(input_str)
+        resolved = Path(input_str)
+        return resolved.parent if resolved.is_file() else resolved
+
+    def _discover_from_glob(self, pattern: str, excludes: Iterable[Path]) -> Iterator[Path]:
+        """Expand glob pattern lazily and filter to supported source files."""
         expanded_pattern = str(Path(pattern).expanduser())
-        matches = glob.glob(expanded_pattern, recursive=True)
-        files = [Path(match) for match in matches if Path(match).is_file()]
-        return self._filter_supported(files, excludes)
+        seen: set[Path] = set()
+        for match in glob.iglob(expanded_pattern, recursive=True):
+            if not is_supported_name(match) or not os.path.isfile(match):
+                continue
+            for file_path in self._filter_supported([Path(match)], excludes):
+                if file_path not in seen:
+                    seen.add(file_path)
+                    yield file_path
 
     def _glob_source_dir(self, pattern: str) -> Path:
         """Return deterministic source root for a glob pattern."""
@@ -0,0 +1,25 @@
+"""Service-layer access to the shared file fingerprint cache.
+
+The implementation lives in ``data_extract.utils.fingerprint`` so extraction and
+normalization can use it without depending on the service layer.
+"""
+
+from __future__ import annotations
+
+from data_extract.utils.fingerprint import (
+    DEFAULT_FINGERPRINT_CACHE,
+    FINGERPRINT_CACHE_ENV,
+    FileIdentity,
+    FingerprintService,
+    get_fingerprint_service,
+    resolve_fingerprint_cache_path,
+)
+
+__all__ = [
+    "DEFAULT_FINGERPRINT_CACHE",
+    "FINGERPRINT_CACHE_ENV",
+    "FileIdentity",
+    "FingerprintService",
+    "get_fingerprint_service",
+    "resolve_fingerprint_cache_path",
+]
@@ -5,11 +5,14 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, List, Optional
 
+import structlog
+
 from data_extract.cli.exit_codes import determine_exit_code
 from data_extract.cli.session import SessionManager, SessionState
 from data_extract.contracts import (
@@ -30,10 +33,135 @@ from data_extract.services.persistence_repository import (
     TERMINAL_STATUSES,
     PersistenceRepository,
 )
-from data_extract.services.pipeline_service import PipelineService
+from data_extract.services.pipeline_service import (
+    PipelineFileResult,
+    PipelineOutcome,
+    PipelineService,
+)
 from data_extract.services.run_config_resolver import RunConfigResolver
 from data_extract.services.semantic_orchestration_service import SemanticOrchestrationService
 
+logger = structlog.get_logger(__name__)
+
+
+class _RunCheckpoint:
+    """Record each pipeline outcome as soon as its file finishes.
+
+    Session outcomes go straight to the session journal, so a resumed run skips
+    every completed file. ``JobFile`` rows for API jobs are buffered and written
+    one transaction per group, and each group logs live throughput.
+    """
+
+    FLUSH_FILES = 50
+    FLUSH_SECONDS = 2.0
+
+    def __init__(
+        self,
+        manager: SessionManager,
+        persistence: PersistenceRepository,
+        job_id: Optional[str],
+        retry_counts: dict[str, int],
+        total_files: int,
+    ) -> None:
+        self.manager = manager
+        self.persistence = persistence
+        self.job_id = job_id
+        self.retry_counts = retry_counts
+        self.total_files = total_files
+        self.processed: List[ProcessedFileOutcome] = []
+        self.failed: List[FileFailure] = []
+        self._pending_rows: List[dict[str, Any]] = []
+        self._started = time.monotonic()
+        self._last_flush = self._started
+
+    def __call__(self, outcome: PipelineOutcome) -> None:
+        source_key = source_key_for_path(outcome.source_path)
+        normalized_source = normalized_path_text(outcome.source_path)
+        if isinstance(outcome, PipelineFileResult):
+            self.manager.record_processed_file(
+                file_path=outcome.source_path,
+                output_path=outcome.output_path,
+                file_hash="",
+                source_key=source_key,
+            )
+            self.processed.append(
+                ProcessedFileOutcome(
+                    path=str(outcome.source_path),
+                    output_path=str(outcome.output_path),
+                    chunk_count=outcome.chunk_count,
+                    stage_timings_ms=outcome.stage_timings_ms,
+                    source_key=source_key,
+                )
+            )
+            self._pending_rows.append(
+                {
+                    "source_path": str(outcome.source_path),
+                    "normalized_source_path": normalized_source,
+                    "output_path": str(outcome.output_path),
+                    "status": "processed",
+                    "chunk_count": outcome.chunk_count,
+                }
+            )
+        else:
+            retry_count = int(self.retry_counts.get(normalized_source, 0))
+            self.manager.record_failed_file(
+                file_path=outcome.source_path,
+                error_type=outcome.error_type,
+                error_message=outcome.error_message,
+                retry_count=retry_count,
+                source_key=source_key,
+            )
+            self.failed.append(
+                FileFailure(
+                    path=str(outcome.source_path),
+                    error_type=outcome.error_type,
+                    error_message=outcome.error_message,
+                    retry_count=retry_count,
+                    source_key=source_key,
+                )
+            )
+            self._pending_rows.append(
+                {
+                    "source_path": str(outcome.source_path),
+                    "normalized_source_path": normalized_source,
+                    "output_path": None,
+                    "status": "failed",
+                    "chunk_count": 0,
+                    "retry_count": retry_count,
+                    "error_type": outcome.error_type,
+                    "error_message": outcome.error_message,
+                }
+            )
+
+        if (
+            len(self._pending_rows) >= self.FLUSH_FILES
+            or time.monotonic() - self._last_flush >= self.FLUSH_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Make buffered outcomes durable and report progress."""
+        self.manager.flush_journal()
+        if self.job_id and self._pending_rows:
+            self.persistence.checkpoint_job_files(self.job_id, self._pending_rows)
+        self._pending_rows = []
+        self._last_flush = time.monotonic()
+
+        if not self.job_id:
+            # CLI runs render their own progress; keep stdout clean (e.g. --quiet).
+            return
+        done = len(self.processed) + len(self.failed)
+        elapsed = self._last_flush - self._started
+        logger.info(
+            "job_progress",
+            job_id=self.job_id,
+            session_id=self.manager.session_id,
+            done=done,
+            total=self.total_files,
+            failed=len(self.failed),
+            files_per_second=round(done / elapsed, 2) if elapsed > 0 else None,
+        )
+
 
 class JobService:
     """Orchestrate discovery, session state, and pipeline execution."""
@@ -63,14 +191,18 @@ class JobService:
     ) -> ProcessJobResult:
         """Execute a processing job and return structured outcome."""
         started_at = datetime.now(timezone.utc)
-        resolved_files, source_dir = self._resolve_files(request)
-
         resolved_config = self.config_resolver.resolve(request)
-        output_dir = self._resolve_output_dir(request, source_dir)
-        output_file_override: Optional[Path] = None
-        if (
+        explicit_output_file = bool(
             request.output_path
             and Path(request.output_path).suffix.lower() == f".{resolved_config.output_format}"
+        )
+        resolved_files, source_dir, output_dir = self._resolve_files(
+            request, prune_output=not explicit_output_file
+        )
+        output_file_override: Optional[Path] = None
+        if (
+            explicit_output_file
+            and request.output_path is not None
             and len(resolved_files) == 1
             and not request.per_chunk
             and not request.organize
@@ -101,7 +233,9 @@ class JobService:
             from data_extract.cli.batch import IncrementalProcessor
 
             incremental_processor = IncrementalProcessor(
-                source_dir=source_dir, output_dir=output_dir
+                source_dir=source_dir,
+                output_dir=output_dir,
+                paranoid=True if request.paranoid else None,
             )
             changes = incremental_processor.analyze()
             if not request.force:
@@ -152,11 +286,20 @@ class JobService:
                     remaining.append(file_path)
             resolved_files = remaining
 
+        checkpoint = _RunCheckpoint(
+            manager=manager,
+            persistence=self.persistence,
+            job_id=job_id,
+            retry_counts=prior_retry_counts or {},
+            total_files=len(resolved_files),
+        )
         run = self.pipeline.process_files(
             files=resolved_files,
             output_dir=output_dir,
             output_format=resolved_config.output_format,
             chunk_size=resolved_config.chunk_size,
+            workers=resolved_config.workers,
+            executor=resolved_config.executor,
             include_metadata=request.include_metadata,
             per_chunk=request.per_chunk,
             organize=request.organize,
@@ -168,7 +311,10 @@ class JobService:
             pipeline_profile=resolved_config.pipeline_profile,
             allow_advanced_fallback=resolved_config.allow_advanced_fallback,
             output_file_override=output_file_override,
+            segmentation_backend=resolved_config.segmentation_backend,
+            on_result=checkpoint,
         )
+        checkpoint.flush()
 
         semantic_outcome: SemanticOutcome | None = None
         if resolved_config.include_semantic:
@@ -212,50 +358,10 @@ class JobService:
                 message="Semantic stage not requested.",
             )
 
-        processed_outcomes: List[ProcessedFileOutcome] = []
-        failure_outcomes: List[FileFailure] = []
-        retry_counts = prior_retry_counts or {}
+        processed_outcomes = checkpoint.processed
+        failure_outcomes = checkpoint.failed
 
         if session_state:
-            for processed in run.processed:
-                source_key = source_key_for_path(processed.source_path)
-                manager.record_processed_file(
-                    file_path=processed.source_path,
-                    output_path=processed.output_path,
-                    file_hash="",
-                    source_key=source_key,
-                )
-                processed_outcomes.append(
-                    ProcessedFileOutcome(
-                        path=str(processed.source_path),
-                        output_path=str(processed.output_path),
-                        chunk_count=processed.chunk_count,
-                        stage_timings_ms=processed.stage_timings_ms,
-                        source_key=source_key,
-                    )
-                )
-
-            for failed in run.failed:
-                source_path_key = normalized_path_text(failed.source_path)
-                source_key = source_key_for_path(failed.source_path)
-                retry_count = int(retry_counts.get(source_path_key, 0))
-                manager.record_failed_file(
-                    file_path=failed.source_path,
-                    error_type=failed.error_type,
-                    error_message=failed.error_message,
-                    retry_count=retry_count,
-                    source_key=source_key,
-                )
-                failure_outcomes.append(
-                    FileFailure(
-                        path=str(failed.source_path),
-                        error_type=failed.error_type,
-                        error_message=failed.error_message,
-                        retry_count=retry_count,
-                        source_key=source_key,
-                    )
-                )
-
             manager.save_session()
             manager.complete_session()
 
@@ -351,8 +457,15 @@ class JobService:
 
         return result
 
-    def _resolve_files(self, request: ProcessJobRequest) -> tuple[List[Path], Path]:
-        """Resolve files to process from explicit list or path discovery."""
+    def _resolve_files(
+        self, request: ProcessJobRequest, prune_output: bool = True
+    ) -> tuple[List[Path], Path, Path]:
+        """Resolve files to process from explicit list or path discovery.
+
+        Returns (files, source_dir, output_dir). With ``prune_output`` the output
+        directory is excluded while walking, so large previous outputs inside the
+        source tree are never listed.
+        """
         if request.source_files:
             files = sorted({Path(p).resolve() for p in request.source_files}, key=lambda p: str(p))
             for file_path in files:
@@ -363,10 +476,18 @@ class JobService:
                 source_dir = common_root if common_root.is_dir() else common_root.parent
             else:
                 source_dir = Path(request.input_path).resolve()
-            return files, source_dir
+            return files, source_dir, self._resolve_output_dir(request, source_dir)
 
-        files, source_dir = self.discovery.discover(request.input_path, recursive=request.recursive)
-        return files, source_dir
+        source_dir = self.discovery.source_dir_for(request.input_path)
+        if not self.discovery.is_glob_pattern(str(request.input_path)) and not source_dir.exists():
+            raise FileNotFoundError(f"Source not found: {request.input_path}")
+        output_dir = self._resolve_output_dir(request, source_dir)
+        files, source_dir = self.discovery.discover(
+            request.input_path,
+            recursive=request.recursive,
+            exclude_paths=[output_dir] if prune_output else None,
+        )
+        return files, source_dir, output_dir
 
     @staticmethod
     def _resolve_output_dir(request: ProcessJobRequest, source_dir: Path) -> Path:
@@ -381,14 +502,16 @@ class JobService:
 
     @staticmethod
     def _exclude_output_files(files: List[Path], output_dir: Path) -> List[Path]:
-        """Exclude already generated output artifacts from source discovery."""
+        """Exclude already generated output artifacts from source discovery.
+
+        Discovery already returns resolved paths, so they are not re-resolved here.
+        """
         output_root = output_dir.resolve()
         filtered: List[Path] = []
         for file_path in files:
-            resolved = file_path.resolve()
-            if output_root in resolved.parents:
+            if output_root in file_path.parents:
                 continue
-            filtered.append(resolved)
+            filtered.append(file_path)
         return sorted(set(filtered))
 
     def _resolve_session(
@@ -442,6 +565,7 @@ class JobService:
                 continue
 
             try:
+                session_file.with_suffix(".journal").unlink(missing_ok=True)
                 session_file.unlink()
             except OSError:
                 continue
@@ -103,6 +103,44 @@ class PersistenceRepository:
         except Exception:
             return 0
 
+    def checkpoint_job_files(self, job_id: str, rows: list[dict[str, Any]]) -> None:
+        """Upsert per-file outcome rows for a running job in one transaction.
+
+        Rows use ``JobFile`` column names and are matched on
+        ``normalized_source_path``; the terminal result persistence later replaces
+        them with the final set.
+        """
+        deps = self._deps()
+        if deps is None or not rows:
+            return
+        session_local, job_model, job_file_model, _session_record_model, select_stmt, _func = deps
+        try:
+            with session_local() as db:
+                if db.get(job_model, job_id) is None:
+                    return
+                normalized_paths = [row["normalized_source_path"] for row in rows]
+                existing = {
+                    job_file.normalized_source_path: job_file
+                    for job_file in db.scalars(
+                        select_stmt(job_file_model).where(
+                            job_file_model.job_id == job_id,
+                            job_file_model.normalized_source_path.in_(normalized_paths),
+                        )
+                    )
+                }
+                for row in rows:
+                    job_file = existing.get(row["normalized_source_path"])
+                    if job_file is None:
+                        job_file = job_file_model(job_id=job_id, **row)
+                        db.add(job_file)
+                        existing[row["normalized_source_path"]] = job_file
+                    else:
+                        for column, value in row.items():
+                            setattr(job_file, column, value)
+                db.commit()
+        except Exception:
+            return
+
     def upsert_session_record(
         self,
         payload: dict[str, Any],
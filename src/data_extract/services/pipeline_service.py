@@ -2,23 +2,58 @@
 
 from __future__ import annotations
 
+import gc
+import itertools
+import multiprocessing
+import os
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Union
 
 import structlog
 
-from data_extract.core.models import Chunk, Document
+from data_extract.core.models import Chunk, Document, ProcessingContext
+from data_extract.core.pipeline import StagedPipeline, StageSpec
 from data_extract.extract import get_extractor
 from data_extract.normalize.config import NormalizationConfig
 from data_extract.normalize.normalizer import Normalizer
+from data_extract.normalize.registry import get_normalizer_registry, get_shared_normalizer
 from data_extract.output import OutputWriter
 from data_extract.output.organization import OrganizationStrategy
 from data_extract.services.pathing import normalize_path
 
+if TYPE_CHECKING:
+    from data_extract.chunk.engine import ChunkingEngine
+
+EXECUTOR_MODES = {"thread", "process", "staged"}
+PIPELINE_STAGES = ("extract", "normalize", "chunk", "semantic", "output")
+# Stages dominated by file I/O get the full worker count in staged mode; the
+# CPU-bound stages run one worker each since threads would only contend on the GIL.
+IO_BOUND_STAGES = {"extract", "output"}
+# Files submitted to the thread/process pool ahead of the workers, per worker.
+# Keeps the pool busy while later files are still being discovered without
+# holding a future for every file of a large run.
+POOL_PREFETCH_PER_WORKER = 2
+# Sentence segmentation backend used by the advanced chunker for each pipeline
+# profile. A run picks its backend from, in order: --segmentation-backend on
+# `process`/`batch` (API field `segmentation_backend`), then the environment
+# override DATA_EXTRACT_SEGMENTATION_BACKEND_<PROFILE> (for example
+# DATA_EXTRACT_SEGMENTATION_BACKEND_AUTO=sentencizer), then this table.
+# Registered backends: parser, senter, sentencizer, heuristic (utils/nlp.py).
+PROFILE_SEGMENTATION_BACKENDS = {"auto": "parser", "advanced": "parser"}
+SEGMENTATION_BACKEND_ENV_PREFIX = "DATA_EXTRACT_SEGMENTATION_BACKEND_"
+
 
 @dataclass
 class PipelineFileResult:
@@ -30,6 +65,29 @@ class PipelineFileResult:
     stage_timings_ms: Dict[str, float] = field(default_factory=dict)
 
 
+@dataclass
+class FileWorkItem:
+    """Mutable per-file state handed from one pipeline stage to the next."""
+
+    file_path: Path
+    options: Dict[str, Any]
+    use_advanced: bool = False
+    document: Document | None = None
+    chunks: List[Chunk] = field(default_factory=list)
+    output_path: Path | None = None
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)
+
+    def to_result(self) -> PipelineFileResult:
+        """Convert a fully processed item into its public result."""
+        assert self.output_path is not None
+        return PipelineFileResult(
+            source_path=self.file_path,
+            output_path=self.output_path,
+            chunk_count=len(self.chunks),
+            stage_timings_ms=self.stage_timings_ms,
+        )
+
+
 @dataclass
 class PipelineFailure:
     """Failure details for one source file."""
@@ -39,6 +97,10 @@ class PipelineFailure:
     error_message: str
 
 
+PipelineOutcome = Union[PipelineFileResult, PipelineFailure]
+OutcomeSink = Callable[[PipelineOutcome], None]
+
+
 @dataclass
 class PipelineRunResult:
     """Aggregate processing result for a batch."""
@@ -47,6 +109,7 @@ class PipelineRunResult:
     failed: List[PipelineFailure] = field(default_factory=list)
     skipped: List[Path] = field(default_factory=list)
     stage_totals_ms: Dict[str, float] = field(default_factory=dict)
+    stage_metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
 class PipelineService:
@@ -75,98 +138,243 @@ class PipelineService:
         pipeline_profile: str = "auto",
         allow_advanced_fallback: bool = True,
         output_file_override: Path | None = None,
+        segmentation_backend: str | None = None,
+        executor: str = "thread",
+        on_result: OutcomeSink | None = None,
     ) -> PipelineRunResult:
-        """Process files and return per-file and aggregate details."""
+        """Process files and return per-file and aggregate details.
+
+        ``on_result`` is called on the calling thread with each
+        ``PipelineFileResult``/``PipelineFailure`` as soon as that file finishes,
+        in the same order the outcomes are appended to the returned result, so
+        callers can checkpoint or report progress during long runs.
+
+        ``files`` is consumed lazily: a generator such as
+        ``FileDiscoveryService.iter_files()`` is drained as workers free up, so
+        processing starts while discovery is still walking the tree (the
+        ``"process"`` executor drains it before forking its workers).
+
+        ``executor`` selects how ``workers > 1`` runs are parallelised: ``"thread"``
+        shares this process (cheap start-up, GIL-bound), ``"process"`` uses a pool
+        of long-lived worker processes that each keep a warm pipeline, and
+        ``"staged"`` overlaps stages across files with bounded queues between them
+        (per-stage counters are reported in ``stage_metrics``).
+
+        ``segmentation_backend`` picks the advanced chunker's sentence segmenter
+        (parser, senter, sentencizer or heuristic); None uses the pipeline
+        profile's entry in ``PROFILE_SEGMENTATION_BACKENDS``.
+        """
+        executor_mode = str(executor or "thread").strip().lower()
+        if executor_mode not in EXECUTOR_MODES:
+            raise ValueError(
+                f"Invalid executor '{executor}'. "
+                f"Must be one of: {', '.join(sorted(EXECUTOR_MODES))}"
+            )
+        if segmentation_backend is not None:
+            resolve_segmentation_backend(pipeline_profile, segmentation_backend)
+
         result = PipelineRunResult()
         output_dir.mkdir(parents=True, exist_ok=True)
-        file_list = list(files)
+        # Peek two files to pick the sequential path without materialising the rest.
+        file_iter = iter(files)
+        head = list(itertools.islice(file_iter, 2))
+        file_stream: Iterator[Path] = itertools.chain(head, file_iter)
         worker_count = max(1, int(workers))
+        file_options: Dict[str, Any] = {
+            "output_dir": output_dir,
+            "output_format": output_format,
+            "chunk_size": chunk_size,
+            "include_metadata": include_metadata,
+            "per_chunk": per_chunk,
+            "organize": organize,
+            "strategy": strategy,
+            "delimiter": delimiter,
+            "include_semantic": include_semantic,
+            "source_root": source_root,
+            "pipeline_profile": pipeline_profile,
+            "allow_advanced_fallback": allow_advanced_fallback,
+            "output_file_override": output_file_override,
+            "segmentation_backend": segmentation_backend,
+        }
 
-        if worker_count <= 1 or len(file_list) <= 1:
-            for file_path in file_list:
+        if len(head) > 1 and executor_mode == "staged":
+            self._process_files_staged(
+                files=file_stream,
+                file_options=file_options,
+                worker_count=worker_count,
+                continue_on_error=continue_on_error,
+                result=result,
+                on_result=on_result,
+            )
+            return result
+
+        if worker_count <= 1 or len(head) <= 1:
+            for file_path in file_stream:
                 try:
-                    file_result = self.process_file(
-                        file_path=file_path,
-                        output_dir=output_dir,
-                        output_format=output_format,
-                        chunk_size=chunk_size,
-                        include_metadata=include_metadata,
-                        per_chunk=per_chunk,
-                        organize=organize,
-                        strategy=strategy,
-                        delimiter=delimiter,
-                        include_semantic=include_semantic,
-                        source_root=source_root,
-                        pipeline_profile=pipeline_profile,
-                        allow_advanced_fallback=allow_advanced_fallback,
-                        output_file_override=output_file_override,
-                    )
-                    result.processed.append(file_result)
-                    for stage, value in file_result.stage_timings_ms.items():
-                        result.stage_totals_ms[stage] = (
-                            result.stage_totals_ms.get(stage, 0.0) + value
-                        )
+                    file_result = self.process_file(file_path=file_path, **file_options)
                 except Exception as exc:
-                    result.failed.append(
-                        PipelineFailure(
-                            source_path=file_path,
-                            error_type=type(exc).__name__,
-                            error_message=str(exc),
-                        )
-                    )
+                    self._record_failure(result, file_path, exc, on_result)
                     if not continue_on_error:
                         break
+                else:
+                    self._record_success(result, file_result, on_result)
             return result
 
-        # Process files in parallel when workers > 1. Each worker uses an isolated
-        # PipelineService instance to avoid sharing mutable normalizer/writer state.
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            futures = {
-                executor.submit(
-                    self._process_file_isolated,
-                    file_path=file_path,
-                    output_dir=output_dir,
-                    output_format=output_format,
-                    chunk_size=chunk_size,
-                    include_metadata=include_metadata,
-                    per_chunk=per_chunk,
-                    organize=organize,
-                    strategy=strategy,
-                    delimiter=delimiter,
-                    include_semantic=include_semantic,
-                    source_root=source_root,
-                    pipeline_profile=pipeline_profile,
-                    allow_advanced_fallback=allow_advanced_fallback,
-                    output_file_override=output_file_override,
-                ): file_path
-                for file_path in file_list
-            }
-
-            for future in as_completed(futures):
-                file_path = futures[future]
-                try:
-                    file_result = future.result()
-                    result.processed.append(file_result)
-                    for stage, value in file_result.stage_timings_ms.items():
-                        result.stage_totals_ms[stage] = (
-                            result.stage_totals_ms.get(stage, 0.0) + value
-                        )
-                except Exception as exc:
-                    result.failed.append(
-                        PipelineFailure(
-                            source_path=file_path,
-                            error_type=type(exc).__name__,
-                            error_message=str(exc),
+        frozen_for_fork = False
+        if executor_mode == "process":
+            # Worker processes sidestep the GIL for CPU-bound extraction/NLP work.
+            # Each process builds one warm PipelineService in its initializer and
+            # reuses it for every file it is handed.
+            backend = resolve_segmentation_backend(pipeline_profile, segmentation_backend)
+            if multiprocessing.get_context().get_start_method() == "fork":
+                # Drain the input first: forking while a discovery walk still has
+                # scan threads running can leave their locks held in the children.
+                file_stream = iter(list(file_stream))
+                # Load the sentence model here once so forked workers inherit it and
+                # share its pages copy-on-write instead of each loading a copy.
+                frozen_for_fork = self._warm_nlp(backend, freeze=True)
+            pool: Executor = ProcessPoolExecutor(
+                max_workers=worker_count,
+                initializer=_init_process_worker,
+                initargs=(backend,),
+            )
+            process_one: Callable[..., PipelineFileResult] = _process_file_in_worker
+        else:
+            # Process files in parallel when workers > 1. Each worker uses an isolated
+            # PipelineService instance to avoid sharing mutable normalizer/writer state.
+            pool = ThreadPoolExecutor(max_workers=worker_count)
+            process_one = self._process_file_isolated
+
+        try:
+            with pool:
+                max_in_flight = worker_count * POOL_PREFETCH_PER_WORKER
+                futures: Dict[Future[PipelineFileResult], Path] = {}
+                stopped = False
+                while not stopped:
+                    for file_path in itertools.islice(file_stream, max_in_flight - len(futures)):
+                        futures[pool.submit(process_one, file_path=file_path, **file_options)] = (
+                            file_path
                         )
-                    )
-                    if not continue_on_error:
-                        for pending in futures:
-                            if not pending.done():
-                                pending.cancel()
+                    if not futures:
                         break
-
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        file_path = futures.pop(future)
+                        try:
+                            file_result = future.result()
+                        except Exception as exc:
+                            self._record_failure(result, file_path, exc, on_result)
+                            if not continue_on_error:
+                                for pending in futures:
+                                    pending.cancel()
+                                stopped = True
+                                break
+                        else:
+                            self._record_success(result, file_result, on_result)
+        finally:
+            if frozen_for_fork:
+                # Workers have forked (or the run failed); let this process collect
+                # those objects again.
+                gc.unfreeze()
         return result
 
+    def _process_files_staged(
+        self,
+        files: Iterable[Path],
+        file_options: Dict[str, Any],
+        worker_count: int,
+        continue_on_error: bool,
+        result: PipelineRunResult,
+        on_result: OutcomeSink | None = None,
+    ) -> None:
+        """Stream files through per-stage worker pools with bounded queues."""
+        queue_size = max(2, worker_count)
+        staged = StagedPipeline(
+            [
+                StageSpec(
+                    name=stage_name,
+                    stage=_ServiceStage(stage_name),
+                    workers=worker_count if stage_name in IO_BOUND_STAGES else 1,
+                    queue_size=queue_size,
+                )
+                for stage_name in PIPELINE_STAGES
+            ],
+            output_queue_size=queue_size,
+        )
+        work_items = (self._new_work_item(file_path, **file_options) for file_path in files)
+        context = ProcessingContext(config={}, logger=self.logger, metrics={})
+        envelopes = staged.run(work_items, context)
+        try:
+            for envelope in envelopes:
+                item: FileWorkItem = envelope.payload
+                if envelope.ok:
+                    self._record_success(result, item.to_result(), on_result)
+                    continue
+                assert envelope.error is not None
+                self._record_failure(result, item.file_path, envelope.error, on_result)
+                if not continue_on_error:
+                    break
+        finally:
+            envelopes.close()
+        result.stage_metrics = {
+            stage_name: metrics.to_dict() for stage_name, metrics in staged.metrics.items()
+        }
+
+    @staticmethod
+    def _record_success(
+        result: PipelineRunResult,
+        file_result: PipelineFileResult,
+        on_result: OutcomeSink | None = None,
+    ) -> None:
+        """Append a processed file and roll its stage timings into the totals."""
+        result.processed.append(file_result)
+        for stage, value in file_result.stage_timings_ms.items():
+            result.stage_totals_ms[stage] = result.stage_totals_ms.get(stage, 0.0) + value
+        if on_result is not None:
+            on_result(file_result)
+
+    @staticmethod
+    def _record_failure(
+        result: PipelineRunResult,
+        file_path: Path,
+        exc: BaseException,
+        on_result: OutcomeSink | None = None,
+    ) -> None:
+        """Append a failure entry for one source file."""
+        failure = PipelineFailure(
+            source_path=file_path,
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+        )
+        result.failed.append(failure)
+        if on_result is not None:
+            on_result(failure)
+
+    def warm_up(self, segmentation_backend: str = "parser") -> None:
+        """Load the normalizer and sentence model ahead of the first file.
+
+        Used by process-pool workers so model load cost is paid once per worker
+        instead of once per file. Failures are logged and left to the lazy paths.
+        """
+        try:
+            if self.normalizer is None:
+                self.normalizer = get_shared_normalizer(NormalizationConfig())
+        except Exception as exc:
+            self.logger.warning("pipeline_warm_up_normalizer_failed", error=str(exc))
+
+        self._warm_nlp(segmentation_backend)
+
+    def _warm_nlp(self, segmentation_backend: str, freeze: bool = False) -> bool:
+        """Load the spaCy pipeline for ``segmentation_backend``; True if it succeeded."""
+        try:
+            from data_extract.utils.nlp import warm_nlp_models
+
+            warm_nlp_models([segmentation_backend], freeze=freeze)
+        except Exception as exc:
+            self.logger.warning("pipeline_warm_up_nlp_failed", error=str(exc))
+            return False
+        return True
+
     @staticmethod
     def _process_file_isolated(
         file_path: Path,
@@ -183,6 +391,7 @@ class PipelineService:
         pipeline_profile: str,
         allow_advanced_fallback: bool,
         output_file_override: Path | None,
+        segmentation_backend: str | None = None,
     ) -> PipelineFileResult:
         """Process one file with an isolated service instance for thread safety."""
         service = PipelineService()
@@ -201,6 +410,7 @@ class PipelineService:
             pipeline_profile=pipeline_profile,
             allow_advanced_fallback=allow_advanced_fallback,
             output_file_override=output_file_override,
+            segmentation_backend=segmentation_backend,
         )
 
     def process_file(
@@ -219,85 +429,143 @@ class PipelineService:
         pipeline_profile: str = "auto",
         allow_advanced_fallback: bool = True,
         output_file_override: Path | None = None,
+        segmentation_backend: str | None = None,
     ) -> PipelineFileResult:
         """Run the full pipeline for a single file."""
-        stage_timings_ms: Dict[str, float] = {}
-        use_advanced = self._should_use_advanced_pipeline(
+        item = self._new_work_item(
+            file_path=file_path,
+            output_dir=output_dir,
+            output_format=output_format,
+            chunk_size=chunk_size,
+            include_metadata=include_metadata,
+            per_chunk=per_chunk,
+            organize=organize,
+            strategy=strategy,
+            delimiter=delimiter,
             include_semantic=include_semantic,
+            source_root=source_root,
             pipeline_profile=pipeline_profile,
-            file_path=file_path,
+            allow_advanced_fallback=allow_advanced_fallback,
+            output_file_override=output_file_override,
+            segmentation_backend=segmentation_backend,
         )
+        for stage_name in PIPELINE_STAGES:
+            self.run_stage(stage_name, item)
+        return item.to_result()
 
-        start = time.perf_counter()
-        document = self._extract(file_path)
-        stage_timings_ms["extract"] = (time.perf_counter() - start) * 1000
+    def _new_work_item(self, file_path: Path, **options: Any) -> FileWorkItem:
+        """Build the per-file state carried through the pipeline stages."""
+        return FileWorkItem(
+            file_path=file_path,
+            options=options,
+            use_advanced=self._should_use_advanced_pipeline(
+                include_semantic=bool(options.get("include_semantic", False)),
+                pipeline_profile=str(options.get("pipeline_profile", "auto")),
+                file_path=file_path,
+            ),
+        )
 
+    def run_stage(self, stage_name: str, item: FileWorkItem) -> FileWorkItem:
+        """Run one named pipeline stage for a file and record its timing."""
+        handler = getattr(self, f"_{stage_name}_stage")
         start = time.perf_counter()
-        if use_advanced:
+        handler(item)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # One-off resource loads are reported under "<stage>_load", not in the stage.
+        load_ms = item.stage_timings_ms.get(f"{stage_name}_load", 0.0)
+        item.stage_timings_ms[stage_name] = max(elapsed_ms - load_ms, 0.0)
+        return item
+
+    def _extract_stage(self, item: FileWorkItem) -> None:
+        item.document = self._extract(item.file_path)
+
+    def _normalize_stage(self, item: FileWorkItem) -> None:
+        assert item.document is not None
+        if item.use_advanced:
             try:
-                normalized = self._normalize_advanced(document)
+                if self.normalizer is None:
+                    self.normalizer, load_ms = get_normalizer_registry().acquire(
+                        NormalizationConfig()
+                    )
+                    if load_ms:
+                        item.stage_timings_ms["normalize_load"] = load_ms
+                item.document = self._normalize_advanced(item.document)
+                return
             except Exception as exc:
-                if not allow_advanced_fallback:
+                if not item.options.get("allow_advanced_fallback", True):
                     raise
                 self.logger.warning(
                     "advanced_normalize_fallback",
-                    source_path=str(file_path),
+                    source_path=str(item.file_path),
                     error=str(exc),
                 )
-                normalized = self._normalize(document)
-                use_advanced = False
-        else:
-            normalized = self._normalize(document)
-        stage_timings_ms["normalize"] = (time.perf_counter() - start) * 1000
+                item.use_advanced = False
+        item.document = self._normalize(item.document)
 
-        start = time.perf_counter()
-        if use_advanced:
+    def _chunk_stage(self, item: FileWorkItem) -> None:
+        assert item.document is not None
+        chunk_size = int(item.options["chunk_size"])
+        if item.use_advanced:
             try:
-                chunks = self._chunk_advanced(normalized, chunk_size)
-                if not chunks:
+                backend = resolve_segmentation_backend(
+                    str(item.options.get("pipeline_profile", "auto")),
+                    item.options.get("segmentation_backend"),
+                )
+                item.chunks = self._chunk_advanced(item.document, chunk_size, backend)
+                if not item.chunks:
                     # Compatibility fallback: CLI integration expects a deterministic
                     # placeholder chunk for empty/near-empty documents so output files
                     # are still emitted in TXT concatenated/per-chunk modes.
-                    chunks = self._chunk(normalized, chunk_size)
-                    use_advanced = False
+                    item.chunks = self._chunk(item.document, chunk_size)
+                    item.use_advanced = False
             except Exception as exc:
-                if not allow_advanced_fallback:
+                if not item.options.get("allow_advanced_fallback", True):
                     raise
                 self.logger.warning(
                     "advanced_chunk_fallback",
-                    source_path=str(file_path),
+                    source_path=str(item.file_path),
                     error=str(exc),
                 )
-                chunks = self._chunk(normalized, chunk_size)
+                item.chunks = self._chunk(item.document, chunk_size)
         else:
-            chunks = self._chunk(normalized, chunk_size)
-        stage_timings_ms["chunk"] = (time.perf_counter() - start) * 1000
+            item.chunks = self._chunk(item.document, chunk_size)
+        # The document body is no longer needed once chunks exist; dropping it keeps
+        # items queued for later stages small.
+        item.document = None
+
+    def _semantic_stage(self, item: FileWorkItem) -> None:
+        if item.options.get("include_semantic", False):
+            item.chunks = self._semantic(item.chunks)
+
+    def _output_stage(self, item: FileWorkItem) -> None:
+        options = item.options
+        output_dir: Path = options["output_dir"]
+        output_format: str = options["output_format"]
+        per_chunk = bool(options.get("per_chunk", False))
+        organize = bool(options.get("organize", False))
+        strategy = options.get("strategy")
+        output_file_override = options.get("output_file_override")
 
-        start = time.perf_counter()
-        semantic_chunks = self._semantic(chunks) if include_semantic else chunks
-        stage_timings_ms["semantic"] = (time.perf_counter() - start) * 1000
-
-        start = time.perf_counter()
         if output_file_override is not None:
             output_path = output_file_override
         elif per_chunk or organize:
             output_path = output_dir
         else:
             output_path = self._resolve_output_path(
-                file_path=file_path,
+                file_path=item.file_path,
                 output_dir=output_dir,
                 output_format=output_format,
-                source_root=source_root,
+                source_root=options.get("source_root"),
             )
         strategy_enum = OrganizationStrategy(strategy) if strategy else None
         formatter_kwargs: Dict[str, object] = {
-            "include_metadata": include_metadata,
-            "delimiter": delimiter,
+            "include_metadata": bool(options.get("include_metadata", False)),
+            "delimiter": options.get("delimiter", "━━━ CHUNK {{n}} ━━━"),
         }
         if output_format == "json":
             formatter_kwargs["write_bom"] = False
         self.writer.write(
-            semantic_chunks,
+            item.chunks,
             output_path=output_path,
             format_type=output_format,
             per_chunk=per_chunk,
@@ -305,14 +573,7 @@ class PipelineService:
             strategy=strategy_enum,
             **formatter_kwargs,
         )
-        stage_timings_ms["output"] = (time.perf_counter() - start) * 1000
-
-        return PipelineFileResult(
-            source_path=file_path,
-            output_path=output_path,
-            chunk_count=len(semantic_chunks),
-            stage_timings_ms=stage_timings_ms,
-        )
+        item.output_path = output_path
 
     @staticmethod
     def _extract(file_path: Path) -> Document:
@@ -335,7 +596,7 @@ class PipelineService:
         from data_extract.core.models import ProcessingContext
 
         if self.normalizer is None:
-            self.normalizer = Normalizer(NormalizationConfig())
+            self.normalizer = get_shared_normalizer(NormalizationConfig())
 
         context = ProcessingContext(config={}, logger=self.logger, metrics={})
         return self.normalizer.process(document, context)
@@ -387,21 +648,47 @@ class PipelineService:
 
         return chunks
 
-    def _chunk_advanced(self, document: Document, chunk_size: int) -> List[Chunk]:
+    def chunk_documents(
+        self,
+        documents: List[Document],
+        chunk_size: int,
+        segmentation_backend: str = "parser",
+    ) -> List[List[Chunk]]:
+        """Chunk normalized documents with the advanced engine, segmenting them in one batch.
+
+        Returns the same chunks as the advanced chunk stage would for each
+        document, one list per document in input order.
+        """
+        engine = self._advanced_chunking_engine(chunk_size, segmentation_backend)
+        context = ProcessingContext(config={}, logger=self.logger, metrics={})
+        return engine.chunk_documents(documents, context)
+
+    def _chunk_advanced(
+        self,
+        document: Document,
+        chunk_size: int,
+        segmentation_backend: str = "parser",
+    ) -> List[Chunk]:
         """Run semantic boundary-aware chunking engine."""
-        from data_extract.chunk.engine import ChunkingConfig, ChunkingEngine
-        from data_extract.core.models import ProcessingContext
+        engine = self._advanced_chunking_engine(chunk_size, segmentation_backend)
+        context = ProcessingContext(config={}, logger=self.logger, metrics={})
+        return engine.process(document, context)
+
+    @staticmethod
+    def _advanced_chunking_engine(chunk_size: int, segmentation_backend: str) -> ChunkingEngine:
+        from data_extract.chunk.engine import ChunkingConfig
+        from data_extract.chunk.registry import get_shared_chunking_engine
 
-        engine = ChunkingEngine(
-            config=ChunkingConfig(
+        # Engines carry no per-document state, so one per config serves every file.
+        return get_shared_chunking_engine(
+            ChunkingConfig(
                 chunk_size=max(1, int(chunk_size)),
                 overlap_pct=0.15,
                 entity_aware=False,
                 quality_enrichment=True,
+                segmentation_backend=segmentation_backend,
             )
         )
-        context = ProcessingContext(config={}, logger=self.logger, metrics={})
-        return engine.process(document, context)
 
     @staticmethod
     def _semantic(chunks: List[Chunk]) -> List[Chunk]:
@@ -456,3 +743,63 @@ class PipelineService:
         output_path = output_dir / relative.with_suffix(f".{output_format}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
         return output_path
+
+
+class _ServiceStage:
+    """PipelineStage adapter running one PipelineService stage for staged mode.
+
+    Each scheduler worker thread gets its own PipelineService so normalizer and
+    writer state is never shared between threads.
+    """
+
+    def __init__(self, stage_name: str) -> None:
+        self.stage_name = stage_name
+        self._local = threading.local()
+
+    def process(self, input_data: FileWorkItem, context: ProcessingContext) -> FileWorkItem:
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = PipelineService()
+            self._local.service = service
+        return service.run_stage(self.stage_name, input_data)
+
+
+def resolve_segmentation_backend(pipeline_profile: str, requested: str | None = None) -> str:
+    """Return the sentence segmentation backend for a run.
+
+    An explicit ``requested`` backend wins, then the
+    ``DATA_EXTRACT_SEGMENTATION_BACKEND_<PROFILE>`` environment variable, then
+    the profile's entry in ``PROFILE_SEGMENTATION_BACKENDS``.
+    """
+    from data_extract.utils.nlp import DEFAULT_SEGMENTATION_BACKEND, get_segmentation_backend
+
+    profile = str(pipeline_profile or "auto").strip().lower()
+    backend = (
+        requested
+        or os.environ.get(f"{SEGMENTATION_BACKEND_ENV_PREFIX}{profile.upper()}", "").strip()
+        or PROFILE_SEGMENTATION_BACKENDS.get(profile, DEFAULT_SEGMENTATION_BACKEND)
+    )
+    get_segmentation_backend(backend)
+    return backend.strip().lower()
+
+
+# Per-process warm pipeline used by process-pool workers (see process_files).
+_worker_service: PipelineService | None = None
+
+
+def _init_process_worker(segmentation_backend: str = "parser") -> None:
+    """Build and warm the long-lived PipelineService for this worker process."""
+    global _worker_service
+    service = PipelineService()
+    service.warm_up(segmentation_backend)
+    _worker_service = service
+
+
+def _process_file_in_worker(file_path: Path, **options: Any) -> PipelineFileResult:
+    """Process one file inside a pool worker using its warm service."""
+    service = _worker_service
+    if service is None:
+        _init_process_worker()
+        service = _worker_service
+    assert service is not None
+    return service.process_file(file_path=file_path, **options)
@@ -14,6 +14,8 @@ DEFAULT_OUTPUT_FORMAT = str(ProcessJobRequest.model_fields["output_format"].defa
 DEFAULT_PIPELINE_PROFILE = "auto"
 DEFAULT_EVALUATION_POLICY = str(ProcessJobRequest.model_fields["evaluation_policy"].default)
 VALID_PIPELINE_PROFILES = {"auto", "legacy", "advanced"}
+DEFAULT_EXECUTOR = "thread"
+VALID_EXECUTORS = {"thread", "process", "staged"}
 
 
 def _to_bool(value: Any, default: bool) -> bool:
@@ -87,6 +89,9 @@ class ResolvedRunConfig:
     allow_advanced_fallback: bool
     semantic: ResolvedSemanticConfig
     evaluation: ResolvedEvaluationConfig
+    workers: int = 1
+    executor: str = DEFAULT_EXECUTOR
+    segmentation_backend: str | None = None
 
 
 class RunConfigResolver:
@@ -208,6 +213,14 @@ class RunConfigResolver:
             os.environ.get("DATA_EXTRACT_ADVANCED_FALLBACK"),
             True,
         )
+        workers = _to_int(
+            request.workers,
+            _to_int(os.environ.get("DATA_EXTRACT_PIPELINE_WORKERS"), 1),
+        )
+        requested_executor = str(
+            request.executor or os.environ.get("DATA_EXTRACT_PIPELINE_EXECUTOR", DEFAULT_EXECUTOR)
+        ).lower()
+        executor = requested_executor if requested_executor in VALID_EXECUTORS else DEFAULT_EXECUTOR
 
         return ResolvedRunConfig(
             output_format=output_format,
@@ -218,6 +231,13 @@ class RunConfigResolver:
             allow_advanced_fallback=allow_advanced_fallback,
             semantic=resolved_semantic,
             evaluation=resolved_evaluation,
+            workers=workers,
+            executor=executor,
+            segmentation_backend=(
+                str(request.segmentation_backend).strip().lower()
+                if request.segmentation_backend
+                else None
+            ),
         )
 
     @staticmethod
@@ -0,0 +1,253 @@
+"""Single-pass SHA-256 file fingerprints shared by extraction, metadata and batch state."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+FINGERPRINT_CACHE_ENV = "DATA_EXTRACT_FINGERPRINT_CACHE"
+DEFAULT_FINGERPRINT_CACHE = Path(".data-extract-cache/fingerprints.sqlite3")
+_DISABLED_VALUES = {"0", "false", "no", "off", "none"}
+
+
+@dataclass(frozen=True)
+class FileIdentity:
+    """Stat fields that identify one version of a file's content."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_path(cls, file_path: Path) -> "FileIdentity":
+        stat = os.stat(file_path)
+        return cls(
+            path=os.path.abspath(file_path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+        )
+
+    def matches(self, size: int, mtime_ns: int, inode: int) -> bool:
+        return (self.size, self.mtime_ns, self.inode) == (size, mtime_ns, inode)
+
+
+class FingerprintService:
+    """Hash each file once and reuse the digest while its stat identity is unchanged.
+
+    Digests are cached in memory for the run and, unless disabled, in a small
+    SQLite table so later runs skip unchanged files too. A cached digest is only
+    returned when path, size, ``mtime_ns`` and inode all still match. Each thread
+    keeps one open connection to the table for the life of the service.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    MEMORY_CACHE_ENTRIES = 65536
+    # Files modified this recently may be rewritten again within the filesystem's
+    # timestamp granularity without their stat changing, so they are not cached.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
+        """Create the service.
+
+        Args:
+            cache_path: SQLite file for digests persisted across runs, or ``None``
+                to keep the cache in memory only.
+        """
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[int, int, int, str]]" = OrderedDict()
+        self._local = threading.local()
+        self._schema_ready = False
+        self.hashed_files = 0
+        self.cache_hits = 0
+
+    def fingerprint(
+        self, file_path: Path, chunk_size: Optional[int] = None, use_cache: bool = True
+    ) -> str:
+        """Return the SHA-256 hex digest of a file, hashing it only if needed.
+
+        Args:
+            file_path: File to fingerprint
+            chunk_size: Read size in bytes (default: ``CHUNK_SIZE``)
+            use_cache: Return a cached digest when the stat identity matches. With
+                False the content is always hashed and the cache refreshed, for
+                callers that must not trust stat identity.
+
+        Raises:
+            FileNotFoundError, PermissionError, OSError: As raised by ``os.stat``/``open``
+        """
+        identity = FileIdentity.from_path(file_path)
+        cached = self.lookup(identity) if use_cache else None
+        if cached is not None:
+            return cached
+
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as handle:
+            while chunk := handle.read(chunk_size or self.CHUNK_SIZE):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        self._record_if_unchanged(file_path, identity, digest)
+        return digest
+
+    def read_bytes(self, file_path: Path) -> bytes:
+        """Read a whole file and fingerprint it from the same read.
+
+        Extractors that load the full file anyway should use this so the later
+        metadata hash is a cache hit rather than a second pass over the file.
+        """
+        identity = FileIdentity.from_path(file_path)
+        with open(file_path, "rb") as handle:
+            data = handle.read()
+        if self.lookup(identity) is None:
+            self._record_if_unchanged(file_path, identity, hashlib.sha256(data).hexdigest())
+        return data
+
+    def lookup(self, identity: FileIdentity) -> Optional[str]:
+        """Return a cached digest for ``identity`` without touching file content."""
+        with self._lock:
+            entry = self._memory.get(identity.path)
+            if entry is not None and identity.matches(*entry[:3]):
+                self._memory.move_to_end(identity.path)
+                self.cache_hits += 1
+                return entry[3]
+
+        digest = self._load_persisted(identity)
+        if digest is not None:
+            self._remember(identity, digest)
+            with self._lock:
+                self.cache_hits += 1
+        return digest
+
+    def _record_if_unchanged(self, file_path: Path, identity: FileIdentity, digest: str) -> None:
+        # A file rewritten while we read it must not be cached under either identity.
+        try:
+            after = FileIdentity.from_path(file_path)
+        except OSError:
+            return
+        with self._lock:
+            self.hashed_files += 1
+        if after != identity or time.time_ns() - identity.mtime_ns < self.RACY_WINDOW_NS:
+            return
+        self._remember(identity, digest)
+        self._persist(identity, digest)
+
+    def _remember(self, identity: FileIdentity, digest: str) -> None:
+        with self._lock:
+            self._memory[identity.path] = (
+                identity.size,
+                identity.mtime_ns,
+                identity.inode,
+                digest,
+            )
+            self._memory.move_to_end(identity.path)
+            while len(self._memory) > self.MEMORY_CACHE_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the calling thread's cache connection, if one is open."""
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            connection.close()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self.cache_path is None:
+            return None
+        # Connections are per thread and must not be reused by a forked child.
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.connection = None
+            self._local.pid = os.getpid()
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.cache_path), timeout=5.0)
+            # WAL with synchronous=NORMAL syncs at checkpoints, not on every insert.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if not self._schema_ready:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS fingerprints ("
+                    "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                    "mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL, "
+                    "sha256 TEXT NOT NULL)"
+                )
+                connection.commit()
+                self._schema_ready = True
+            self._local.connection = connection
+            return connection
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "fingerprint_cache_unavailable", path=str(self.cache_path), error=str(exc)
+            )
+            self.cache_path = None
+            return None
+
+    def _load_persisted(self, identity: FileIdentity) -> Optional[str]:
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT size, mtime_ns, inode, sha256 FROM fingerprints WHERE path = ?",
+                (identity.path,),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or not identity.matches(row[0], row[1], row[2]):
+            return None
+        return str(row[3])
+
+    def _persist(self, identity: FileIdentity, digest: str) -> None:
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO fingerprints (path, size, mtime_ns, inode, sha256) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (identity.path, identity.size, identity.mtime_ns, identity.inode, digest),
+                )
+        except sqlite3.Error as exc:
+            logger.debug("fingerprint_cache_write_failed", path=identity.path, error=str(exc))
+
+
+_service_lock = threading.Lock()
+_services: dict[Optional[str], FingerprintService] = {}
+
+
+def resolve_fingerprint_cache_path() -> Optional[Path]:
+    """Resolve the persistent cache path from ``DATA_EXTRACT_FINGERPRINT_CACHE``."""
+    raw_value = os.environ.get(FINGERPRINT_CACHE_ENV, "").strip()
+    if not raw_value:
+        return DEFAULT_FINGERPRINT_CACHE
+    if raw_value.lower() in _DISABLED_VALUES:
+        return None
+    return Path(raw_value).expanduser()
+
+
+def get_fingerprint_service() -> FingerprintService:
+    """Return the process-wide fingerprint service for the configured cache path."""
+    cache_path = resolve_fingerprint_cache_path()
+    key = str(cache_path.resolve()) if cache_path is not None else None
+    with _service_lock:
+        service = _services.get(key)
+        if service is None:
+            service = FingerprintService(cache_path)
+            _services[key] = service
+        return service
@@ -4,13 +4,24 @@ This module provides sentence boundary detection and other NLP utilities
 for the data extraction pipeline. Used by Epic 3 chunking stage.
 
 Supports both development and frozen executable modes (PyInstaller).
+
+Loaded spaCy pipelines are cached per process. Each is built once under a
+lock, so concurrent first lookups wait for a single load, and the load time
+and resident-memory growth are kept for reporting (see nlp_model_stats()).
+warm_nlp_models() loads them ahead of the first document, e.g. at service
+start-up or in a parent process before it forks workers that should share the
+model pages copy-on-write.
 """
 
+import gc
 import os
 import re
 import sys
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
 import structlog
 from spacy.language import Language
@@ -18,10 +29,104 @@ from spacy.language import Language
 # Module-level cache for lazy loading (load once, reuse pattern from Story 2.5.1.1)
 _nlp_model: Optional[Language] = None
 _using_fallback_model = False
+# Lighter pipelines for the "senter" and "sentencizer" segmentation backends
+_senter_model: Optional[Language] = None
+_senter_unavailable = False
+_sentencizer_model: Optional[Language] = None
+# Serializes model loads; the fast path reads the cached globals without it
+_model_lock = threading.Lock()
+
+# Texts handed to nlp.pipe() per batch by get_sentence_boundaries_batch()
+DEFAULT_SENTENCE_BATCH_SIZE = 64
+DEFAULT_SEGMENTATION_BACKEND = "parser"
+
+# Longer texts are segmented in windows of at most this many characters (cut at
+# paragraph breaks) so spaCy never builds a Doc for the whole document.
+DEFAULT_SEGMENT_WINDOW_CHARS = 100_000
+# Boundaries in the last this-many characters of a window are re-derived from
+# the next window, which sees the text on both sides of them.
+DEFAULT_SEGMENT_OVERLAP_CHARS = 2_000
+
+# Pipeline components that never set sentence boundaries. They are skipped when
+# segmenting; tok2vec/transformer, parser, senter and sentencizer keep running.
+NON_SENTENCE_COMPONENTS = frozenset(
+    {
+        "tagger",
+        "morphologizer",
+        "attribute_ruler",
+        "lemmatizer",
+        "trainable_lemmatizer",
+        "ner",
+        "entity_ruler",
+        "entity_linker",
+        "span_ruler",
+        "spancat",
+        "textcat",
+        "textcat_multilabel",
+    }
+)
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class ModelLoadStats:
+    """Cost of loading one cached spaCy pipeline.
+
+    Attributes:
+        backend: Segmentation backend the pipeline serves (parser, senter, sentencizer)
+        model_name: Loaded model, or the pipeline used in its place
+        load_ms: Wall-clock load time in milliseconds
+        rss_delta_mb: Growth of the process's current resident set size during the load
+        fallback: Whether a lighter pipeline replaced the requested model
+    """
+
+    backend: str
+    model_name: str
+    load_ms: float
+    rss_delta_mb: float
+    fallback: bool = False
+
+
+_model_stats: Dict[str, ModelLoadStats] = {}
+
+
+def _resident_bytes() -> int:
+    """Current resident set size of this process in bytes (0 where unavailable).
+
+    Read from ``/proc/self/statm`` (Linux). The peak RSS from ``getrusage`` is not
+    used: once the process has peaked higher, a model load would not move it.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _record_model_load(
+    backend: str, model_name: str, started: float, rss_before: int, fallback: bool = False
+) -> None:
+    """Store (and log) the load stats of a pipeline loaded since ``started``."""
+    stats = ModelLoadStats(
+        backend=backend,
+        model_name=model_name,
+        load_ms=round((time.perf_counter() - started) * 1000, 2),
+        rss_delta_mb=round(max(0, _resident_bytes() - rss_before) / 2**20, 2),
+        fallback=fallback,
+    )
+    _model_stats[backend] = stats
+    logger.info(
+        "spacy_model_load_stats",
+        backend=backend,
+        model_name=model_name,
+        load_ms=stats.load_ms,
+        rss_delta_mb=stats.rss_delta_mb,
+        fallback=fallback,
+    )
+
+
 def _validate_override_path(path_str: str, expected_type: str = "file") -> Optional[Path]:
     """Validate override path is safe and exists.
 
@@ -128,72 +233,172 @@ def _build_fallback_nlp() -> Language:
     return fallback_nlp
 
 
+# Abbreviations whose trailing period does not end a sentence (heuristic backend)
+_NON_TERMINAL_ABBREVIATIONS = frozenset(
+    {"dr.", "mr.", "mrs.", "ms.", "prof.", "inc.", "ltd.", "corp.", "co.", "vs.", "e.g.", "i.e."}
+)
+# Sentence punctuation followed by whitespace or the end of text (punctuation
+# inside tokens - domains, decimals, acronyms - never matches), plus the next
+# non-space character if there is one.
+_TERMINAL_RE = re.compile(r"[.!?](?=\s|\Z)")
+_NEXT_CHAR_RE = re.compile(r"\s*(\S)?")
+# Abbreviations are at most five characters, so a six-character look-behind
+# settles most periods without locating the whole preceding token.
+_TOKEN_WINDOW = 6
+_ACRONYM_RE = re.compile(r"(?:[A-Za-z]\.){2,}")
+
+
+def _token_ending_at(text: str, end: int, width: int = _TOKEN_WINDOW) -> str:
+    """Return the whitespace-delimited token of ``text`` that ends at ``end``.
+
+    Looks back through a window that grows until it contains whitespace, so
+    the cost is proportional to the token length rather than the text length.
+    """
+    while True:
+        start = max(0, end - width)
+        window = text[start:end]
+        token = window.rsplit(None, 1)[-1]
+        if len(token) < len(window) or start == 0:
+            return token
+        width *= 4
+
+
+def _is_non_terminal_period(text: str, end: int, next_char: str) -> bool:
+    """Whether the period ending at ``end`` belongs to an abbreviation or acronym."""
+    token = _token_ending_at(text, end)
+    if token.lower() in _NON_TERMINAL_ABBREVIATIONS:
+        return True
+    return not next_char.isupper() and _ACRONYM_RE.fullmatch(token) is not None
+
+
 def _heuristic_sentence_boundaries(text: str) -> List[int]:
-    """Calculate sentence boundaries when statistical spaCy model is unavailable."""
+    """Calculate sentence boundaries with precompiled regexes (no spaCy model needed).
+
+    A period ends a sentence unless its token is a known abbreviation, an
+    acronym followed by a lowercase word, or the next character is not a
+    letter, quote or opening bracket. ``!`` and ``?`` always end a sentence.
+    """
     boundaries: List[int] = []
-    non_terminal_abbreviations = {
-        "dr.",
-        "mr.",
-        "mrs.",
-        "ms.",
-        "prof.",
-        "inc.",
-        "ltd.",
-        "corp.",
-        "co.",
-        "vs.",
-        "e.g.",
-        "i.e.",
-    }
+    text_length = len(text)
 
-    for idx, char in enumerate(text):
-        if char not in ".!?":
+    for match in _TERMINAL_RE.finditer(text):
+        end = match.end()
+        next_char = _NEXT_CHAR_RE.match(text, end).group(1)  # type: ignore[union-attr]
+        if next_char is None:
+            boundaries.append(text_length)
             continue
 
-        # Ignore punctuation used inside tokens (domains, acronyms, decimals).
-        if idx + 1 < len(text) and not text[idx + 1].isspace():
+        if match.group() == "." and (
+            not (next_char.isalpha() or next_char in "\"'([{")
+            or _is_non_terminal_period(text, end, next_char)
+        ):
             continue
 
-        next_idx = idx + 1
-        while next_idx < len(text) and text[next_idx].isspace():
-            next_idx += 1
+        boundaries.append(end)
 
-        if next_idx >= len(text):
-            boundaries.append(len(text))
-            continue
+    if not boundaries:
+        return [text_length]
+    if boundaries[-1] != text_length:
+        boundaries.append(text_length)
+    return boundaries
 
-        next_char = text[next_idx]
-        if char == ".":
-            token_start = idx
-            while token_start > 0 and not text[token_start - 1].isspace():
-                token_start -= 1
-            prev_token = text[token_start : idx + 1]
-            prev_token_lower = prev_token.lower()
 
-            if prev_token_lower in non_terminal_abbreviations:
-                continue
+def _get_default_nlp() -> Language:
+    """Return the cached default model, loading en_core_web_md on first use.
 
-            is_acronym = bool(re.fullmatch(r"(?:[A-Za-z]\.){2,}", prev_token))
-            if is_acronym and not next_char.isupper():
-                continue
+    Falls back to a blank English pipeline with a sentencizer (and marks the
+    cache as a fallback) when the model is not installed outside frozen mode.
 
-            if not (next_char.isalpha() or next_char in "\"'([{"):
-                continue
+    Raises:
+        OSError: If the model is missing from a frozen executable bundle.
+    """
+    if _nlp_model is None:
+        with _model_lock:
+            if _nlp_model is None:
+                _load_default_nlp()
 
-        boundaries.append(idx + 1)
+    assert _nlp_model is not None
+    return _nlp_model
 
-    if not boundaries:
-        return [len(text)]
-    if boundaries[-1] != len(text):
-        boundaries.append(len(text))
-    return boundaries
+
+def _load_default_nlp() -> None:
+    """Load en_core_web_md (or the fallback) into the cache; caller holds _model_lock."""
+    global _nlp_model, _using_fallback_model
+
+    started = time.perf_counter()
+    rss_before = _resident_bytes()
+    try:
+        import spacy
+
+        # Check for frozen executable or environment override
+        model_path = _find_spacy_model_path()
+
+        if model_path:
+            # Load from bundled or override path
+            nlp = spacy.load(str(model_path))
+            logger.info(
+                "spaCy model loaded from custom path",
+                model_name="en_core_web_md",
+                path=str(model_path),
+                version=nlp.meta["version"],
+            )
+        else:
+            # Standard load from site-packages
+            nlp = spacy.load("en_core_web_md")
+            logger.info(
+                "spaCy model loaded",
+                model_name="en_core_web_md",
+                version=nlp.meta["version"],
+                language=nlp.meta["lang"],
+                vocab_size=len(nlp.vocab),
+            )
+        _using_fallback_model = False
+        _nlp_model = nlp
+        _record_model_load("parser", "en_core_web_md", started, rss_before)
+    except OSError as e:
+        # Clear error message with actionable resolution (NFR-R3)
+        frozen_base = _get_frozen_base_path()
+        if frozen_base:
+            # In frozen mode, don't suggest download command
+            error_msg = (
+                "spaCy model 'en_core_web_md' not found in frozen executable bundle. "
+                "The model may not have been included during build, or the bundle is corrupted. "
+                "Set SPACY_MODEL_PATH_OVERRIDE environment variable to specify model location."
+            )
+            logger.error("spaCy model load failed", error=str(e), resolution=error_msg)
+            raise OSError(error_msg) from e
+
+        error_msg = (
+            "spaCy model 'en_core_web_md' not found. "
+            "Falling back to lightweight sentence segmentation; "
+            "install with: python -m spacy download en_core_web_md"
+        )
+        logger.warning(
+            "spaCy model load failed, using fallback", error=str(e), resolution=error_msg
+        )
+        nlp = _build_fallback_nlp()
+        # Flag before publishing the model: lock-free readers test both globals
+        _using_fallback_model = True
+        _nlp_model = nlp
+        logger.info(
+            "spaCy fallback model loaded",
+            model_name="blank_en_sentencizer",
+            language=nlp.meta.get("lang"),
+        )
+        _record_model_load("parser", "blank_en_sentencizer", started, rss_before, fallback=True)
+
+
+def _sentence_disable(nlp: Language) -> List[str]:
+    """Names of enabled components in ``nlp`` that do not affect ``doc.sents``."""
+    return [name for name in nlp.pipe_names if name in NON_SENTENCE_COMPONENTS]
 
 
 def get_sentence_boundaries(text: str, nlp: Optional[Language] = None) -> List[int]:
     """Extract sentence boundary positions from text using spaCy.
 
     Returns character offsets (zero-indexed) where each sentence ends.
-    Lazy loads en_core_web_md model if nlp parameter is None.
+    Lazy loads en_core_web_md model if nlp parameter is None. Very long texts
+    are segmented in overlapping windows (see iter_sentence_boundaries()).
 
     Args:
         text: Input text to segment into sentences. Must be non-empty.
@@ -225,79 +430,349 @@ def get_sentence_boundaries(text: str, nlp: Optional[Language] = None) -> List[i
         - NFR-O4: Logs model version on first load
         - NFR-R3: Clear error messages for missing model or invalid input
     """
-    global _nlp_model, _using_fallback_model
-
     # Input validation (NFR-R3)
     if not text or not text.strip():
         raise ValueError("Input text cannot be empty or whitespace-only")
 
+    return list(iter_sentence_boundaries(text, nlp=nlp))
+
+
+def iter_sentence_boundaries(
+    text: str,
+    nlp: Optional[Language] = None,
+    window_chars: int = DEFAULT_SEGMENT_WINDOW_CHARS,
+    overlap_chars: int = DEFAULT_SEGMENT_OVERLAP_CHARS,
+) -> Iterator[int]:
+    """Yield sentence end offsets of ``text`` in order, one window at a time.
+
+    Texts up to ``window_chars`` (capped at ``nlp.max_length``) are segmented
+    in one pass. Longer texts are split into windows ending at a paragraph
+    break (else a line break, else a space) in the second half of the window.
+    Boundaries within ``overlap_chars`` of a window's end are discarded and
+    the next window starts at the last boundary kept, so every boundary that
+    is yielded was decided with at least ``overlap_chars`` of following text.
+    Memory is bounded by the window size, not the document size.
+
+    Args:
+        text: Text to segment (empty text yields nothing)
+        nlp: Optional pre-loaded spaCy Language model (default: en_core_web_md)
+        window_chars: Maximum characters handed to spaCy at once
+        overlap_chars: Characters at the end of each window re-segmented by
+            the next one; must be less than half of ``window_chars``
+
+    Yields:
+        Character offsets where sentences end, as get_sentence_boundaries()
+
+    Raises:
+        ValueError: If the window settings are invalid
+    """
+    if overlap_chars < 0 or overlap_chars * 2 >= window_chars:
+        raise ValueError(
+            f"overlap_chars must be >= 0 and less than half of window_chars, "
+            f"got overlap_chars={overlap_chars}, window_chars={window_chars}"
+        )
+    if not text:
+        return
+
     # Lazy load model if not provided
     if nlp is None:
-        if _nlp_model is None:
-            try:
-                import spacy
-
-                # Check for frozen executable or environment override
-                model_path = _find_spacy_model_path()
-
-                if model_path:
-                    # Load from bundled or override path
-                    _nlp_model = spacy.load(str(model_path))
-                    _using_fallback_model = False
-                    logger.info(
-                        "spaCy model loaded from custom path",
-                        model_name="en_core_web_md",
-                        path=str(model_path),
-                        version=_nlp_model.meta["version"],
-                    )
-                else:
-                    # Standard load from site-packages
-                    _nlp_model = spacy.load("en_core_web_md")
-                    _using_fallback_model = False
-                    logger.info(
-                        "spaCy model loaded",
-                        model_name="en_core_web_md",
-                        version=_nlp_model.meta["version"],
-                        language=_nlp_model.meta["lang"],
-                        vocab_size=len(_nlp_model.vocab),
-                    )
-            except OSError as e:
-                # Clear error message with actionable resolution (NFR-R3)
-                frozen_base = _get_frozen_base_path()
-                if frozen_base:
-                    # In frozen mode, don't suggest download command
-                    error_msg = (
-                        "spaCy model 'en_core_web_md' not found in frozen executable bundle. "
-                        "The model may not have been included during build, or the bundle is corrupted. "
-                        "Set SPACY_MODEL_PATH_OVERRIDE environment variable to specify model location."
-                    )
-                    logger.error("spaCy model load failed", error=str(e), resolution=error_msg)
-                    raise OSError(error_msg) from e
-
-                error_msg = (
-                    "spaCy model 'en_core_web_md' not found. "
-                    "Falling back to lightweight sentence segmentation; "
-                    "install with: python -m spacy download en_core_web_md"
-                )
-                logger.warning(
-                    "spaCy model load failed, using fallback", error=str(e), resolution=error_msg
-                )
-                _nlp_model = _build_fallback_nlp()
-                _using_fallback_model = True
-                logger.info(
-                    "spaCy fallback model loaded",
-                    model_name="blank_en_sentencizer",
-                    language=_nlp_model.meta.get("lang"),
-                )
-
-        nlp = _nlp_model
+        nlp = _get_default_nlp()
 
     # Process text and extract sentence boundaries
-    assert nlp is not None
     if nlp is _nlp_model and _using_fallback_model:
-        return _heuristic_sentence_boundaries(text)
+        # Regex scan over the string; no Doc is built, so no windowing needed
+        yield from _heuristic_sentence_boundaries(text)
+        return
+
+    # Only sentence boundaries are read, so skip tagging, lemmatization and NER
+    disable = _sentence_disable(nlp)
+    window_chars = min(window_chars, nlp.max_length)
+    overlap_chars = min(overlap_chars, window_chars // 2 - 1)
+    text_length = len(text)
+    start = 0
+    while start < text_length:
+        end = _window_end(text, start, window_chars)
+        doc = nlp(text[start:end], disable=disable)
+        ends = [start + sent.end_char for sent in doc.sents]
+        del doc
+        if end >= text_length:
+            yield from ends
+            return
+
+        committed = [boundary for boundary in ends if boundary <= end - overlap_chars]
+        if not committed:
+            # One sentence spans the overlap: keep its last interior boundary, or
+            # cut at the window end when the whole window is a single sentence.
+            committed = [boundary for boundary in ends if boundary < end][-1:] or [end]
+        yield from committed
+        start = committed[-1]
+
+
+def _window_end(text: str, start: int, window_chars: int) -> int:
+    """End offset of the segmentation window starting at ``start``."""
+    limit = start + window_chars
+    if limit >= len(text):
+        return len(text)
+    floor = start + window_chars // 2
+    for separator in ("\n\n", "\n", " "):
+        cut = text.rfind(separator, floor, limit)
+        if cut != -1:
+            return cut + len(separator)
+    return limit
+
+
+def get_sentence_boundaries_batch(
+    texts: Iterable[str],
+    nlp: Optional[Language] = None,
+    batch_size: int = DEFAULT_SENTENCE_BATCH_SIZE,
+    n_process: int = 1,
+) -> List[List[int]]:
+    """Extract sentence boundary positions for many texts in one ``nlp.pipe`` call.
+
+    Equivalent to calling :func:`get_sentence_boundaries` on each text, but
+    texts are streamed through spaCy in batches and every component that does
+    not set sentence boundaries (tagger, lemmatizer, NER, ...) is disabled.
+    Texts longer than ``DEFAULT_SEGMENT_WINDOW_CHARS`` are segmented in
+    windows by :func:`iter_sentence_boundaries`.
 
-    doc = nlp(text)
-    boundaries = [sent.end_char for sent in doc.sents]
+    Args:
+        texts: Texts to segment
+        nlp: Optional pre-loaded spaCy Language model. If None, uses the same
+            lazily loaded en_core_web_md as get_sentence_boundaries().
+        batch_size: Number of texts spaCy processes per batch
+        n_process: Worker processes for ``nlp.pipe`` (1 keeps it in-process)
 
-    return boundaries
+    Returns:
+        One list of sentence end offsets per input text, in input order.
+        Empty or whitespace-only texts get an empty list instead of raising.
+
+    Raises:
+        ValueError: If batch_size or n_process is less than 1
+        OSError: If required spaCy resources are unavailable in frozen mode.
+
+    Example:
+        >>> get_sentence_boundaries_batch(["Hello. World.", "", "One more."])
+        [[6, 13], [], [9]]
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    if n_process < 1:
+        raise ValueError(f"n_process must be >= 1, got {n_process}")
+
+    text_list = list(texts)
+    results: List[List[int]] = [[] for _ in text_list]
+    pending = [index for index, text in enumerate(text_list) if text and text.strip()]
+    if not pending:
+        return results
+
+    if nlp is None:
+        nlp = _get_default_nlp()
+    if nlp is _nlp_model and _using_fallback_model:
+        for index in pending:
+            results[index] = _heuristic_sentence_boundaries(text_list[index])
+        return results
+
+    # Texts too long for one Doc are segmented window by window instead
+    window_chars = min(DEFAULT_SEGMENT_WINDOW_CHARS, nlp.max_length)
+    short = [index for index in pending if len(text_list[index]) <= window_chars]
+    docs = nlp.pipe(
+        (text_list[index] for index in short),
+        batch_size=batch_size,
+        n_process=n_process,
+        disable=_sentence_disable(nlp),
+    )
+    for index, doc in zip(short, docs):
+        results[index] = [sent.end_char for sent in doc.sents]
+    for index in pending:
+        if len(text_list[index]) > window_chars:
+            results[index] = list(iter_sentence_boundaries(text_list[index], nlp=nlp))
+    return results
+
+
+# Segmentation backend: (texts, batch_size, n_process) -> boundaries per text,
+# with empty lists for empty or whitespace-only texts.
+SegmentationBackend = Callable[[Sequence[str], int, int], List[List[int]]]
+
+_SEGMENTATION_BACKENDS: Dict[str, SegmentationBackend] = {}
+
+
+def register_segmentation_backend(name: str, backend: SegmentationBackend) -> None:
+    """Register (or replace) a sentence segmentation backend under ``name``."""
+    _SEGMENTATION_BACKENDS[name.strip().lower()] = backend
+
+
+def get_segmentation_backend(name: str) -> SegmentationBackend:
+    """Return the segmentation backend registered under ``name``.
+
+    Raises:
+        ValueError: If no backend is registered under ``name``
+    """
+    backend = _SEGMENTATION_BACKENDS.get(str(name or "").strip().lower())
+    if backend is None:
+        raise ValueError(
+            f"Invalid segmentation backend '{name}'. "
+            f"Must be one of: {', '.join(segmentation_backend_names())}"
+        )
+    return backend
+
+
+def segmentation_backend_names() -> List[str]:
+    """Names of the registered segmentation backends, sorted."""
+    return sorted(_SEGMENTATION_BACKENDS)
+
+
+def _get_senter_nlp() -> Optional[Language]:
+    """Return en_core_web_md with only its ``senter`` component enabled.
+
+    Returns None (and logs once) when the model or its senter is unavailable,
+    in which case the senter backend uses the heuristic segmenter.
+    """
+    if _senter_model is None and not _senter_unavailable:
+        with _model_lock:
+            if _senter_model is None and not _senter_unavailable:
+                _load_senter_nlp()
+    return _senter_model
+
+
+def _load_senter_nlp() -> None:
+    """Load the senter-only pipeline into the cache; caller holds _model_lock."""
+    global _senter_model, _senter_unavailable
+
+    started = time.perf_counter()
+    rss_before = _resident_bytes()
+    try:
+        import spacy
+
+        model_path = _find_spacy_model_path()
+        _senter_model = spacy.load(
+            str(model_path) if model_path else "en_core_web_md", enable=["senter"]
+        )
+        logger.info(
+            "spaCy senter model loaded",
+            model_name="en_core_web_md",
+            version=_senter_model.meta["version"],
+        )
+        _record_model_load("senter", "en_core_web_md", started, rss_before)
+    except (OSError, ValueError) as e:
+        _senter_unavailable = True
+        logger.warning(
+            "spaCy senter unavailable, using heuristic segmentation",
+            error=str(e),
+            resolution="install with: python -m spacy download en_core_web_md",
+        )
+
+
+def _get_sentencizer_nlp() -> Language:
+    """Return the cached blank English pipeline with a rule-based sentencizer."""
+    global _sentencizer_model
+
+    if _sentencizer_model is None:
+        with _model_lock:
+            if _sentencizer_model is None:
+                started = time.perf_counter()
+                rss_before = _resident_bytes()
+                _sentencizer_model = _build_fallback_nlp()
+                _record_model_load("sentencizer", "blank_en_sentencizer", started, rss_before)
+    return _sentencizer_model
+
+
+# Loaders for the backends that run a cached spaCy pipeline
+_BACKEND_MODEL_LOADERS: Dict[str, Callable[[], Optional[Language]]] = {
+    "parser": _get_default_nlp,
+    "senter": _get_senter_nlp,
+    "sentencizer": _get_sentencizer_nlp,
+}
+
+
+def warm_nlp_models(
+    backends: Iterable[str] = (DEFAULT_SEGMENTATION_BACKEND,), freeze: bool = False
+) -> Dict[str, ModelLoadStats]:
+    """Load the spaCy pipelines used by ``backends`` ahead of the first document.
+
+    Pipelines already cached are not reloaded. Backends without a pipeline
+    (``heuristic`` and custom registrations) are skipped.
+
+    Args:
+        backends: Segmentation backend names to warm
+        freeze: Collect garbage and move every surviving object into the
+            permanent GC generation afterwards (``gc.freeze()``). Call with
+            True right before forking workers: collections in the children
+            then never write to the model's objects, so their memory pages
+            stay shared copy-on-write with the parent.
+
+    Returns:
+        Load stats of the warmed pipelines that are cached (see nlp_model_stats())
+
+    Raises:
+        ValueError: If a backend is not registered
+        OSError: If en_core_web_md is missing from a frozen executable bundle
+    """
+    names = [name.strip().lower() for name in backends]
+    for name in names:
+        get_segmentation_backend(name)
+    for name in names:
+        loader = _BACKEND_MODEL_LOADERS.get(name)
+        if loader is not None:
+            loader()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return {name: stats for name, stats in _model_stats.items() if name in names}
+
+
+def nlp_model_stats() -> Dict[str, ModelLoadStats]:
+    """Load stats of the spaCy pipelines loaded by this process, keyed by backend."""
+    return dict(_model_stats)
+
+
+def clear_nlp_models() -> None:
+    """Drop every cached spaCy pipeline and its stats (the next lookup reloads)."""
+    global _nlp_model, _using_fallback_model, _senter_model, _senter_unavailable
+    global _sentencizer_model
+
+    with _model_lock:
+        _nlp_model = None
+        _using_fallback_model = False
+        _senter_model = None
+        _senter_unavailable = False
+        _sentencizer_model = None
+        _model_stats.clear()
+
+
+def _parser_backend(texts: Sequence[str], batch_size: int, n_process: int) -> List[List[int]]:
+    return get_sentence_boundaries_batch(texts, batch_size=batch_size, n_process=n_process)
+
+
+def _senter_backend(texts: Sequence[str], batch_size: int, n_process: int) -> List[List[int]]:
+    nlp = _get_senter_nlp()
+    if nlp is None:
+        return _heuristic_backend(texts, batch_size, n_process)
+    return get_sentence_boundaries_batch(texts, nlp=nlp, batch_size=batch_size, n_process=n_process)
+
+
+def _sentencizer_backend(texts: Sequence[str], batch_size: int, n_process: int) -> List[List[int]]:
+    return get_sentence_boundaries_batch(
+        texts, nlp=_get_sentencizer_nlp(), batch_size=batch_size, n_process=n_process
+    )
+
+
+def _heuristic_backend(texts: Sequence[str], batch_size: int, n_process: int) -> List[List[int]]:
+    return [_heuristic_sentence_boundaries(text) if text and text.strip() else [] for text in texts]
+
+
+register_segmentation_backend("parser", _parser_backend)
+register_segmentation_backend("senter", _senter_backend)
+register_segmentation_backend("sentencizer", _sentencizer_backend)
+register_segmentation_backend("heuristic", _heuristic_backend)
+
+
+def _reset_model_lock_after_fork() -> None:
+    # Models loaded before the fork are inherited (and shared copy-on-write);
+    # a lock held by another thread at fork time would never be released.
+    global _model_lock
+    _model_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_model_lock_after_fork)
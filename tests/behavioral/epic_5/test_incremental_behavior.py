@@ -241,12 +241,12 @@ class TestStateFilePersistence:
         if files_to_process:
             processor._update_state(files_to_process)
 
-        # Then - state file should be valid JSON
+        # Then - a fresh read of the state store should see a complete state
         state_file = processor.state_file.get_path()
         assert state_file.exists(), "State file should exist after update"
 
-        written_state = json.loads(state_file.read_text())
-        assert isinstance(written_state, dict), "State should be valid JSON dict"
+        written_state = processor.state_file.load()
+        assert isinstance(written_state, dict), "State should load as a dict"
         assert "files" in written_state, "State should have 'files' key"
         assert "version" in written_state, "State should have 'version' key"
 
@@ -310,7 +310,9 @@ class TestIncrementalModeIntegration:
         assert ".data-extract-session" in str(
             state_path
         ), "State file should be in .data-extract-session"
-        assert "incremental-state.json" in str(state_path), "State file should be named correctly"
+        assert "incremental-state.sqlite3" in str(
+            state_path
+        ), "State file should be named correctly"
 
     def test_force_flag_bypasses_incremental_skip(self, processed_corpus_with_state: dict) -> None:
         """
@@ -9,7 +9,6 @@ Reference: docs/tech-spec-epic-5.md
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pytest
@@ -191,7 +190,10 @@ class TestProcessIncrementalFlag:
         # Then
         assert result.exit_code == 0
         # State file should be updated with new files
-        state = json.loads(state_file.read_text())
+        from data_extract.cli.batch import StateStore
+
+        state = StateStore(state_file.parent.parent).load()
+        assert state is not None
         assert len(state["files"]) > 0
 
 
@@ -0,0 +1,96 @@
+"""Performance Tests for Text Cleaning (Story 2.1).
+
+Compares TextCleaner's fused artifact detection and regex whitespace
+normalization against the previous path (one findall + sub per artifact
+pattern, then a Python loop over every line) on OCR-heavy text.
+
+Requirements:
+- Identical cleaned text and CleaningResult counts from both paths
+- Fused path faster than the previous path (with tolerance for CI noise)
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from data_extract.normalize.cleaning import TextCleaner
+from data_extract.normalize.config import NormalizationConfig
+
+pytestmark = [
+    pytest.mark.P1,
+    pytest.mark.performance,
+]
+
+
+def _ocr_text(lines: int = 40_000) -> str:
+    rng = random.Random(3)
+    vocabulary = ["control", "audit", "evidence", "risk", "the", "of", "and", "testing"]
+    out = []
+    for _ in range(lines):
+        line = " ".join(rng.choice(vocabulary) for _ in range(10))
+        roll = rng.random()
+        if roll < 0.03:
+            line += " ^^^^ ~~~"
+        elif roll < 0.05:
+            line = "    " + line + "  \t end"
+        elif roll < 0.06:
+            line = "_" * 15
+        elif roll < 0.065:
+            line += "\x0c"
+        out.append(line)
+    return "\n".join(out)
+
+
+def _legacy_clean(cleaner: TextCleaner, text: str) -> tuple[str, int, bool]:
+    """Previous behaviour: a findall + sub pass per pattern, then a per-line loop."""
+    cleaned, removed = text, 0
+    for pattern, replacement in cleaner._ocr_patterns:
+        matches = pattern.findall(cleaned)
+        if matches:
+            removed += len(matches)
+            cleaned = pattern.sub(replacement, cleaned)
+
+    original = cleaned
+    lines = []
+    for line in cleaned.replace("\t", " " * 4).split("\n"):
+        leading_space = len(line) - len(line.lstrip(" "))
+        content = re.sub(r" {2,}", " ", line.lstrip(" "))
+        lines.append((" " * leading_space) + content if leading_space > 0 else content)
+    max_newlines = cleaner.config.whitespace_max_consecutive_newlines
+    cleaned = re.sub(r"\n{3,}", "\n" * max_newlines, "\n".join(lines)).strip()
+    return cleaned, removed, cleaned != original
+
+
+class TestCleaningPerformance:
+    """Micro-benchmark of the previous and fused cleaning paths."""
+
+    @pytest.mark.parametrize(
+        "patterns_file",
+        [None, Path("config/normalize/cleaning_rules.yaml")],
+        ids=["default", "rules"],
+    )
+    def test_fused_cleaning_matches_and_beats_legacy(self, patterns_file: Path | None) -> None:
+        cleaner = TextCleaner(NormalizationConfig(ocr_artifact_patterns_file=patterns_file))
+        text = _ocr_text()
+
+        start = time.perf_counter()
+        legacy_text, legacy_removed, legacy_normalized = _legacy_clean(cleaner, text)
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cleaned, result = cleaner.clean_text(text)
+        fused_elapsed = time.perf_counter() - start
+
+        print(
+            f"\n[cleaning] {len(text) / 1e6:.1f}M chars: legacy {legacy_elapsed:.3f}s, "
+            f"fused {fused_elapsed:.3f}s"
+        )
+        assert cleaned == legacy_text
+        assert result.artifacts_removed == legacy_removed > 0
+        assert result.whitespace_normalized is legacy_normalized
+        assert fused_elapsed < legacy_elapsed * 0.9 + 0.02
@@ -0,0 +1,156 @@
+"""Performance Tests for Entity Normalization (Story 2.2).
+
+Validates that EntityNormalizer scales with document and dictionary size:
+- Abbreviation expansion: one scan for the whole dictionary, not one per entry
+- Entity recognition: one scan for the whole text, linear in document length
+- Cross-reference resolution: indexed partial matching, linear in entity count
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from data_extract.core.models import Document, Entity, EntityType, Metadata, ProcessingContext
+from data_extract.normalize.entities import EntityNormalizer
+
+pytestmark = [
+    pytest.mark.P1,
+    pytest.mark.performance,
+]
+
+
+def _audit_dictionary(size: int) -> dict[str, dict[str, object]]:
+    return {
+        f"ab{index}x": {
+            "full_form": f"Audit Term {index}",
+            "case_sensitive": index % 7 == 0,
+            "context_required": index % 3 == 0,
+            "context_keywords": ["audit"],
+            "category": "general",
+        }
+        for index in range(size)
+    }
+
+
+def _document(text: str) -> Document:
+    return Document(
+        id="perf-doc",
+        text=text,
+        metadata=Metadata(
+            source_file=Path("perf.txt"),
+            file_hash="perf",
+            processing_timestamp=datetime.now(),
+            tool_version="0.1.0",
+            config_version="1.0",
+            document_type="test",
+        ),
+    )
+
+
+def _mentions(count: int) -> list[Entity]:
+    """Risk/control mentions with repeats, short forms and low-confidence references."""
+    rng = random.Random(count)
+    forms = [
+        (EntityType.RISK, "Risk-{}"),
+        (EntityType.CONTROL, "CTRL-{}"),
+        (EntityType.POLICY, "POL{}"),
+        (EntityType.RISK, "R{}"),
+    ]
+    mentions = []
+    for index in range(count):
+        number = rng.randrange(count // 2 + 1)
+        entity_type, form = rng.choice(forms)
+        text = form.format(number)
+        mentions.append(
+            Entity(
+                type=entity_type,
+                id=f"{entity_type.value.title()}-{number}",
+                text=text,
+                confidence=0.95 if rng.random() < 0.5 else 0.8,
+                location={"start": index * 10, "end": index * 10 + len(text)},
+            )
+        )
+    return mentions
+
+
+class TestEntityNormalizerPerformance:
+    """Scaling benchmarks for EntityNormalizer."""
+
+    def test_abbreviation_expansion_large_dictionary(self) -> None:
+        """A 2,000-entry dictionary over ~100k words expands in well under a second."""
+        normalizer = EntityNormalizer()
+        normalizer.dictionary = _audit_dictionary(2000)
+        rng = random.Random(7)
+        vocabulary = ["audit", "control", "the", "review", "evidence", "of", "testing"]
+        words = [
+            f"ab{rng.randrange(2000)}x" if rng.random() < 0.05 else rng.choice(vocabulary)
+            for _ in range(100_000)
+        ]
+        text = " ".join(words)
+
+        normalizer.expand_abbreviations("warm up")  # Compile the matcher once
+        start = time.perf_counter()
+        expanded, log = normalizer.expand_abbreviations(text)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n[entities] expand_abbreviations 2000 entries, 100k words: {elapsed:.3f}s")
+        assert len(log) > 1000
+        assert len(expanded) > len(text)
+        assert elapsed < 2.0, f"Expansion took {elapsed:.2f}s, requirement is <2.0s"
+
+    def test_entity_recognition_scales_linearly(self) -> None:
+        """Recognition time grows linearly with document length.
+
+        The entity count is held at 200 so cross-reference resolution, which
+        depends on entities rather than words, does not dominate the timing.
+        """
+        normalizer = EntityNormalizer(patterns_file=Path("config/normalize/entity_patterns.yaml"))
+        context = ProcessingContext()
+        rng = random.Random(11)
+        vocabulary = ["the", "control", "owner", "reviewed", "evidence", "for", "quarter"]
+
+        def timed(word_count: int) -> tuple[float, int]:
+            spacing = word_count // 200
+            words = [
+                f"Risk-{index}" if index % spacing == 0 else rng.choice(vocabulary)
+                for index in range(word_count)
+            ]
+            document = _document(" ".join(words))
+            start = time.perf_counter()
+            result = normalizer.process(document, context)
+            return time.perf_counter() - start, len(result.entities)
+
+        timed(1000)  # Compile patterns and the combined scanner once
+        small_elapsed, small_entities = timed(25_000)
+        large_elapsed, large_entities = timed(100_000)
+
+        print(
+            f"\n[entities] process 25k words {small_elapsed:.3f}s, "
+            f"100k words {large_elapsed:.3f}s"
+        )
+        assert small_entities == large_entities == 200
+        assert large_elapsed < 2.0, f"Recognition took {large_elapsed:.2f}s, requirement <2.0s"
+        assert large_elapsed < small_elapsed * 8 + 0.1
+
+    @pytest.mark.parametrize("count", [1_000, 10_000, 100_000])
+    def test_cross_reference_resolution_scales_linearly(self, count: int) -> None:
+        """Resolution cost per entity stays flat from 1k to 100k entities."""
+        mentions = _mentions(count)
+        normalizer = EntityNormalizer()
+
+        start = time.perf_counter()
+        resolved = normalizer.resolve_cross_references(mentions)
+        elapsed = time.perf_counter() - start
+
+        per_entity_us = elapsed / count * 1e6
+        print(f"\n[entities] resolve_cross_references {count} entities: {elapsed:.3f}s")
+        assert len(resolved) == count
+        assert sum(len(texts) for texts in normalizer.entity_graph.values()) == count
+        # Pairwise comparison needs ~count/4 substring checks per entity; indexed
+        # lookup stays in the tens of microseconds even at 100k.
+        assert per_entity_us < 100, f"{per_entity_us:.1f}us per entity"
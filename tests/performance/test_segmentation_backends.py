@@ -0,0 +1,175 @@
+"""Performance Tests for Sentence Segmentation Backends.
+
+Reports throughput (sentences/second) and boundary agreement with the
+``parser`` backend for every registered segmentation backend on the fixture
+corpus, so a backend can be picked per pipeline profile. Also compares the
+compiled-regex heuristic against the previous per-character scan, and the
+peak memory of windowed against single-pass segmentation of a long text.
+
+Run with ``-s`` to see the report table. When en_core_web_md is not
+installed, ``parser`` and ``senter`` fall back to the heuristic, so their
+rows measure the fallback rather than the statistical model.
+
+Requirements:
+- Every backend returns boundaries ending at the end of each non-empty text
+- Heuristic backend identical to, and faster than, the per-character scan
+- Windowed segmentation identical to, and lighter than, one Doc for the whole text
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import pytest
+import spacy
+
+from data_extract.utils.nlp import (
+    _heuristic_sentence_boundaries,
+    get_segmentation_backend,
+    iter_sentence_boundaries,
+    segmentation_backend_names,
+)
+
+pytestmark = [
+    pytest.mark.P1,
+    pytest.mark.performance,
+]
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+REFERENCE_BACKEND = "parser"
+
+
+def _corpus() -> List[str]:
+    texts = [
+        path.read_text(encoding="utf-8", errors="ignore")
+        for path in sorted((FIXTURES / "semantic" / "corpus").rglob("*.txt"))
+    ]
+    gold = json.loads((FIXTURES / "spacy_gold_standard.json").read_text(encoding="utf-8"))
+    texts.extend(case["text"] for case in gold["test_cases"])
+    return [text for text in texts if text.strip()]
+
+
+def _agreement(reference: Sequence[List[int]], candidate: Sequence[List[int]]) -> float:
+    """Boundary F1 of ``candidate`` against ``reference``, pooled over all texts."""
+    matched = total = 0
+    for expected, actual in zip(reference, candidate):
+        matched += len(set(expected) & set(actual))
+        total += len(expected) + len(actual)
+    return 2 * matched / total if total else 1.0
+
+
+def _legacy_heuristic(text: str) -> List[int]:
+    """Previous behaviour: a Python loop over every character of the text."""
+    boundaries: List[int] = []
+    abbreviations = {"dr.", "mr.", "mrs.", "ms.", "prof.", "inc.", "ltd.", "corp.", "co."}
+    abbreviations |= {"vs.", "e.g.", "i.e."}
+    for idx, char in enumerate(text):
+        if char not in ".!?":
+            continue
+        if idx + 1 < len(text) and not text[idx + 1].isspace():
+            continue
+        next_idx = idx + 1
+        while next_idx < len(text) and text[next_idx].isspace():
+            next_idx += 1
+        if next_idx >= len(text):
+            boundaries.append(len(text))
+            continue
+        next_char = text[next_idx]
+        if char == ".":
+            token_start = idx
+            while token_start > 0 and not text[token_start - 1].isspace():
+                token_start -= 1
+            prev_token = text[token_start : idx + 1]
+            if prev_token.lower() in abbreviations:
+                continue
+            if re.fullmatch(r"(?:[A-Za-z]\.){2,}", prev_token) and not next_char.isupper():
+                continue
+            if not (next_char.isalpha() or next_char in "\"'([{"):
+                continue
+        boundaries.append(idx + 1)
+    if not boundaries:
+        return [len(text)]
+    if boundaries[-1] != len(text):
+        boundaries.append(len(text))
+    return boundaries
+
+
+class TestSegmentationBackendBenchmark:
+    """Throughput/accuracy report across segmentation backends."""
+
+    def test_backend_throughput_and_agreement_report(self) -> None:
+        texts = _corpus()
+        results: Dict[str, List[List[int]]] = {}
+        rows = []
+
+        for name in segmentation_backend_names():
+            backend = get_segmentation_backend(name)
+            backend(texts[:1], 1, 1)  # load models outside the timed run
+
+            start = time.perf_counter()
+            boundaries = backend(texts, 64, 1)
+            elapsed = time.perf_counter() - start
+
+            results[name] = boundaries
+            sentences = sum(len(text_boundaries) for text_boundaries in boundaries)
+            rows.append((name, sentences, sentences / max(elapsed, 1e-9)))
+
+        print(f"\n[segmentation] {len(texts)} texts, agreement vs {REFERENCE_BACKEND}:")
+        for name, sentences, rate in rows:
+            agreement = _agreement(results[REFERENCE_BACKEND], results[name])
+            print(
+                f"  {name:<12} {sentences:>6} sentences {rate:>12,.0f}/s "
+                f"agreement {agreement:.3f}"
+            )
+            assert 0.0 <= agreement <= 1.0
+
+        for name, boundaries in results.items():
+            assert [text_boundaries[-1] for text_boundaries in boundaries] == [
+                len(text) for text in texts
+            ], name
+        assert _agreement(results[REFERENCE_BACKEND], results[REFERENCE_BACKEND]) == 1.0
+
+    def test_regex_heuristic_matches_and_beats_character_scan(self) -> None:
+        texts = _corpus()
+        text = "\n\n".join(texts * 10)
+
+        start = time.perf_counter()
+        legacy = _legacy_heuristic(text)
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compiled = _heuristic_sentence_boundaries(text)
+        compiled_elapsed = time.perf_counter() - start
+
+        print(
+            f"\n[segmentation] heuristic on {len(text):,} chars: character scan "
+            f"{legacy_elapsed:.3f}s, compiled regex {compiled_elapsed:.3f}s"
+        )
+        assert compiled == legacy
+        assert compiled_elapsed < legacy_elapsed
+
+    def test_windowed_segmentation_bounds_peak_memory(self) -> None:
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        text = "\n\n".join(_corpus())
+        nlp.max_length = len(text) + 1
+
+        tracemalloc.start()
+        single_pass = [sent.end_char for sent in nlp(text).sents]
+        single_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        windowed = list(iter_sentence_boundaries(text, nlp=nlp, window_chars=50_000))
+        windowed_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(
+            f"\n[segmentation] peak memory on {len(text):,} chars: single pass "
+            f"{single_peak / 2**20:.1f} MiB, 50k-char windows {windowed_peak / 2**20:.1f} MiB"
+        )
+        assert windowed == single_pass
+        assert windowed_peak < single_peak
@@ -270,6 +270,47 @@ def test_build_process_request_from_form_enforces_upload_limits(
     assert getattr(exc_info.value, "status_code", None) == 413
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "overrides",
+    [{"executor": "gpu"}, {"workers": 0}, {"workers": 10_000}],
+)
+def test_enqueue_process_job_rejects_invalid_executor_settings(
+    monkeypatch: pytest.MonkeyPatch, overrides: dict[str, Any]
+) -> None:
+    monkeypatch.setattr(
+        jobs_router_module.runtime,
+        "enqueue_process",
+        lambda *_args, **_kwargs: pytest.fail("invalid request was enqueued"),
+    )
+    request = JsonRequestStub(
+        {"input_path": str(jobs_router_module.JOBS_HOME / "source"), **overrides}
+    )
+
+    with pytest.raises(Exception) as exc_info:
+        asyncio.run(enqueue_process_job(request))  # type: ignore[arg-type]
+
+    assert getattr(exc_info.value, "status_code", None) == 422
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("values", [{"executor": "gpu"}, {"workers": "10000"}])
+def test_build_process_request_from_form_rejects_invalid_executor_settings(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, values: dict[str, str]
+) -> None:
+    monkeypatch.setattr(jobs_router_module, "JOBS_HOME", tmp_path)
+    monkeypatch.setattr(jobs_router_module, "UploadFile", DummyUpload)
+    request = MultipartRequestStub(
+        values={"chunk_size": "64", **values},
+        files=[DummyUpload(filename="upload.txt", payload=b"hello world")],
+    )
+
+    with pytest.raises(Exception) as exc_info:
+        asyncio.run(_build_process_request_from_form(request, "job-126"))  # type: ignore[arg-type]
+
+    assert getattr(exc_info.value, "status_code", None) == 422
+
+
 @pytest.mark.unit
 def test_enqueue_process_job_returns_503_when_queue_is_full(
     monkeypatch: pytest.MonkeyPatch,
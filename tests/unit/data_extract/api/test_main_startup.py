@@ -168,3 +168,29 @@ def test_main_import_does_not_emit_deprecated_fastapi_lifecycle_warnings(monkeyp
         for w in captured
         if issubclass(w.category, DeprecationWarning)
     )
+
+
+def test_startup_prewarms_nlp_models_in_background(monkeypatch) -> None:
+    main_module, _calls = _load_main_module(monkeypatch)
+    warmed = []
+    nlp_stub = types.ModuleType("data_extract.utils.nlp")
+    nlp_stub.warm_nlp_models = lambda: warmed.append(True)
+    monkeypatch.setitem(sys.modules, "data_extract.utils.nlp", nlp_stub)
+    monkeypatch.delenv("DATA_EXTRACT_API_PREWARM_NLP", raising=False)
+
+    thread = main_module._start_nlp_prewarm()
+
+    assert thread is not None
+    thread.join(timeout=5)
+    assert warmed == [True]
+
+
+def test_startup_skips_nlp_prewarm_when_disabled(monkeypatch) -> None:
+    main_module, calls = _load_main_module(monkeypatch)
+    monkeypatch.setenv("DATA_EXTRACT_API_PREWARM_NLP", "0")
+    monkeypatch.delenv("DATA_EXTRACT_API_REMOTE_BIND", raising=False)
+
+    main_module.startup_event()
+
+    assert main_module._start_nlp_prewarm() is None
+    assert calls["start"] == 1
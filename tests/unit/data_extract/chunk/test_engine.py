@@ -281,6 +281,138 @@ class TestChunkingEngineBasicOperation:
         assert chunk.token_count > 0
 
 
+class TestChunkingEngineStreaming:
+    """Test incremental chunking via chunk_stream()."""
+
+    @staticmethod
+    def _segmenter():
+        segmenter = Mock()
+        segmenter.segment.side_effect = lambda text: [
+            sentence for sentence in text.strip().split("\n") if sentence
+        ]
+        return segmenter
+
+    def test_chunk_stream_matches_chunk_document(self):
+        """Should produce the same chunks as chunking the concatenated text."""
+        sentences = [f"Control {i:03d} was tested and evidence was retained." for i in range(90)]
+        pages = ["\n".join(sentences[start : start + 7]) for start in range(0, 90, 7)]
+        document = Document(
+            id="stream_doc",
+            text="\n".join(pages),
+            entities=[],
+            metadata=create_test_metadata("binder.pdf"),
+            structure={},
+        )
+        context = ProcessingContext(config={}, logger=Mock(), metrics={})
+        engine = ChunkingEngine(segmenter=self._segmenter(), chunk_size=128, overlap_pct=0.15)
+
+        expected = engine.process(document, context)
+        streamed = list(engine.chunk_stream(iter(pages), document, context))
+
+        assert len(expected) > engine.STREAM_FLUSH_CHUNKS
+        assert [chunk.text for chunk in streamed] == [chunk.text for chunk in expected]
+        assert [chunk.id for chunk in streamed] == [chunk.id for chunk in expected]
+
+    def test_chunk_stream_yields_before_input_is_exhausted(self):
+        """Should emit chunks while later fragments have not been produced yet."""
+        consumed = []
+
+        def pages():
+            for page_num in range(40):
+                consumed.append(page_num)
+                yield "\n".join(
+                    f"Page {page_num} finding {i} requires remediation by owner." for i in range(6)
+                )
+
+        document = Document(
+            id="stream_doc",
+            text="",
+            entities=[],
+            metadata=create_test_metadata("binder.pdf"),
+            structure={},
+        )
+        context = ProcessingContext(config={}, logger=Mock(), metrics={})
+        engine = ChunkingEngine(segmenter=self._segmenter(), chunk_size=128, overlap_pct=0.0)
+
+        first = next(engine.chunk_stream(pages(), document, context))
+
+        assert first.id == "binder_chunk_000"
+        assert len(consumed) < 40
+
+    def test_chunk_stream_skips_blank_fragments(self):
+        """Should return no chunks when every fragment is blank."""
+        document = Document(
+            id="stream_doc",
+            text="",
+            entities=[],
+            metadata=create_test_metadata("blank.pdf"),
+            structure={},
+        )
+        context = ProcessingContext(config={}, logger=Mock(), metrics={})
+        engine = ChunkingEngine(segmenter=self._segmenter(), chunk_size=128, overlap_pct=0.0)
+
+        assert list(engine.chunk_stream(["", "  "], document, context)) == []
+
+
+class TestChunkingEngineBatch:
+    """Test batched chunking via chunk_documents()."""
+
+    @staticmethod
+    def _documents():
+        return [
+            Document(
+                id=f"batch_doc_{index}",
+                text=" ".join(
+                    f"Finding {index}-{i} was escalated to the control owner." for i in range(30)
+                ),
+                entities=[],
+                metadata=create_test_metadata(f"batch_{index}.pdf"),
+                structure={},
+            )
+            for index in range(3)
+        ] + [
+            Document(
+                id="batch_doc_empty",
+                text="   ",
+                entities=[],
+                metadata=create_test_metadata("empty.pdf"),
+                structure={},
+            )
+        ]
+
+    def test_chunk_documents_matches_per_document_chunking(self):
+        """Should produce the same chunks as processing each document separately."""
+        from data_extract.chunk.sentence_segmenter import SentenceSegmenter
+
+        documents = self._documents()
+        context = ProcessingContext(config={}, logger=Mock(), metrics={})
+        engine = ChunkingEngine(segmenter=SentenceSegmenter(batch_size=2), chunk_size=128)
+
+        expected = [engine.process(document, context) for document in documents]
+        batched = engine.chunk_documents(documents, context)
+
+        assert [[chunk.text for chunk in chunks] for chunks in batched] == [
+            [chunk.text for chunk in chunks] for chunks in expected
+        ]
+        assert batched[-1] == []
+
+    def test_chunk_documents_segments_in_one_call(self):
+        """Should hand every document's text to segment_batch() at once."""
+        segmenter = Mock()
+        segmenter.segment_batch.side_effect = lambda texts: [
+            [sentence + "." for sentence in text.split(". ") if sentence] for text in texts
+        ]
+        documents = self._documents()
+        context = ProcessingContext(config={}, logger=Mock(), metrics={})
+        engine = ChunkingEngine(segmenter=segmenter, chunk_size=128)
+
+        engine.chunk_documents(documents, context)
+
+        segmenter.segment_batch.assert_called_once()
+        assert len(segmenter.segment_batch.call_args.args[0]) == len(documents)
+        segmenter.segment.assert_not_called()
+
+
 @pytest.fixture
 def mock_document():
     """Fixture providing a standard test document."""
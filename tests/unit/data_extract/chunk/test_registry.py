@@ -0,0 +1,116 @@
+"""Unit tests for the shared chunking engine registry.
+
+Tests cover:
+- One ChunkingEngine per configuration, reused across lookups
+- Bounded number of cached configurations
+- Single build under concurrent lookups
+- One shared engine chunking documents from several threads at once
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from data_extract.chunk.engine import ChunkingConfig
+from data_extract.chunk.registry import ChunkingEngineRegistry
+from data_extract.core.models import Document, Metadata, ProcessingContext
+
+pytestmark = [pytest.mark.P1, pytest.mark.unit, pytest.mark.chunking]
+
+
+def _document(index: int) -> Document:
+    text = " ".join(
+        f"Document {index} sentence {number} covers control testing." for number in range(40)
+    )
+    return Document(
+        id=f"doc-{index}",
+        text=text,
+        entities=[],
+        metadata=Metadata(
+            source_file=Path(f"doc-{index}.txt"),
+            file_hash=f"hash-{index}",
+            processing_timestamp=datetime.now(timezone.utc),
+            tool_version="3.1.0",
+            config_version="1.0",
+        ),
+        structure={},
+    )
+
+
+def _chunk_texts(engine, document: Document) -> list:
+    context = ProcessingContext(config={}, metrics={})
+    return [chunk.text for chunk in engine.process(document, context)]
+
+
+class TestChunkingEngineRegistry:
+    """Test ChunkingEngineRegistry caching and sharing."""
+
+    def test_same_config_reuses_engine_and_reports_load_once(self) -> None:
+        registry = ChunkingEngineRegistry()
+
+        first, first_load_ms = registry.acquire(ChunkingConfig(chunk_size=256))
+        second, second_load_ms = registry.acquire(ChunkingConfig(chunk_size=256))
+
+        assert first is second
+        assert first_load_ms > 0
+        assert second_load_ms == 0.0
+        assert (registry.loads, registry.hits) == (1, 1)
+
+    def test_different_config_gets_own_engine(self) -> None:
+        registry = ChunkingEngineRegistry()
+
+        default = registry.get(ChunkingConfig())
+        custom = registry.get(ChunkingConfig(chunk_size=256, overlap_pct=0.0))
+
+        assert default is not custom
+        assert (custom.chunk_size, custom.overlap_pct) == (256, 0.0)
+
+    def test_mutating_caller_config_does_not_change_cached_engine(self) -> None:
+        registry = ChunkingEngineRegistry()
+        config = ChunkingConfig(chunk_size=256)
+        engine = registry.get(config)
+
+        config.chunk_size = 1024
+
+        assert registry.get(ChunkingConfig(chunk_size=256)) is engine
+        assert registry.get(config).chunk_size == 1024
+
+    def test_oldest_config_is_evicted_beyond_limit(self) -> None:
+        registry = ChunkingEngineRegistry(max_engines=2)
+        first = registry.get(ChunkingConfig(chunk_size=128))
+        registry.get(ChunkingConfig(chunk_size=256))
+        registry.get(ChunkingConfig(chunk_size=512))
+
+        assert len(registry._entries) == 2
+        assert registry.get(ChunkingConfig(chunk_size=128)) is not first
+
+    def test_concurrent_lookups_build_once(self) -> None:
+        registry = ChunkingEngineRegistry()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup() -> None:
+            barrier.wait()
+            results.append(registry.get(ChunkingConfig()))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registry.loads == 1
+        assert all(engine is results[0] for engine in results)
+
+    def test_shared_engine_chunks_documents_concurrently(self) -> None:
+        engine = ChunkingEngineRegistry().get(ChunkingConfig(chunk_size=64))
+        documents = [_document(index) for index in range(6)]
+        expected = [_chunk_texts(engine, document) for document in documents]
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            actual = list(executor.map(lambda doc: _chunk_texts(engine, doc), documents))
+
+        assert actual == expected
@@ -8,6 +8,7 @@ Tests coverage:
 - IncrementalProcessor: Orchestration and status reporting
 """
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -21,6 +22,7 @@ from data_extract.cli.batch import (
     IncrementalProcessor,
     ProcessingResult,
     StateFile,
+    StateStore,
 )
 
 pytestmark = [pytest.mark.P1, pytest.mark.unit]
@@ -214,6 +216,80 @@ class TestStateFile:
         assert path == tmp_path / ".data-extract-session" / "incremental-state.json"
 
 
+class TestStateStore:
+    """Tests for the SQLite-backed incremental state store."""
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Full saves load back in the StateFile schema, including unknown keys."""
+        store = StateStore(tmp_path)
+        state_data = {
+            "version": "1.0",
+            "source_dir": "/path/to/source",
+            "files": {
+                "/path/to/source/a.pdf": {"hash": "abc123", "size_bytes": 10, "pages": 3},
+            },
+        }
+
+        store.save(state_data)
+
+        assert store.get_path().name == "incremental-state.sqlite3"
+        assert StateStore(tmp_path).load() == state_data
+
+    def test_upsert_updates_only_given_rows(self, tmp_path: Path) -> None:
+        """Bulk upserts replace matching rows and leave the others intact."""
+        store = StateStore(tmp_path)
+        store.save({"version": "1.0", "files": {"a": {"hash": "1"}, "b": {"hash": "2"}}})
+
+        store.upsert_files(
+            {"b": {"hash": "3"}, "c": {"hash": "4"}}, meta={"processed_at": "2026-01-01"}
+        )
+
+        state = store.load()
+        assert state is not None
+        assert state["processed_at"] == "2026-01-01"
+        assert state["files"] == {"a": {"hash": "1"}, "b": {"hash": "3"}, "c": {"hash": "4"}}
+
+    def test_changed_since_run(self, tmp_path: Path) -> None:
+        """Files recorded by later runs are returned by changed_since."""
+        store = StateStore(tmp_path)
+        first = store.begin_run()
+        store.upsert_files({"/src/a.pdf": {"hash": "1"}, "/src/b.pdf": {"hash": "2"}}, first)
+        second = store.begin_run()
+        store.upsert_files({"/src/b.pdf": {"hash": "3"}}, second)
+
+        assert store.latest_run_id() == second
+        assert store.changed_since(first) == [Path("/src/b.pdf")]
+        assert store.changed_since(0) == [Path("/src/a.pdf"), Path("/src/b.pdf")]
+
+    def test_migrates_legacy_json_state(self, tmp_path: Path) -> None:
+        """A legacy JSON state file is imported once and set aside."""
+        legacy_data = {
+            "version": "1.0",
+            "config_hash": "cfg",
+            "files": {"/src/a.pdf": {"hash": "abc", "output_path": "/out/a.json"}},
+        }
+        legacy = StateFile(tmp_path)
+        legacy.save(legacy_data)
+        store = StateStore(tmp_path)
+
+        assert store.exists()
+        assert store.load() == legacy_data
+        assert not legacy.exists()
+        assert legacy.get_path().with_name("incremental-state.json.migrated").exists()
+        assert StateStore(tmp_path).load() == legacy_data
+
+    def test_corrupted_legacy_json_is_not_migrated(self, tmp_path: Path) -> None:
+        """Unreadable legacy state is treated as missing."""
+        legacy = StateFile(tmp_path)
+        legacy.session_dir.mkdir(parents=True)
+        legacy.get_path().write_text("{ invalid json }")
+
+        store = StateStore(tmp_path)
+
+        assert store.load() is None
+        assert not store.get_path().exists()
+
+
 # ============================================================================
 # ChangeDetector Tests
 # ============================================================================
@@ -382,6 +458,120 @@ class TestChangeDetector:
         assert test_file in changes.modified_files
 
 
+class _ExplodingHasher(FileHasher):
+    """Hasher that fails the test if the stat fast path falls through."""
+
+    @staticmethod
+    def compute_hash(file_path: Path) -> str:
+        raise AssertionError(f"unexpected hash of {file_path}")
+
+
+def _settled_entry(file_path: Path, file_hash: str = "recorded") -> dict:
+    settled_ns = file_path.stat().st_mtime_ns - 10_000_000_000
+    os.utime(file_path, ns=(settled_ns, settled_ns))
+    stat = file_path.stat()
+    return {
+        "hash": file_hash,
+        "size_bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "inode": stat.st_ino,
+    }
+
+
+class TestChangeDetectorStatFastPath:
+    """Tests for size/mtime_ns/inode short-circuiting in ChangeDetector."""
+
+    def test_matching_stat_skips_hashing(self, tmp_path: Path) -> None:
+        """Unchanged stat identity is trusted without reading the file."""
+        test_file = tmp_path / "binder.pdf"
+        test_file.write_bytes(b"content")
+        state = {"files": {str(test_file): _settled_entry(test_file)}}
+
+        changes = ChangeDetector(state=state, hasher=_ExplodingHasher()).detect_changes([test_file])
+
+        assert changes.unchanged_files == [test_file]
+
+    def test_stat_mismatch_falls_back_to_hash(self, tmp_path: Path) -> None:
+        """A touched file with identical content is still unchanged."""
+        test_file = tmp_path / "binder.pdf"
+        test_file.write_bytes(b"content")
+        entry = _settled_entry(test_file, FileHasher.compute_hash(test_file))
+        entry["mtime_ns"] -= 1
+
+        changes = ChangeDetector(state={"files": {str(test_file): entry}}, hasher=FileHasher())
+        summary = changes.detect_changes([test_file])
+
+        assert summary.unchanged_files == [test_file]
+
+    def test_paranoid_mode_always_hashes(self, tmp_path: Path) -> None:
+        """Paranoid mode ignores stat identity and compares hashes."""
+        test_file = tmp_path / "binder.pdf"
+        test_file.write_bytes(b"content")
+        state = {"files": {str(test_file): _settled_entry(test_file, "stale-hash")}}
+
+        changes = ChangeDetector(state=state, hasher=FileHasher(), paranoid=True).detect_changes(
+            [test_file]
+        )
+
+        assert changes.modified_files == [test_file]
+
+    def test_paranoid_mode_detects_rewrite_with_same_size_and_mtime(self, tmp_path: Path) -> None:
+        """Paranoid mode re-reads content even when the fingerprint cache has the stat."""
+        test_file = tmp_path / "binder.pdf"
+        test_file.write_bytes(b"content-a")
+        entry = _settled_entry(test_file, "")
+        entry["hash"] = FileHasher.compute_hash(test_file)
+        state = {"files": {str(test_file): entry}}
+
+        test_file.write_bytes(b"content-b")
+        os.utime(test_file, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+        assert test_file.stat().st_size == entry["size_bytes"]
+
+        relaxed = ChangeDetector(state=state, hasher=FileHasher()).detect_changes([test_file])
+        paranoid = ChangeDetector(state=state, hasher=FileHasher(), paranoid=True).detect_changes(
+            [test_file]
+        )
+
+        assert relaxed.unchanged_files == [test_file]
+        assert paranoid.modified_files == [test_file]
+
+    def test_parallel_hashing_preserves_input_order(self, tmp_path: Path) -> None:
+        """Files hashed on worker threads are reported in input order."""
+        files = []
+        previous = {}
+        for index in range(12):
+            file_path = tmp_path / f"doc{index:02d}.pdf"
+            file_path.write_bytes(f"payload {index}".encode())
+            files.append(file_path)
+            recorded = FileHasher.compute_hash(file_path) if index % 3 else "old"
+            previous[str(file_path)] = {"hash": recorded}
+
+        changes = ChangeDetector(
+            state={"files": previous}, hasher=FileHasher(), hash_workers=4
+        ).detect_changes(files)
+
+        assert changes.modified_files == files[::3]
+        assert changes.unchanged_files == [f for i, f in enumerate(files) if i % 3]
+
+    def test_update_state_records_stat_identity(self, tmp_path: Path) -> None:
+        """Processed files are stored with size, mtime_ns and inode once settled."""
+        source_dir = tmp_path / "source"
+        output_dir = tmp_path / "output"
+        source_dir.mkdir()
+        output_dir.mkdir()
+        test_file = source_dir / "doc.txt"
+        test_file.write_text("settled content")
+        expected = _settled_entry(test_file)
+
+        processor = IncrementalProcessor(source_dir, output_dir)
+        processor.record_processed_files([test_file.resolve()])
+
+        entry = StateStore(tmp_path).load()["files"][str(test_file.resolve())]
+        assert entry["mtime_ns"] == expected["mtime_ns"]
+        assert entry["inode"] == expected["inode"]
+        assert entry["size_bytes"] == expected["size_bytes"]
+
+
 # ============================================================================
 # ChangeSummary Tests
 # ============================================================================
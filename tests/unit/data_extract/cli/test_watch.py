@@ -0,0 +1,280 @@
+"""Unit tests for watch mode.
+
+Tests coverage:
+- Debouncer: quiet-period and max-delay batching
+- PollingWatcher / InotifyWatcher: new and modified files, output pruning
+- create_watcher: backend selection and fallback
+- WatchLoop: debounced batches processed through IncrementalProcessor
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from data_extract.cli import watch as watch_module
+from data_extract.cli.batch import IncrementalProcessor, ProcessingResult
+from data_extract.cli.watch import (
+    Debouncer,
+    InotifyWatcher,
+    PollingWatcher,
+    WatchLoop,
+    create_watcher,
+)
+
+pytestmark = [pytest.mark.P1, pytest.mark.unit]
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+class _FakeWatcher:
+    backend = "fake"
+
+    def __init__(self, batches: list[set[Path]]) -> None:
+        self.batches = batches
+        self.closed = False
+
+    def poll(self, timeout: float) -> set[Path]:
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RecordingProcessor:
+    def __init__(self) -> None:
+        self.calls: list[list[Path]] = []
+
+    def process(self, force: bool = False, files: list[Path] | None = None) -> ProcessingResult:
+        self.calls.append(list(files or []))
+        return ProcessingResult(total_files=len(files or []), successful=len(files or []), failed=0)
+
+
+# ============================================================================
+# Debouncer Tests
+# ============================================================================
+
+
+class TestDebouncer:
+    """Tests for event debouncing."""
+
+    def test_batch_waits_for_quiet_period(self) -> None:
+        """Events keep extending the batch until no event arrives for the quiet period."""
+        debouncer = Debouncer(quiet_seconds=1.0, max_delay_seconds=10.0)
+        debouncer.add([Path("a.txt")], now=0.0)
+        debouncer.add([Path("b.txt")], now=0.8)
+
+        assert not debouncer.ready(1.5)
+        assert debouncer.ready(1.8)
+        assert debouncer.drain() == [Path("a.txt"), Path("b.txt")]
+        assert debouncer.time_until_ready(2.0) is None
+
+    def test_continuous_writes_flush_at_max_delay(self) -> None:
+        """A constantly changing tree still produces a batch after the max delay."""
+        debouncer = Debouncer(quiet_seconds=1.0, max_delay_seconds=3.0)
+        for tick in range(7):
+            debouncer.add([Path("busy.txt")], now=tick * 0.5)
+
+        assert debouncer.ready(3.0)
+
+    def test_empty_events_do_not_start_a_batch(self) -> None:
+        """Polls without changes leave the debouncer idle."""
+        debouncer = Debouncer()
+        debouncer.add([], now=0.0)
+
+        assert debouncer.time_until_ready(5.0) is None
+        assert not debouncer.ready(5.0)
+
+
+# ============================================================================
+# Watcher Tests
+# ============================================================================
+
+
+class TestPollingWatcher:
+    """Tests for the scandir polling fallback."""
+
+    def test_reports_new_and_modified_supported_files(self, tmp_path: Path) -> None:
+        """New and rewritten files are reported; unchanged and unsupported files are not."""
+        source = tmp_path / "source"
+        source.mkdir()
+        existing = source / "existing.txt"
+        existing.write_text("one")
+        untouched = source / "untouched.txt"
+        untouched.write_text("same")
+        output_dir = source / "output"
+        output_dir.mkdir()
+
+        watcher = PollingWatcher(source, exclude_paths=[output_dir], interval=0.0)
+        existing.write_text("one, two")
+        (source / "nested").mkdir()
+        (source / "nested" / "new.md").write_text("new")
+        (source / "scratch.tmp").write_text("ignored")
+        (output_dir / "existing.json").write_text("{}")
+
+        changed = watcher.poll(timeout=0.0)
+
+        assert changed == {existing.resolve(), (source / "nested" / "new.md").resolve()}
+        assert watcher.poll(timeout=0.0) == set()
+
+    def test_poll_returns_nothing_before_interval(self, tmp_path: Path) -> None:
+        """Scans are rate-limited to the configured interval."""
+        watcher = PollingWatcher(tmp_path, interval=60.0)
+        (tmp_path / "late.txt").write_text("x")
+
+        assert watcher.poll(timeout=0.0) == set()
+
+
+@linux_only
+class TestInotifyWatcher:
+    """Tests for the inotify change source."""
+
+    def test_reports_written_files_including_new_directories(self, tmp_path: Path) -> None:
+        """Closed writes are reported, also inside directories created after start."""
+        source = tmp_path / "source"
+        output_dir = source / "output"
+        output_dir.mkdir(parents=True)
+        watcher = InotifyWatcher(source, exclude_paths=[output_dir])
+        try:
+            (source / "dropped.txt").write_text("x")
+            (source / "batch").mkdir()
+            (source / "batch" / "inner.txt").write_text("y")
+            (output_dir / "dropped.json").write_text("{}")
+
+            changed: set[Path] = set()
+            for _ in range(10):
+                changed |= watcher.poll(timeout=0.2)
+                if len(changed) >= 2:
+                    break
+        finally:
+            watcher.close()
+
+        resolved = source.resolve()
+        assert changed == {resolved / "dropped.txt", resolved / "batch" / "inner.txt"}
+
+
+class TestCreateWatcher:
+    """Tests for backend selection."""
+
+    def test_poll_backend_selected_explicitly(self, tmp_path: Path) -> None:
+        watcher = create_watcher(tmp_path, backend="poll", poll_interval=0.5)
+
+        assert isinstance(watcher, PollingWatcher)
+        assert watcher.interval == 0.5
+
+    def test_auto_falls_back_to_polling(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without inotify, auto mode degrades to polling instead of failing."""
+
+        def unavailable(*args: object, **kwargs: object) -> None:
+            raise OSError("no inotify")
+
+        monkeypatch.setattr(watch_module, "InotifyWatcher", unavailable)
+
+        assert isinstance(create_watcher(tmp_path, backend="auto"), PollingWatcher)
+        with pytest.raises(OSError, match="inotify unavailable"):
+            create_watcher(tmp_path, backend="inotify")
+
+    def test_invalid_backend_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Invalid watch backend"):
+            create_watcher(tmp_path, backend="fanotify")
+
+
+# ============================================================================
+# WatchLoop Tests
+# ============================================================================
+
+
+class TestWatchLoop:
+    """Tests for the debounced processing loop."""
+
+    def test_burst_is_processed_as_one_batch(self, tmp_path: Path) -> None:
+        """Events within the debounce window are coalesced into a single process call."""
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("a")
+        second.write_text("b")
+        clock = _FakeClock()
+        processor = _RecordingProcessor()
+        batches: list[list[Path]] = []
+        loop = WatchLoop(
+            processor,  # type: ignore[arg-type]
+            _FakeWatcher([{first}, {second, first}]),
+            debounce_seconds=1.0,
+            on_batch=lambda files, result: batches.append(files),
+            clock=clock,
+        )
+
+        assert loop.run_once() is None
+        clock.now = 0.5
+        assert loop.run_once() is None
+        clock.now = 2.0
+        result = loop.run_once()
+
+        assert result is not None and result.successful == 2
+        assert processor.calls == [sorted([first, second])]
+        assert batches == processor.calls
+
+    def test_vanished_files_are_dropped(self, tmp_path: Path) -> None:
+        """Files deleted before the batch fires are not passed to the processor."""
+        clock = _FakeClock()
+        processor = _RecordingProcessor()
+        loop = WatchLoop(
+            processor,  # type: ignore[arg-type]
+            _FakeWatcher([{tmp_path / "gone.txt"}]),
+            debounce_seconds=0.0,
+            clock=clock,
+        )
+
+        assert loop.run_once() is None
+        assert processor.calls == []
+
+    def test_dropped_file_is_processed_incrementally(self, tmp_path: Path) -> None:
+        """A new file is processed once; re-reporting it unchanged is skipped by state."""
+        source = tmp_path / "source"
+        source.mkdir()
+        output_dir = tmp_path / "output"
+        dropped = source / "dropped.txt"
+        dropped.write_text("Watch mode picks up new documents. They are chunked quickly.")
+        watcher = _FakeWatcher([{dropped}, {dropped}])
+        watcher.close = lambda: None  # type: ignore[method-assign]
+        loop = WatchLoop(
+            IncrementalProcessor(source, output_dir),
+            watcher,  # type: ignore[arg-type]
+            debounce_seconds=0.0,
+        )
+
+        first = loop.run_once()
+        second = loop.run_once()
+
+        assert first is not None and first.successful == 1
+        assert (output_dir / "dropped.json").exists()
+        assert second is not None and second.successful == 0 and second.skipped == 1
+
+    def test_run_stops_after_max_batches_and_closes_watcher(self, tmp_path: Path) -> None:
+        doc = tmp_path / "doc.txt"
+        doc.write_text("x")
+        watcher = _FakeWatcher([{doc}])
+        loop = WatchLoop(
+            _RecordingProcessor(),  # type: ignore[arg-type]
+            watcher,
+            debounce_seconds=0.0,
+        )
+
+        loop.run(max_batches=1)
+
+        assert loop.batches == 1
+        assert watcher.closed
@@ -9,12 +9,16 @@ Test Coverage:
 - Error propagation: Exceptions bubble up from stages
 - Determinism: Same input produces same output
 - Type safety: Generic type parameters work correctly
+- Staged scheduling: StagedPipeline overlaps stages with bounded queues
 """
 
+import threading
+import time
+
 import pytest
 
 from data_extract.core.models import ProcessingContext
-from data_extract.core.pipeline import Pipeline
+from data_extract.core.pipeline import Pipeline, StagedPipeline, StageSpec
 
 pytestmark = [pytest.mark.P0, pytest.mark.unit]
 
@@ -312,3 +316,127 @@ class TestDeterminism:
         assert result1 == 4.5
         assert result2 == 9.0
         assert result1 != result2
+
+
+class SlowLengthStage:
+    """Mock stage: String length with a small delay and in-flight tracking."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def process(self, input_data: str, context: ProcessingContext) -> int:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return len(input_data)
+
+
+class FailOnOddStage:
+    """Mock stage: Raise for odd values, double even ones."""
+
+    def process(self, input_data: int, context: ProcessingContext) -> int:
+        if input_data % 2:
+            raise ValueError(f"odd value {input_data}")
+        return input_data * 2
+
+
+class TestStagedPipeline:
+    """Test StagedPipeline streaming scheduler."""
+
+    @pytest.mark.test_id("unit-PIPE-017")
+    def test_staged_results_match_sequential_pipeline(self) -> None:
+        """Every input flows through all stages exactly once."""
+        inputs = ["a" * size for size in range(1, 21)]
+        staged = StagedPipeline(
+            [
+                StageSpec("length", SlowLengthStage(delay=0.001), workers=3, queue_size=2),
+                StageSpec("scale", IntToFloatStage(), workers=1, queue_size=2),
+            ]
+        )
+
+        results = list(staged.run(inputs, ProcessingContext()))
+
+        sequential = Pipeline([StringToIntStage(), IntToFloatStage()])
+        expected = {
+            index: sequential.process(text, ProcessingContext())
+            for index, text in enumerate(inputs)
+        }
+        assert all(item.ok for item in results)
+        assert {item.index: item.payload for item in results} == expected
+        assert staged.metrics["length"].processed == len(inputs)
+        assert staged.metrics["scale"].processed == len(inputs)
+
+    @pytest.mark.test_id("unit-PIPE-018")
+    def test_staged_failures_skip_remaining_stages(self) -> None:
+        """A failing item is reported once with its stage and does not block others."""
+        staged = StagedPipeline(
+            [
+                StageSpec("length", StringToIntStage()),
+                StageSpec("even", FailOnOddStage(), workers=2),
+                StageSpec("tail", IntToFloatStage()),
+            ]
+        )
+
+        results = sorted(
+            staged.run(["a", "bb", "ccc", "dddd"], ProcessingContext()), key=lambda r: r.index
+        )
+
+        assert [item.ok for item in results] == [False, True, False, True]
+        assert results[0].failed_stage == "even"
+        assert isinstance(results[0].error, ValueError)
+        assert results[1].payload == 6.0
+        assert staged.metrics["even"].failed == 2
+        assert staged.metrics["tail"].processed == 2
+
+    @pytest.mark.test_id("unit-PIPE-019")
+    def test_staged_queues_apply_back_pressure(self) -> None:
+        """Slow downstream stages bound the number of items pulled from the input."""
+        pulled = []
+
+        def source():
+            for index in range(50):
+                pulled.append(index)
+                yield "x" * (index + 1)
+
+        slow = SlowLengthStage(delay=0.02)
+        staged = StagedPipeline(
+            [
+                StageSpec("fast", IdentityStage(), workers=1, queue_size=2),
+                StageSpec("slow", slow, workers=1, queue_size=2),
+            ],
+            output_queue_size=1,
+        )
+        results = staged.run(source(), ProcessingContext())
+        first = next(results)
+        in_flight_ceiling = 2 + 1 + 2 + 1 + 1 + 1  # queues + workers + output + feeder
+        assert first.ok
+        assert len(pulled) <= in_flight_ceiling + 1
+        remaining = list(results)
+
+        assert len(remaining) == 49
+        assert slow.max_active == 1
+        assert staged.metrics["slow"].max_queue_depth <= 2
+        assert staged.metrics["slow"].avg_latency_ms > 0
+
+    @pytest.mark.test_id("unit-PIPE-020")
+    def test_staged_close_stops_workers(self) -> None:
+        """Closing the result stream early shuts the scheduler down."""
+        staged = StagedPipeline([StageSpec("slow", SlowLengthStage(delay=0.005), queue_size=1)])
+        results = staged.run(("x" for _ in range(1000)), ProcessingContext())
+        next(results)
+        results.close()
+
+        time.sleep(0.05)
+        assert not [t for t in threading.enumerate() if t.name.startswith("data-extract-stage-")]
+
+    @pytest.mark.test_id("unit-PIPE-021")
+    def test_staged_requires_stages(self) -> None:
+        """An empty stage list is rejected."""
+        with pytest.raises(ValueError):
+            StagedPipeline([])
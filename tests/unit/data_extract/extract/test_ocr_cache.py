@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from data_extract.extract.ocr_cache import OcrCache, get_ocr_cache
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_ocr_cache_round_trips_text_and_confidence(tmp_path: Path) -> None:
+    cache = OcrCache(tmp_path, max_bytes=1024 * 1024)
+    key = OcrCache.make_key("digest", 150, "none", "5.3.0")
+
+    assert cache.get(key) is None
+    cache.put(key, "Scanned control narrative", 0.93)
+
+    assert cache.get(key) == ("Scanned control narrative", 0.93)
+
+
+def test_ocr_cache_key_changes_with_ocr_settings() -> None:
+    base = OcrCache.make_key("digest", 150, "none", "5.3.0")
+
+    assert base != OcrCache.make_key("digest", 300, "none", "5.3.0")
+    assert base != OcrCache.make_key("digest", 150, "grayscale_contrast", "5.3.0")
+    assert base != OcrCache.make_key("digest", 150, "none", "5.4.0")
+    assert base != OcrCache.make_key("other", 150, "none", "5.3.0")
+
+
+def test_ocr_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = OcrCache(tmp_path, max_bytes=600)
+    keys = [OcrCache.make_key(f"page-{index}", 150, "none", "5") for index in range(6)]
+    for age, key in enumerate(keys[:5]):
+        cache.put(key, "x" * 80, 0.9)
+        entry = cache._entry_path(key)
+        os.utime(entry, (1_000 + age, 1_000 + age))
+    # Touching the oldest entry makes it most recently used.
+    assert cache.get(keys[0]) is not None
+
+    cache.put(keys[5], "x" * 80, 0.9)
+
+    assert cache.stats()["total_bytes"] <= 600
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+
+
+def test_get_ocr_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATA_EXTRACT_OCR_CACHE_MAX_MB", "0")
+
+    assert get_ocr_cache() is None
@@ -4,11 +4,18 @@ from pathlib import Path
 
 import pytest
 
-from data_extract.extract.pdf import PdfExtractorAdapter
+from data_extract.extract.ocr_cache import OcrCache
+from data_extract.extract.pdf import PdfExtractorAdapter, PdfPage, _OcrDependencies
+from data_extract.normalize.validation import DEFAULT_OCR_CONFIDENCE_THRESHOLD
 
 pytestmark = [pytest.mark.unit]
 
 
+@pytest.fixture(autouse=True)
+def _isolated_ocr_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATA_EXTRACT_OCR_CACHE_DIR", str(tmp_path / "ocr-cache"))
+
+
 def _write_bytes(path: Path, payload: bytes) -> Path:
     path.write_bytes(payload)
     return path
@@ -74,3 +81,233 @@ def test_pdf_adapter_accepts_empty_file_stub(tmp_path: Path) -> None:
     assert structure["fallback"] == "empty_stub"
     assert structure["non_empty_pages"] == 0
     assert quality["extraction_confidence"] == 0.0
+
+
+def _write_multipage_pdf(path: Path, page_count: int, blank_pages: set[int] | None = None) -> Path:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    blank_pages = blank_pages or set()
+    pdf = canvas.Canvas(str(path), pagesize=letter)
+    _, height = letter
+    for page_num in range(1, page_count + 1):
+        if page_num not in blank_pages:
+            pdf.setFont("Helvetica", 12)
+            pdf.drawString(72, height - 72, f"Audit binder page {page_num} control review notes")
+            pdf.drawString(72, height - 92, f"Finding {page_num}: evidence retained and reviewed.")
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def test_pdf_adapter_page_sharding_matches_sequential_output(tmp_path: Path) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "binder.pdf", 11, blank_pages={4, 9})
+
+    sequential = PdfExtractorAdapter(page_workers=1).extract(file_path)
+    sharded_adapter = PdfExtractorAdapter(page_workers=3)
+    sharded_adapter.PARALLEL_MIN_PAGES = 2
+    sharded_adapter.PAGE_SHARD_SIZE = 2
+    sharded = sharded_adapter.extract(file_path)
+
+    assert sharded == sequential
+    text, structure, _ = sharded
+    assert [page["page_num"] for page in structure["pages"]] == list(range(1, 12))
+    assert structure["non_empty_pages"] == 9
+    assert text.index("page 3 ") < text.index("page 10 ")
+
+
+def test_pdf_adapter_page_shards_cover_all_pages_in_order() -> None:
+    adapter = PdfExtractorAdapter(page_workers=4)
+
+    shards = adapter._page_shards(page_count=1500, workers=4)
+
+    assert shards[0][0] == 1
+    assert shards[-1][1] == 1500
+    assert all(left[1] + 1 == right[0] for left, right in zip(shards, shards[1:]))
+    assert len(shards) >= 4
+
+
+def test_pdf_adapter_small_documents_skip_page_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATA_EXTRACT_PDF_PAGE_WORKERS", "8")
+
+    adapter = PdfExtractorAdapter()
+
+    assert adapter._resolve_page_workers(adapter.PARALLEL_MIN_PAGES - 1) == 1
+    assert adapter._resolve_page_workers(1500) == 8
+
+
+def test_pdf_adapter_iter_pages_matches_extract(tmp_path: Path) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "binder.pdf", 5, blank_pages={2})
+    adapter = PdfExtractorAdapter(page_workers=1)
+
+    pages = list(adapter.iter_pages(file_path))
+    text, structure, _ = adapter.extract(file_path)
+
+    assert all(isinstance(page, PdfPage) for page in pages)
+    assert [page.entry for page in pages] == structure["pages"]
+    assert "\n\n".join(page.text for page in pages) == text
+
+
+def test_pdf_adapter_records_page_text_blocks(tmp_path: Path) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "binder.pdf", 4, blank_pages={2})
+    adapter = PdfExtractorAdapter(page_workers=1)
+
+    pages = list(adapter.iter_pages(file_path))
+    text, structure, _ = adapter.extract(file_path)
+
+    assert [text[start:end] for start, end in structure["text_blocks"]] == [
+        page.text for page in pages
+    ]
+
+
+def test_pdf_adapter_iter_pages_streams_sharded_pages_in_order(tmp_path: Path) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "binder.pdf", 12)
+    adapter = PdfExtractorAdapter(page_workers=2)
+    adapter.PARALLEL_MIN_PAGES = 2
+    adapter.PAGE_SHARD_SIZE = 2
+
+    pages = adapter.iter_pages(file_path)
+    first_three = [next(pages).page_num for _ in range(3)]
+    pages.close()
+
+    assert first_three == [1, 2, 3]
+    assert [page.page_num for page in adapter.iter_pages(file_path)] == list(range(1, 13))
+
+
+class _FakeTesseract:
+    class Output:
+        DICT = "dict"
+
+    def __init__(
+        self, fail_with: Exception | None = None, confidence: dict[int, str] | None = None
+    ) -> None:
+        self.fail_with = fail_with
+        self.confidence = confidence or {}
+        self.timeouts: list[float] = []
+        self.images: list[str] = []
+        self.invocations = 0
+
+    def image_to_data(self, image: str, output_type: str, timeout: float = 0) -> dict:
+        self.timeouts.append(timeout)
+        self.images.append(image)
+        self.invocations += 1
+        if self.fail_with is not None:
+            raise self.fail_with
+        dpi = int(image.rsplit("@", 1)[1])
+        return {"conf": [self.confidence.get(dpi, "91"), "-1", "87"]}
+
+    def image_to_string(self, image: str, timeout: float = 0) -> str:
+        self.invocations += 1
+        return f"Recovered scanned text from {image} with several words for review"
+
+
+def _fake_ocr_deps(
+    tesseract: _FakeTesseract, calls: list[tuple[int, int, int]]
+) -> _OcrDependencies:
+    def convert_from_path(path: str, dpi: int, first_page: int, last_page: int, **_: object):
+        calls.append((dpi, first_page, last_page))
+        return [f"image-{page_num}@{dpi}" for page_num in range(first_page, last_page + 1)]
+
+    return _OcrDependencies(
+        pytesseract=tesseract, convert_from_path=convert_from_path, poppler_path=None
+    )
+
+
+def test_pdf_adapter_rasterises_contiguous_ocr_pages_in_one_call(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "scan.pdf", 8, blank_pages={2, 3, 4, 7})
+    calls: list[tuple[int, int, int]] = []
+    deps = _fake_ocr_deps(_FakeTesseract(), calls)
+    adapter = PdfExtractorAdapter(page_workers=1, ocr_confidence_threshold=0.85)
+    monkeypatch.setattr(adapter, "_load_ocr_dependencies", lambda: (deps, None))
+
+    text, structure, quality = adapter.extract(file_path)
+
+    assert calls == [(150, 2, 4), (150, 7, 7)]
+    assert structure["pages"][1]["ocr_tier"] == "150dpi"
+    assert structure["ocr_pages"] == 4
+    assert sorted(structure["ocr_confidence"]) == [2, 3, 4, 7]
+    assert structure["pages"][2]["extraction_method"] == "ocr"
+    assert "image-3" in text
+    assert quality["ocr_confidence"] == pytest.approx(0.89)
+
+
+def test_pdf_adapter_ocr_timeout_marks_page_without_text(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "scan.pdf", 2, blank_pages={2})
+    tesseract = _FakeTesseract(fail_with=RuntimeError("Tesseract process timeout"))
+    deps = _fake_ocr_deps(tesseract, [])
+    adapter = PdfExtractorAdapter(page_workers=1)
+    monkeypatch.setattr(adapter, "_load_ocr_dependencies", lambda: (deps, None))
+
+    _, structure, _ = adapter.extract(file_path)
+
+    page = structure["pages"][1]
+    assert page["ocr_timed_out"] is True
+    assert page["ocr_applied"] is False
+    assert 0 < tesseract.timeouts[0] <= adapter.OCR_TIMEOUT_SECONDS
+
+
+def test_pdf_adapter_escalates_ocr_dpi_only_below_threshold(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "scan.pdf", 3, blank_pages={1, 2, 3})
+    calls: list[tuple[int, int, int]] = []
+    tesseract = _FakeTesseract(confidence={150: "40", 300: "99"})
+    deps = _fake_ocr_deps(tesseract, calls)
+    adapter = PdfExtractorAdapter(page_workers=1, ocr_confidence_threshold=0.9)
+    monkeypatch.setattr(adapter, "_load_ocr_dependencies", lambda: (deps, None))
+
+    _, structure, _ = adapter.extract(file_path)
+
+    assert calls == [(150, 1, 3), (300, 1, 3)]
+    assert [page["ocr_tier"] for page in structure["pages"]] == ["300dpi"] * 3
+    # Preprocessing is skipped once the 300 DPI pass clears the threshold.
+    assert len(tesseract.images) == 6
+    assert structure["ocr_confidence"][1] == pytest.approx(0.93)
+
+
+def test_pdf_adapter_default_threshold_stops_clean_scans_at_first_tier(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "scan.pdf", 4, blank_pages={1, 2, 3, 4})
+    calls: list[tuple[int, int, int]] = []
+    # Typical clean-scan Tesseract output: mean word confidence 0.89.
+    tesseract = _FakeTesseract()
+    deps = _fake_ocr_deps(tesseract, calls)
+    adapter = PdfExtractorAdapter(page_workers=1)
+    monkeypatch.setattr(adapter, "_load_ocr_dependencies", lambda: (deps, None))
+
+    _, structure, _ = adapter.extract(file_path)
+
+    assert adapter.OCR_EARLY_EXIT_CONFIDENCE < DEFAULT_OCR_CONFIDENCE_THRESHOLD
+    assert calls == [(150, 1, 4)]
+    assert [page["ocr_tier"] for page in structure["pages"]] == ["150dpi"] * 4
+    # Baseline OCRed every page at 300 DPI plain and preprocessed: two tiers of
+    # image_to_data + image_to_string each.
+    baseline_invocations = 4 * 2 * 2
+    assert tesseract.invocations == 4 * 2
+    assert tesseract.invocations < baseline_invocations
+
+
+def test_pdf_adapter_reuses_cached_ocr_results_across_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = _write_multipage_pdf(tmp_path / "scan.pdf", 3, blank_pages={1, 3})
+    tesseract = _FakeTesseract()
+    deps = _fake_ocr_deps(tesseract, [])
+    cache = OcrCache(tmp_path / "cache", max_bytes=1024 * 1024)
+    adapter = PdfExtractorAdapter(page_workers=1, ocr_confidence_threshold=0.85, ocr_cache=cache)
+    monkeypatch.setattr(adapter, "_load_ocr_dependencies", lambda: (deps, None))
+
+    first_text, first, _ = adapter.extract(file_path)
+    calls_after_first = len(tesseract.images)
+    second_text, second, _ = adapter.extract(file_path)
+
+    assert (first["ocr_cache_hits"], first["ocr_cache_misses"]) == (0, 2)
+    assert (second["ocr_cache_hits"], second["ocr_cache_misses"]) == (2, 0)
+    assert len(tesseract.images) == calls_after_first
+    assert second_text == first_text
+    assert second["ocr_confidence"] == first["ocr_confidence"]
@@ -0,0 +1,168 @@
+"""Unit tests for block-parallel normalization.
+
+Tests cover:
+- Validation of recorded page/slide/sheet spans
+- Whole-document and block-parallel results agree on cleaned text and entities
+- Entity offsets and counts after stitching, with empty blocks dropped
+- In-process fallback when worker processes are unavailable
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from src.data_extract.core.models import Document, Metadata, ProcessingContext
+from src.data_extract.normalize import blocks as blocks_module
+from src.data_extract.normalize.blocks import block_spans, normalize_blocks, resolve_block_workers
+from src.data_extract.normalize.config import NormalizationConfig
+from src.data_extract.normalize.normalizer import Normalizer
+
+pytestmark = [pytest.mark.P1, pytest.mark.unit]
+
+PATTERNS_FILE = Path("config/normalize/entity_patterns.yaml")
+
+
+def _document(blocks: List[str], separator: str = "\n\n") -> Document:
+    spans = []
+    position = 0
+    for block in blocks:
+        spans.append([position, position + len(block)])
+        position += len(block) + len(separator)
+    return Document(
+        id="blocks-doc",
+        text=separator.join(blocks),
+        metadata=Metadata(
+            source_file=Path("binder.pdf"),
+            file_hash="abc123",
+            processing_timestamp=datetime.now(),
+            tool_version="0.1.0",
+            config_version="1.0",
+            document_type="report",
+        ),
+        structure={"text_blocks": spans},
+    )
+
+
+def _pages(count: int) -> List[str]:
+    return [
+        f"Page {number} reviewed Risk-{number} against CTRL-{number % 7}.\n"
+        f"Evidence ^^^^ retained   for POL-{number % 3} testing."
+        for number in range(count)
+    ]
+
+
+def _entity_view(document: Document) -> List[Dict[str, object]]:
+    return [
+        {"id": entity.id, "text": entity.text, "location": entity.location}
+        for entity in document.entities
+    ]
+
+
+@pytest.fixture
+def small_parallel_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(blocks_module, "PARALLEL_MIN_CHARS", 0)
+
+
+class TestBlockSpans:
+    """Test validation of structure["text_blocks"]."""
+
+    def test_spans_cover_whole_text(self) -> None:
+        document = _document(["first page", "second page"])
+        document.text += "\n"
+        document.structure["text_blocks"] = [[6, 10], [12, 23]]
+
+        assert block_spans(document) == [(0, 10), (12, 24)]
+
+    @pytest.mark.parametrize(
+        "spans",
+        [
+            [[0, 10]],
+            [[0, 10], [5, 23]],
+            [[0, 10], [10, 23]],
+            [[0, 8], [12, 23]],
+            [[0, 10], [12, 99]],
+            "0-10",
+        ],
+        ids=["single", "overlap", "no-separator", "text-in-gap", "out-of-range", "malformed"],
+    )
+    def test_unusable_spans_fall_back_to_whole_text(self, spans: object) -> None:
+        document = _document(["first page", "second page"])
+        document.structure["text_blocks"] = spans
+
+        assert block_spans(document) is None
+
+    def test_worker_count_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DATA_EXTRACT_NORMALIZE_BLOCK_WORKERS", "3")
+
+        assert resolve_block_workers(NormalizationConfig()) == 3
+        assert resolve_block_workers(NormalizationConfig(block_workers=2)) == 2
+
+
+class TestBlockNormalization:
+    """Test block-parallel cleaning and entity recognition."""
+
+    def test_small_documents_and_single_worker_use_whole_text(self) -> None:
+        document = _document(_pages(4))
+
+        assert normalize_blocks(Normalizer(NormalizationConfig(block_workers=4)), document) is None
+        assert normalize_blocks(Normalizer(NormalizationConfig(block_workers=1)), document) is None
+
+    @pytest.mark.usefixtures("small_parallel_threshold")
+    def test_blocks_match_whole_document_processing(self) -> None:
+        pages = _pages(40)
+        context = ProcessingContext()
+        whole = Normalizer(
+            NormalizationConfig(block_workers=1, entity_patterns_file=PATTERNS_FILE)
+        ).process(_document(pages), context)
+        parallel = Normalizer(
+            NormalizationConfig(block_workers=2, entity_patterns_file=PATTERNS_FILE)
+        ).process(_document(pages), context)
+
+        assert parallel.text == whole.text
+        assert _entity_view(parallel) == _entity_view(whole)
+        assert parallel.metadata.entity_counts == whole.metadata.entity_counts
+        assert parallel.metadata.entity_tags == whole.metadata.entity_tags
+        assert (
+            parallel.metadata.quality_scores["cleaning_artifacts_removed"]
+            == whole.metadata.quality_scores["cleaning_artifacts_removed"]
+            == 40
+        )
+
+    @pytest.mark.usefixtures("small_parallel_threshold")
+    def test_offsets_point_into_stitched_text_with_empty_blocks_dropped(self) -> None:
+        sheets = ["# Sheet: Risks\nRisk-1 | open", "   ", "# Sheet: Controls\nCTRL-2 | tested"]
+        normalizer = Normalizer(
+            NormalizationConfig(block_workers=2, entity_patterns_file=PATTERNS_FILE)
+        )
+
+        result = normalize_blocks(normalizer, _document(sheets, separator="\n"))
+
+        assert result is not None
+        assert result.text == "# Sheet: Risks\nRisk-1 | open\n\n# Sheet: Controls\nCTRL-2 | tested"
+        assert result.block_count == 3
+        assert result.entities
+        for entity in result.entities:
+            start, end = entity.location["start"], entity.location["end"]
+            assert result.text[start:end] == entity.text
+
+    @pytest.mark.usefixtures("small_parallel_threshold")
+    def test_unavailable_process_pool_falls_back_in_process(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def unavailable(*args: object, **kwargs: object) -> None:
+            raise OSError("no process pool")
+
+        pages = _pages(6)
+        normalizer = Normalizer(
+            NormalizationConfig(block_workers=3, entity_patterns_file=PATTERNS_FILE)
+        )
+        pooled = normalize_blocks(normalizer, _document(pages))
+        monkeypatch.setattr(blocks_module, "ProcessPoolExecutor", unavailable)
+        fallback = normalize_blocks(normalizer, _document(pages))
+
+        assert pooled is not None and fallback is not None
+        assert fallback.workers == 1
+        assert fallback.text == pooled.text
+        assert fallback.entities == pooled.entities
@@ -12,6 +12,7 @@ Tests cover:
 Target: >90% coverage for cleaning.py
 """
 
+from pathlib import Path
 from typing import List
 
 import pytest
@@ -150,6 +151,56 @@ class TestTextCleanerOCRArtifacts:
         assert cleaned == text
         assert count == 0
 
+    def test_patterns_apply_in_order_to_previous_output(self, cleaner: TextCleaner) -> None:
+        """Removing carets can join underscores into a run the later pattern removes."""
+        cleaned, count = cleaner.remove_ocr_artifacts("Sign: _____^^^_____ here")
+
+        assert cleaned == "Sign:  here"
+        assert count == 2
+
+    def test_fused_passes_match_sequential_substitution(self) -> None:
+        """Counts and text equal one findall/sub pass per pattern, including multi-line patterns."""
+        config = NormalizationConfig(
+            ocr_artifact_patterns_file=Path("config/normalize/cleaning_rules.yaml")
+        )
+        cleaner = TextCleaner(config)
+        text = (
+            "Findings ^^^^ noted\n"
+            "  indented ■■■■■ line \x07 with bell\n"
+            "clean line\n"
+            "symbols @#$%& here ~~~~ and\n"
+            "wrapped -\n"
+            "  # isolated\n"
+            "__________\n"
+            "end"
+        )
+
+        expected, expected_count = text, 0
+        for pattern, replacement in cleaner._ocr_patterns:
+            expected_count += len(pattern.findall(expected))
+            expected = pattern.sub(replacement, expected)
+
+        assert len(cleaner._artifact_passes) < len(cleaner._ocr_patterns)
+        assert cleaner.remove_ocr_artifacts(text) == (expected, expected_count)
+
+    def test_patterns_without_line_local_flag_apply_to_whole_text(self, tmp_path: Path) -> None:
+        """Only rules declaring ``line_local: true`` are grouped into line passes."""
+        rules = tmp_path / "rules.yaml"
+        rules.write_text(
+            "ocr_artifacts:\n"
+            "  - pattern: '\\^{3,}'\n"
+            "    line_local: true\n"
+            "  - pattern: '~{3,}'\n"
+            "    line_local: true\n"
+            "  - pattern: '-\\n'\n"
+            "    replacement: ''\n",
+            encoding="utf-8",
+        )
+        cleaner = TextCleaner(NormalizationConfig(ocr_artifact_patterns_file=rules))
+
+        assert [line_local for line_local, _ in cleaner._artifact_passes] == [True, False]
+        assert cleaner.remove_ocr_artifacts("hyphen-\nated ^^^^ and ~~~") == ("hyphenated  and ", 3)
+
 
 class TestTextCleanerWhitespace:
     """Test whitespace normalization (AC-2.1.2)."""
@@ -206,6 +257,14 @@ class TestTextCleanerWhitespace:
         assert "Paragraph 1" in cleaned
         assert "Paragraph 3" in cleaned
 
+    def test_collapse_inner_spaces_keeps_line_indentation(self, cleaner: TextCleaner) -> None:
+        """Runs after line content collapse; leading runs (including expanded tabs) remain."""
+        text = "Item  one   here\n    code  block\n\tTabbed  line\nend"
+        cleaned, normalized = cleaner.normalize_whitespace(text)
+
+        assert cleaned == "Item one here\n    code block\n    Tabbed line\nend"
+        assert normalized is True
+
     def test_preserve_intentional_indentation(self, cleaner: TextCleaner) -> None:
         """Test intentional indentation (code blocks) preserved."""
         text = "Normal text\n    Indented code block\n        More indented"
@@ -69,6 +69,23 @@ def sample_document() -> Document:
     )
 
 
+def _document(text: str) -> Document:
+    from datetime import datetime
+
+    return Document(
+        id="doc",
+        text=text,
+        metadata=Metadata(
+            source_file=Path("doc.txt"),
+            file_hash="doc-hash",
+            processing_timestamp=datetime.now(),
+            tool_version="0.1.0",
+            config_version="1.0",
+            document_type="test",
+        ),
+    )
+
+
 @pytest.fixture
 def processing_context() -> ProcessingContext:
     """Create sample processing context."""
@@ -410,6 +427,79 @@ class TestAbbreviationExpansion:
         if len(log) > 0:
             assert len(log) <= 1  # Only first expansion logged
 
+    def test_expand_all_entries_in_one_pass(self) -> None:
+        """Every dictionary entry present in the text is expanded once."""
+        normalizer = EntityNormalizer()
+        normalizer.dictionary = {
+            "iso": {"full_form": "International Organization for Standardization"},
+            "iso-27001": {"full_form": "ISO/IEC 27001", "category": "standard"},
+            "SOC": {"full_form": "System and Organization Controls", "case_sensitive": True},
+        }
+
+        expanded, log = normalizer.expand_abbreviations(
+            "ISO-27001 and iso audits; soc and SOC reports; ISO again"
+        )
+
+        assert expanded == (
+            "ISO/IEC 27001 and International Organization for Standardization audits; "
+            "soc and System and Organization Controls reports; ISO again"
+        )
+        assert [entry["abbreviation"] for entry in log] == ["iso", "ISO-27001", "SOC"]
+
+    def test_expand_log_positions_follow_dictionary_order(self) -> None:
+        """Logged positions account for expansions of earlier dictionary entries."""
+        normalizer = EntityNormalizer()
+        normalizer.dictionary = {
+            "bcp": {"full_form": "Business Continuity Planning", "category": "general"},
+            "grc": {"full_form": "Governance, Risk, and Compliance", "category": "framework"},
+        }
+
+        expanded, log = normalizer.expand_abbreviations("GRC owns the BCP")
+
+        assert expanded == "Governance, Risk, and Compliance owns the Business Continuity Planning"
+        assert [(entry["abbreviation"], entry["position"]) for entry in log] == [
+            ("BCP", 13),
+            ("GRC", 0),
+        ]
+
+    def test_expand_context_includes_earlier_expansions(self) -> None:
+        """Context keywords may come from the expansion of an earlier entry."""
+        normalizer = EntityNormalizer()
+        normalizer.dictionary = {
+            "isms": {"full_form": "Information Security Management System"},
+            "cis": {
+                "full_form": "Center for Internet Security",
+                "context_required": True,
+                "context_keywords": ["security"],
+            },
+        }
+
+        expanded, log = normalizer.expand_abbreviations(
+            "The CIS country team met twice last year, then the CIS ISMS"
+        )
+
+        assert expanded == (
+            "The CIS country team met twice last year, then the Center for Internet Security "
+            "Information Security Management System"
+        )
+        assert [(entry["abbreviation"], entry["position"]) for entry in log] == [
+            ("ISMS", 55),
+            ("CIS", 51),
+        ]
+
+    def test_expand_matcher_rebuilt_when_dictionary_replaced(
+        self, normalizer: EntityNormalizer
+    ) -> None:
+        """The compiled matcher is reused across calls and follows dictionary swaps."""
+        normalizer.expand_abbreviations("SOX")
+        matcher = normalizer._abbreviation_matcher()
+        assert normalizer._abbreviation_matcher() is matcher
+
+        normalizer.dictionary = {"zz": {"full_form": "Zed Zed"}}
+        expanded, _ = normalizer.expand_abbreviations("SOX zz")
+
+        assert expanded == "SOX Zed Zed"
+
 
 # ============================================================================
 # Cross-Reference Resolution Tests (AC-2.2.5) - 15+ tests
@@ -477,9 +567,9 @@ class TestCrossReferenceResolution:
             ),
         ]
 
-        normalizer.resolve_cross_references(entities)
-        assert len(normalizer.entity_graph) > 0
-        assert "Risk-123" in normalizer.entity_graph
+        graph = normalizer.build_entity_graph(normalizer.resolve_cross_references(entities))
+        assert len(graph) > 0
+        assert "Risk-123" in graph
 
     def test_resolve_different_types_no_merge(self, normalizer: EntityNormalizer) -> None:
         """Test that different entity types don't get merged."""
@@ -606,10 +696,10 @@ class TestCrossReferenceResolution:
             ),
         ]
 
-        normalizer.resolve_cross_references(entities)
+        graph = normalizer.build_entity_graph(normalizer.resolve_cross_references(entities))
         # Both entities should be in graph
-        assert "Risk-123" in normalizer.entity_graph
-        assert "Control-456" in normalizer.entity_graph
+        assert "Risk-123" in graph
+        assert "Control-456" in graph
 
     def test_resolve_case_insensitive_matching(self, normalizer: EntityNormalizer) -> None:
         """Test that partial matching is case insensitive."""
@@ -692,8 +782,47 @@ class TestCrossReferenceResolution:
             ),
         ]
 
-        normalizer.resolve_cross_references(entities)
-        assert len(normalizer.entity_graph["Regulation-001"]) >= 1
+        graph = normalizer.build_entity_graph(normalizer.resolve_cross_references(entities))
+        assert len(graph["Regulation-001"]) >= 1
+
+    def test_resolve_partial_match_uses_first_canonical_mention(
+        self, normalizer: EntityNormalizer
+    ) -> None:
+        """A low-confidence mention resolves to the earliest text it contains or is part of."""
+
+        def mention(text: str, entity_id: str, confidence: float) -> Entity:
+            return Entity(
+                type=EntityType.RISK,
+                id=entity_id,
+                text=text,
+                confidence=confidence,
+                location={"start": 0, "end": len(text)},
+            )
+
+        entities = [
+            mention("R-12", "Risk-12", 0.95),
+            mention("Risk-123", "Risk-123", 0.95),
+            mention("r-1", "Risk-1", 0.8),  # Contained in "R-12"
+            mention("isk-123", "Risk-7", 0.8),  # Part of "Risk-123"
+            mention("Risk-1234", "Risk-1234", 0.8),  # Contains "risk-123" and "isk-123"
+            mention("Risk-9", "Risk-9", 0.8),  # Only matches itself
+            mention("R-12", "Risk-12b", 0.95),  # Later duplicate text overrides the ID
+        ]
+
+        resolved = normalizer.resolve_cross_references(entities)
+
+        assert [entity.id for entity in resolved] == [
+            "Risk-12",
+            "Risk-123",
+            "Risk-12b",
+            "Risk-123",
+            "Risk-123",
+            "Risk-9",
+            "Risk-12b",
+        ]
+        graph = normalizer.build_entity_graph(resolved)
+        assert graph["Risk-123"] == ["Risk-123", "isk-123", "Risk-1234"]
+        assert graph["Risk-12b"] == ["r-1", "R-12"]
 
 
 # ============================================================================
@@ -808,6 +937,52 @@ class TestEntityNormalizerIntegration:
         # Should have counts for risk and control types
         assert isinstance(result.metadata.entity_counts, dict)
 
+    def test_process_locations_are_character_offsets(
+        self, normalizer: EntityNormalizer, processing_context: ProcessingContext
+    ) -> None:
+        """Entity locations index the processed text exactly, whatever the spacing."""
+        text = "Findings:\n\n  Risk-001   was raised;\tControl-100 mitigates it."
+        result = normalizer.process(_document(text), processing_context)
+
+        assert [entity.text for entity in result.entities] == ["Risk-001", "Control-100"]
+        for entity in result.entities:
+            assert text[entity.location["start"] : entity.location["end"]] == entity.text
+
+    def test_process_multiword_match_does_not_hide_later_word(
+        self, processing_context: ProcessingContext, tmp_path: Path
+    ) -> None:
+        """A whole-text match spanning words still lets the words inside it be recognized."""
+        patterns_file = tmp_path / "patterns.yaml"
+        patterns_file.write_text(
+            "risks:\n"
+            "  - pattern: 'Risk\\s+register\\s+R-\\d+'\n"
+            "    priority: 2\n"
+            "  - pattern: 'R-\\d+'\n"
+            "    priority: 1\n",
+            encoding="utf-8",
+        )
+        normalizer = EntityNormalizer(patterns_file=patterns_file)
+
+        result = normalizer.process(_document("Risk register R-7 reviewed"), processing_context)
+
+        assert [(entity.text, entity.id) for entity in result.entities] == [("R-7", "Risk-7")]
+        assert result.entities[0].location == {"start": 14, "end": 17}
+
+    def test_process_anchored_patterns_classify_every_word(
+        self, processing_context: ProcessingContext, tmp_path: Path
+    ) -> None:
+        """Patterns anchored to the word fall back to per-word classification."""
+        patterns_file = tmp_path / "patterns.yaml"
+        patterns_file.write_text(
+            "issues:\n  - pattern: '^ISS\\d+$'\n    priority: 1\n", encoding="utf-8"
+        )
+        normalizer = EntityNormalizer(patterns_file=patterns_file)
+
+        result = normalizer.process(_document("Open ISS42 and ISS7x"), processing_context)
+
+        assert normalizer._entity_scanner() is None
+        assert [entity.text for entity in result.entities] == ["ISS42"]
+
 
 # ============================================================================
 # Configuration Loading Tests (AC-2.2.7)
@@ -0,0 +1,152 @@
+"""Unit tests for the shared normalizer registry.
+
+Tests cover:
+- One compiled Normalizer per configuration, reused across lookups
+- Invalidation when a resource YAML file changes
+- Single build under concurrent lookups
+- No per-document state kept on a shared normalizer
+"""
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+import structlog
+
+from src.data_extract.core.models import Document, Metadata, ProcessingContext
+from src.data_extract.normalize.config import NormalizationConfig
+from src.data_extract.normalize.normalizer import Normalizer
+from src.data_extract.normalize.registry import NormalizerRegistry, normalizer_resource_key
+
+pytestmark = [pytest.mark.P1, pytest.mark.unit]
+
+
+@pytest.fixture
+def patterns_file(tmp_path: Path) -> Path:
+    path = tmp_path / "entity_patterns.yaml"
+    path.write_text(
+        Path("config/normalize/entity_patterns.yaml").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+    return path
+
+
+def _archer_export(source_file: Path, doc_id: str, field_name: str, value: str) -> Document:
+    return Document(
+        id=doc_id,
+        text=(
+            f'<html><body><div class="archer-field" name="{field_name}">{value}</div>'
+            "RSA Archer archer_field_id recordId=1</body></html>"
+        ),
+        metadata=Metadata(
+            source_file=source_file,
+            file_hash=doc_id,
+            processing_timestamp=datetime.now(),
+            tool_version="0.1.0",
+            config_version="1.0",
+        ),
+        structure={},
+    )
+
+
+def _container_sizes(normalizer: Normalizer) -> Dict[str, int]:
+    """Sizes of every dict/list/set held by the normalizer and its components."""
+    components: list[Any] = [
+        normalizer,
+        normalizer.text_cleaner,
+        normalizer.entity_normalizer,
+        normalizer.schema_standardizer,
+        normalizer.quality_validator,
+        normalizer.metadata_enricher,
+    ]
+    return {
+        f"{type(component).__name__}.{name}": len(value)
+        for component in components
+        if component is not None
+        for name, value in vars(component).items()
+        if isinstance(value, (dict, list, set))
+    }
+
+
+class TestNormalizerRegistry:
+    """Test NormalizerRegistry caching and invalidation."""
+
+    def test_same_config_reuses_normalizer_and_reports_load_once(self) -> None:
+        registry = NormalizerRegistry()
+
+        first, first_load_ms = registry.acquire(NormalizationConfig())
+        second, second_load_ms = registry.acquire(NormalizationConfig())
+
+        assert first is second
+        assert first_load_ms > 0
+        assert second_load_ms == 0.0
+        assert (registry.loads, registry.hits) == (1, 1)
+
+    def test_different_config_gets_own_normalizer(self) -> None:
+        registry = NormalizerRegistry()
+
+        default = registry.get(NormalizationConfig())
+        custom = registry.get(NormalizationConfig(remove_ocr_artifacts=False))
+
+        assert default is not custom
+        assert custom.config.remove_ocr_artifacts is False
+
+    def test_resource_file_change_rebuilds_and_drops_stale_entry(self, patterns_file: Path) -> None:
+        registry = NormalizerRegistry()
+        config = NormalizationConfig(entity_patterns_file=patterns_file)
+        original = registry.get(config)
+        key = normalizer_resource_key(config)
+
+        stat = patterns_file.stat()
+        os.utime(patterns_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        rebuilt = registry.get(config)
+
+        assert rebuilt is not original
+        assert normalizer_resource_key(config) != key
+        assert registry.get(config) is rebuilt
+        assert len(registry._entries) == 1
+
+    def test_concurrent_lookups_build_once(self) -> None:
+        registry = NormalizerRegistry()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def lookup() -> None:
+            barrier.wait()
+            results.append(registry.get(NormalizationConfig()))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registry.loads == 1
+        assert all(normalizer is results[0] for normalizer in results)
+
+    def test_shared_normalizer_keeps_no_state_between_documents(self, tmp_path: Path) -> None:
+        config = NormalizationConfig(
+            schema_templates_file=Path("config/normalize/schema_templates.yaml")
+        )
+        shared = NormalizerRegistry().get(config)
+        source_file = tmp_path / "export.html"
+        source_file.write_text("export", encoding="utf-8")
+        context = ProcessingContext(config={}, logger=structlog.get_logger(), metrics={})
+
+        first = shared.process(_archer_export(source_file, "doc-1", "Risk ID", "RISK-1"), context)
+        state_after_first = _container_sizes(shared)
+        second = shared.process(
+            _archer_export(source_file, "doc-2", "Risk Description", "Vendor outage"), context
+        )
+        fresh = Normalizer(config).process(
+            _archer_export(source_file, "doc-2", "Risk Description", "Vendor outage"),
+            ProcessingContext(config={}, logger=structlog.get_logger(), metrics={}),
+        )
+
+        assert first.structure["archer_fields"]["standardized_fields"] == {"id": "RISK-1"}
+        assert _container_sizes(shared) == state_after_first
+        assert second.structure["archer_fields"] == fresh.structure["archer_fields"]
+        assert "RISK-1" not in str(second.structure)
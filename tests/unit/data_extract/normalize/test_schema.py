@@ -605,15 +605,15 @@ class TestFieldNameStandardization:
 
         source_fields = {"Risk ID": "RISK-001", "Risk Description": "Test risk"}
 
-        _ = standardizer.standardize_field_names(
+        traceability = standardizer.trace_field_mappings(
             source_fields, DocumentType.EXPORT, "Risk Management"
         )
 
         # Check traceability mapping
-        assert "Risk ID" in standardizer.field_mapping_traceability
-        assert standardizer.field_mapping_traceability["Risk ID"] == "id"
-        assert "Risk Description" in standardizer.field_mapping_traceability
-        assert standardizer.field_mapping_traceability["Risk Description"] == "description"
+        assert "Risk ID" in traceability
+        assert traceability["Risk ID"] == "id"
+        assert "Risk Description" in traceability
+        assert traceability["Risk Description"] == "description"
 
     def test_field_standardization_missing_source(self, mock_metadata: Metadata) -> None:
         """Handle missing source fields gracefully."""
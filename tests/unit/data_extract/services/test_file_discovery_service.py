@@ -4,7 +4,12 @@ from pathlib import Path
 
 import pytest
 
-from data_extract.services.file_discovery_service import FileDiscoveryService
+from data_extract.services.file_discovery_service import (
+    DISCOVERY_WORKERS_ENV,
+    DirectoryWalker,
+    FileDiscoveryService,
+    resolve_discovery_workers,
+)
 
 pytestmark = [pytest.mark.unit]
 
@@ -48,3 +53,117 @@ def test_discover_relative_recursive_glob_keeps_pattern_root(
 
     assert files == sorted([file_a.resolve(), file_b.resolve()])
     assert discovered_source == pattern_root.resolve()
+
+
+def _make_tree(root: Path) -> list[Path]:
+    expected = []
+    for top in range(3):
+        for sub in range(3):
+            directory = root / f"dir{top}" / f"sub{sub}"
+            directory.mkdir(parents=True)
+            for index in range(2):
+                doc = directory / f"doc{index}.txt"
+                doc.write_text("x", encoding="utf-8")
+                expected.append(doc.resolve())
+            (directory / "ignored.bin").write_bytes(b"\0")
+    top_level = root / "top.md"
+    top_level.write_text("x", encoding="utf-8")
+    expected.append(top_level.resolve())
+    return sorted(expected)
+
+
+def test_parallel_walk_matches_recursive_glob(tmp_path: Path) -> None:
+    expected = _make_tree(tmp_path / "source")
+
+    files, source_dir = FileDiscoveryService().discover(tmp_path / "source", recursive=True)
+    globbed = FileDiscoveryService().discover(str(tmp_path / "source" / "**" / "*"))[0]
+
+    assert files == expected
+    assert globbed == expected
+    assert source_dir == tmp_path / "source"
+
+
+def test_discover_non_recursive_stays_at_top_level(tmp_path: Path) -> None:
+    _make_tree(tmp_path / "source")
+
+    files, _ = FileDiscoveryService().discover(tmp_path / "source", recursive=False)
+
+    assert files == [(tmp_path / "source" / "top.md").resolve()]
+
+
+def test_excluded_directory_is_pruned_without_listing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source"
+    expected = _make_tree(source)
+    output_dir = source / "output"
+    output_dir.mkdir()
+    (output_dir / "previous.txt").write_text("x", encoding="utf-8")
+
+    scanned: list[str] = []
+    original_scan = DirectoryWalker._scan
+
+    def tracking_scan(self: DirectoryWalker, directory: str) -> tuple[list[str], list[str]]:
+        scanned.append(directory)
+        return original_scan(self, directory)
+
+    monkeypatch.setattr(DirectoryWalker, "_scan", tracking_scan)
+    files, _ = FileDiscoveryService().discover(source, recursive=True, exclude_paths=[output_dir])
+
+    assert files == expected
+    assert str(output_dir.resolve()) not in scanned
+
+
+def test_walker_does_not_follow_directory_symlinks(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    (source / "real").mkdir(parents=True)
+    doc = source / "real" / "doc.txt"
+    doc.write_text("x", encoding="utf-8")
+    (source / "real" / "loop").symlink_to(source, target_is_directory=True)
+
+    files = sorted(DirectoryWalker(workers=4).walk(source))
+
+    assert files == [doc.resolve()]
+
+
+@pytest.mark.parametrize("workers", ["1", "4"])
+def test_symlinked_files_are_judged_by_their_target(tmp_path: Path, workers: str) -> None:
+    source = tmp_path / "source"
+    output_dir = source / "output"
+    output_dir.mkdir(parents=True)
+    notes = source / "notes.bin"
+    notes.write_text("x", encoding="utf-8")
+    previous = output_dir / "previous.txt"
+    previous.write_text("x", encoding="utf-8")
+    report = tmp_path / "report.txt"
+    report.write_text("x", encoding="utf-8")
+    (source / "a.pdf").symlink_to(notes)
+    (source / "old.txt").symlink_to(previous)
+    (source / "report.bin").symlink_to(report)
+
+    walker = DirectoryWalker(
+        workers=int(workers),
+        exclude_paths=[output_dir],
+        file_filter=lambda name: name.endswith((".pdf", ".txt")),
+    )
+
+    assert sorted(walker.walk(source)) == [report.resolve()]
+
+
+def test_root_inside_excluded_directory_yields_nothing(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    expected = _make_tree(source)
+
+    assert expected
+    assert list(DirectoryWalker(exclude_paths=[tmp_path]).walk(source)) == []
+
+
+@pytest.mark.parametrize("workers", ["1", "4"])
+def test_worker_count_does_not_change_results(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: str
+) -> None:
+    expected = _make_tree(tmp_path / "source")
+    monkeypatch.setenv(DISCOVERY_WORKERS_ENV, workers)
+
+    assert resolve_discovery_workers() == int(workers)
+    assert FileDiscoveryService().discover(tmp_path / "source", recursive=True)[0] == expected
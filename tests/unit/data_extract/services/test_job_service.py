@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+from data_extract.cli.session import SessionManager
 from data_extract.contracts import JobStatus, ProcessJobRequest
-from data_extract.services import JobService, StatusService
+from data_extract.services import JobService, PipelineService, StatusService
 
 
 def test_run_process_generates_real_output_for_txt(tmp_path: Path) -> None:
@@ -196,3 +200,48 @@ def test_request_hash_ignores_outputs_inside_source_tree(tmp_path: Path) -> None
 
     assert first.request_hash is not None
     assert second.request_hash == first.request_hash
+
+
+class _Crash(BaseException):
+    """Simulates the process dying mid-batch."""
+
+
+class _CrashingPipeline(PipelineService):
+    def __init__(self, crash_on: str) -> None:
+        super().__init__()
+        self.crash_on = crash_on
+
+    def process_file(self, file_path: Path, **kwargs: Any):  # type: ignore[override]
+        if file_path.name == self.crash_on:
+            raise _Crash()
+        return super().process_file(file_path=file_path, **kwargs)
+
+
+def test_run_process_checkpoints_each_file_for_resume(tmp_path: Path) -> None:
+    source_dir = tmp_path / "checkpoint-source"
+    output_dir = tmp_path / "checkpoint-output"
+    source_dir.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (source_dir / name).write_text(f"payload {name}", encoding="utf-8")
+    request = ProcessJobRequest(
+        input_path=str(source_dir),
+        output_path=str(output_dir),
+        output_format="json",
+        chunk_size=16,
+    )
+
+    with pytest.raises(_Crash):
+        JobService(pipeline_service=_CrashingPipeline("c.txt")).run_process(
+            request, work_dir=tmp_path
+        )
+
+    interrupted = SessionManager(work_dir=tmp_path).find_incomplete_session(source_dir)
+    assert interrupted is not None
+    assert sorted(entry["path"] for entry in interrupted.processed_files) == ["a.txt", "b.txt"]
+
+    resumed = JobService().run_process(
+        request.model_copy(update={"resume": True}), work_dir=tmp_path
+    )
+
+    assert [Path(item.path).name for item in resumed.processed_files] == ["c.txt"]
+    assert resumed.skipped_count == 2
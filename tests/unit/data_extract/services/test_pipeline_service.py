@@ -1,9 +1,18 @@
+import gc
+import multiprocessing
 import sys
+import time
 import types
 from pathlib import Path
 
+import pytest
+
 sys.modules.setdefault("textstat", types.SimpleNamespace())
-from data_extract.services.pipeline_service import PipelineService  # noqa: E402
+from data_extract.services.pipeline_service import (  # noqa: E402
+    PipelineFailure,
+    PipelineFileResult,
+    PipelineService,
+)
 
 
 def test_auto_profile_uses_advanced_for_pdf_without_semantic() -> None:
@@ -36,3 +45,312 @@ def test_advanced_profile_enables_advanced_for_all_inputs() -> None:
         pipeline_profile="advanced",
         file_path=Path("sample.txt"),
     )
+
+
+def _write_sources(source_dir: Path, count: int) -> list[Path]:
+    source_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = source_dir / f"doc_{index}.txt"
+        path.write_text(f"document {index} alpha beta gamma delta", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_process_executor_matches_thread_executor(tmp_path: Path) -> None:
+    files = _write_sources(tmp_path / "source", 4)
+
+    thread_run = PipelineService().process_files(
+        files=files,
+        output_dir=tmp_path / "thread-out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        source_root=tmp_path / "source",
+        executor="thread",
+    )
+    process_run = PipelineService().process_files(
+        files=files,
+        output_dir=tmp_path / "process-out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        source_root=tmp_path / "source",
+        executor="process",
+    )
+
+    assert not process_run.failed
+    assert sorted(item.source_path for item in process_run.processed) == sorted(files)
+    assert {item.output_path.name for item in process_run.processed} == {
+        item.output_path.name for item in thread_run.processed
+    }
+    assert set(process_run.stage_totals_ms) == {
+        "extract",
+        "normalize",
+        "chunk",
+        "semantic",
+        "output",
+    }
+    expected_extract = sum(item.stage_timings_ms["extract"] for item in process_run.processed)
+    assert process_run.stage_totals_ms["extract"] == pytest.approx(expected_extract)
+
+
+def test_process_executor_reports_worker_failures(tmp_path: Path) -> None:
+    files = _write_sources(tmp_path / "source", 2)
+    missing = tmp_path / "source" / "missing.txt"
+
+    run = PipelineService().process_files(
+        files=[*files, missing],
+        output_dir=tmp_path / "out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        executor="process",
+    )
+
+    assert len(run.processed) == 2
+    assert [failure.source_path for failure in run.failed] == [missing]
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_context().get_start_method() != "fork",
+    reason="models are only pre-loaded for fork-started workers",
+)
+def test_process_executor_warms_sentence_model_before_fork(monkeypatch, tmp_path: Path) -> None:
+    import data_extract.utils.nlp as nlp_module
+
+    warmed = []
+    real_warm = nlp_module.warm_nlp_models
+
+    def _record_warm(backends, freeze=False):
+        warmed.append((list(backends), freeze))
+        return real_warm(backends, freeze=freeze)
+
+    monkeypatch.setattr(nlp_module, "warm_nlp_models", _record_warm)
+
+    run = PipelineService().process_files(
+        files=_write_sources(tmp_path / "source", 2),
+        output_dir=tmp_path / "out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        pipeline_profile="advanced",
+        segmentation_backend="sentencizer",
+        executor="process",
+    )
+
+    assert not run.failed
+    assert warmed == [(["sentencizer"], True)]
+    # gc.unfreeze() also releases objects the interpreter froze at start-up.
+    assert gc.get_freeze_count() == 0
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="heap is only frozen before fork"
+)
+def test_process_executor_unfreezes_heap_when_result_callback_raises(tmp_path: Path) -> None:
+    def _failing_sink(outcome) -> None:
+        raise RuntimeError("sink unavailable")
+
+    with pytest.raises(RuntimeError, match="sink unavailable"):
+        PipelineService().process_files(
+            files=_write_sources(tmp_path / "source", 2),
+            output_dir=tmp_path / "out",
+            output_format="json",
+            chunk_size=16,
+            workers=2,
+            pipeline_profile="advanced",
+            segmentation_backend="sentencizer",
+            executor="process",
+            on_result=_failing_sink,
+        )
+
+    assert gc.get_freeze_count() == 0
+
+
+def test_process_files_rejects_unknown_executor(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid executor"):
+        PipelineService().process_files(
+            files=[],
+            output_dir=tmp_path / "out",
+            output_format="json",
+            chunk_size=16,
+            executor="gpu",
+        )
+
+
+def test_staged_executor_matches_sequential_outputs(tmp_path: Path) -> None:
+    files = _write_sources(tmp_path / "source", 5)
+
+    sequential = PipelineService().process_files(
+        files=files,
+        output_dir=tmp_path / "seq-out",
+        output_format="json",
+        chunk_size=16,
+        source_root=tmp_path / "source",
+    )
+    staged = PipelineService().process_files(
+        files=files,
+        output_dir=tmp_path / "staged-out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        source_root=tmp_path / "source",
+        executor="staged",
+    )
+
+    assert not staged.failed
+    assert sorted(item.source_path for item in staged.processed) == sorted(files)
+    for item in sequential.processed:
+        staged_output = tmp_path / "staged-out" / item.output_path.name
+        assert staged_output.exists()
+    assert set(staged.stage_metrics) == {"extract", "normalize", "chunk", "semantic", "output"}
+    assert all(metrics["processed"] == 5 for metrics in staged.stage_metrics.values())
+
+
+def test_staged_executor_reports_failures_and_stops(tmp_path: Path) -> None:
+    files = _write_sources(tmp_path / "source", 3)
+    missing = tmp_path / "source" / "missing.txt"
+
+    run = PipelineService().process_files(
+        files=[*files, missing],
+        output_dir=tmp_path / "out",
+        output_format="json",
+        chunk_size=16,
+        executor="staged",
+    )
+
+    assert len(run.processed) == 3
+    assert [failure.source_path for failure in run.failed] == [missing]
+    assert run.stage_metrics["extract"]["failed"] == 1
+
+
+@pytest.mark.parametrize("executor", ["thread", "staged"])
+def test_pool_executors_start_before_input_is_exhausted(tmp_path: Path, executor: str) -> None:
+    files = _write_sources(tmp_path / "source", 4)
+    output_dir = tmp_path / "out"
+    overlapped: list[bool] = []
+
+    def discovered():
+        yield from files[:2]
+        # A lazy consumer has written output by now; one that lists its input first
+        # is still waiting on this generator.
+        deadline = time.monotonic() + 10
+        while not any(output_dir.rglob("*.json")) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        overlapped.append(any(output_dir.rglob("*.json")))
+        yield from files[2:]
+
+    run = PipelineService().process_files(
+        files=discovered(),
+        output_dir=output_dir,
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        source_root=tmp_path / "source",
+        executor=executor,
+    )
+
+    assert overlapped == [True]
+    assert not run.failed
+    assert sorted(item.source_path for item in run.processed) == sorted(files)
+
+
+def test_on_result_streams_outcomes_in_result_order(tmp_path: Path) -> None:
+    files = _write_sources(tmp_path / "source", 4)
+    missing = tmp_path / "source" / "missing.txt"
+    streamed: list[object] = []
+
+    run = PipelineService().process_files(
+        files=[files[0], missing, *files[1:]],
+        output_dir=tmp_path / "out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        on_result=streamed.append,
+    )
+
+    processed = [item for item in streamed if isinstance(item, PipelineFileResult)]
+    failed = [item for item in streamed if isinstance(item, PipelineFailure)]
+    assert len(streamed) == 5
+    assert processed == run.processed
+    assert failed == run.failed
+
+
+def test_advanced_runs_share_one_normalizer_and_report_load_once(tmp_path: Path) -> None:
+    from data_extract.normalize.registry import get_normalizer_registry
+
+    get_normalizer_registry().clear()
+    files = _write_sources(tmp_path / "source", 4)
+
+    run = PipelineService().process_files(
+        files=files,
+        output_dir=tmp_path / "out",
+        output_format="json",
+        chunk_size=16,
+        workers=2,
+        pipeline_profile="advanced",
+    )
+    second = PipelineService().process_files(
+        files=files[:1],
+        output_dir=tmp_path / "out-again",
+        output_format="json",
+        chunk_size=16,
+        pipeline_profile="advanced",
+    )
+
+    assert not run.failed and not second.failed
+    loads = [item for item in run.processed if "normalize_load" in item.stage_timings_ms]
+    assert len(loads) == 1
+    assert run.stage_totals_ms["normalize_load"] == loads[0].stage_timings_ms["normalize_load"]
+    assert "normalize_load" not in second.stage_totals_ms
+
+
+def test_chunk_documents_matches_per_document_advanced_chunking(tmp_path: Path) -> None:
+    service = PipelineService()
+    documents = [service._extract(path) for path in _write_sources(tmp_path / "source", 3)]
+
+    batched = service.chunk_documents(documents, chunk_size=16)
+
+    expected = [service._chunk_advanced(document, 16) for document in documents]
+    assert [[chunk.text for chunk in chunks] for chunks in batched] == [
+        [chunk.text for chunk in chunks] for chunks in expected
+    ]
+
+
+def test_segmentation_backend_resolves_from_request_env_then_profile(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from data_extract.services.pipeline_service import resolve_segmentation_backend
+
+    monkeypatch.setenv("DATA_EXTRACT_SEGMENTATION_BACKEND_AUTO", "sentencizer")
+
+    assert resolve_segmentation_backend("advanced") == "parser"
+    assert resolve_segmentation_backend("auto") == "sentencizer"
+    assert resolve_segmentation_backend("auto", "Heuristic") == "heuristic"
+
+
+def test_process_files_rejects_unknown_segmentation_backend(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid segmentation backend"):
+        PipelineService().process_files(
+            files=_write_sources(tmp_path / "source", 1),
+            output_dir=tmp_path / "out",
+            output_format="json",
+            chunk_size=16,
+            segmentation_backend="fastest",
+        )
+
+
+def test_heuristic_segmentation_backend_runs_advanced_pipeline(tmp_path: Path) -> None:
+    run = PipelineService().process_files(
+        files=_write_sources(tmp_path / "source", 2),
+        output_dir=tmp_path / "out",
+        output_format="json",
+        chunk_size=16,
+        pipeline_profile="advanced",
+        allow_advanced_fallback=False,
+        segmentation_backend="heuristic",
+    )
+
+    assert not run.failed
+    assert all(item.chunk_count >= 1 for item in run.processed)
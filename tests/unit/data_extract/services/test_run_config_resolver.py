@@ -50,3 +50,42 @@ def test_resolve_includes_evaluation_defaults(monkeypatch: pytest.MonkeyPatch) -
     assert resolved.evaluation.enabled is True
     assert resolved.evaluation.policy == "baseline_v1"
     assert resolved.evaluation.fail_on_bad is False
+
+
+def test_resolve_executor_settings_from_request_and_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_load_merged_config(**_: Any) -> _MergedConfigStub:
+        return _MergedConfigStub({"format": "json", "chunk": {"size": 512}, "semantic": {}})
+
+    monkeypatch.setattr(resolver_module, "load_merged_config", fake_load_merged_config)
+    monkeypatch.setenv("DATA_EXTRACT_PIPELINE_WORKERS", "8")
+    monkeypatch.setenv("DATA_EXTRACT_PIPELINE_EXECUTOR", "process")
+
+    from_env = RunConfigResolver().resolve(ProcessJobRequest(input_path="/tmp/source"))
+    assert from_env.workers == 8
+    assert from_env.executor == "process"
+
+    explicit = RunConfigResolver().resolve(
+        ProcessJobRequest(input_path="/tmp/source", workers=3, executor="thread")
+    )
+    assert explicit.workers == 3
+    assert explicit.executor == "thread"
+
+    monkeypatch.setenv("DATA_EXTRACT_PIPELINE_EXECUTOR", "bogus")
+    fallback = RunConfigResolver().resolve(ProcessJobRequest(input_path="/tmp/source"))
+    assert fallback.executor == "thread"
+
+
+def test_resolve_passes_requested_segmentation_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_load_merged_config(**_: Any) -> _MergedConfigStub:
+        return _MergedConfigStub({"format": "json", "chunk": {"size": 512}, "semantic": {}})
+
+    monkeypatch.setattr(resolver_module, "load_merged_config", fake_load_merged_config)
+
+    default = RunConfigResolver().resolve(ProcessJobRequest(input_path="/tmp/source"))
+    explicit = RunConfigResolver().resolve(
+        ProcessJobRequest(input_path="/tmp/source", segmentation_backend=" Senter ")
+    )
+
+    # None leaves the choice to the pipeline profile (and its environment override).
+    assert default.segmentation_backend is None
+    assert explicit.segmentation_backend == "senter"
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from data_extract.services import fingerprint_service as service_module
+from data_extract.utils import fingerprint as fingerprint_module
+from data_extract.utils.fingerprint import FingerprintService
+
+
+def _write_settled(path: Path, payload: bytes) -> Path:
+    """Write a file with an mtime outside the racy-timestamp window."""
+    path.write_bytes(payload)
+    settled = path.stat().st_mtime_ns - 10 * FingerprintService.RACY_WINDOW_NS
+    os.utime(path, ns=(settled, settled))
+    return path
+
+
+def test_fingerprint_matches_sha256_and_hashes_once(tmp_path: Path) -> None:
+    source = _write_settled(tmp_path / "ledger.txt", b"control evidence\n" * 100)
+    service = FingerprintService(cache_path=None)
+
+    first = service.fingerprint(source)
+    second = service.fingerprint(source)
+
+    assert first == second == hashlib.sha256(source.read_bytes()).hexdigest()
+    assert service.hashed_files == 1
+    assert service.cache_hits == 1
+
+
+def test_fingerprint_rehashes_when_stat_identity_changes(tmp_path: Path) -> None:
+    source = _write_settled(tmp_path / "ledger.txt", b"version one")
+    service = FingerprintService(cache_path=None)
+    service.fingerprint(source)
+
+    _write_settled(source, b"version two, longer")
+
+    assert service.fingerprint(source) == hashlib.sha256(b"version two, longer").hexdigest()
+    assert service.hashed_files == 2
+
+
+def test_fingerprint_persists_across_service_instances(tmp_path: Path) -> None:
+    source = _write_settled(tmp_path / "ledger.txt", b"quarterly binder")
+    cache_path = tmp_path / "cache" / "fingerprints.sqlite3"
+    FingerprintService(cache_path=cache_path).fingerprint(source)
+
+    later_run = FingerprintService(cache_path=cache_path)
+
+    assert later_run.fingerprint(source) == hashlib.sha256(b"quarterly binder").hexdigest()
+    assert later_run.hashed_files == 0
+
+
+def test_read_bytes_records_fingerprint_from_same_read(tmp_path: Path) -> None:
+    source = _write_settled(tmp_path / "notes.txt", b"risk register")
+    service = FingerprintService(cache_path=None)
+
+    assert service.read_bytes(source) == b"risk register"
+    service.fingerprint(source)
+
+    assert service.hashed_files == 1
+    assert service.cache_hits == 1
+
+
+def test_recently_modified_files_are_not_cached(tmp_path: Path) -> None:
+    source = tmp_path / "fresh.txt"
+    source.write_bytes(b"just written")
+    service = FingerprintService(cache_path=None)
+
+    service.fingerprint(source)
+    service.fingerprint(source)
+
+    assert service.hashed_files == 2
+
+
+def test_fingerprint_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATA_EXTRACT_FINGERPRINT_CACHE", "off")
+
+    assert fingerprint_module.resolve_fingerprint_cache_path() is None
+    assert fingerprint_module.get_fingerprint_service().cache_path is None
+
+
+def test_persistent_cache_reuses_one_connection_per_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sources = [_write_settled(tmp_path / f"doc-{index}.txt", b"%d" % index) for index in range(5)]
+    service = FingerprintService(cache_path=tmp_path / "fingerprints.sqlite3")
+    connects: list[str] = []
+    real_connect = fingerprint_module.sqlite3.connect
+
+    def counting_connect(database: str, **kwargs: object):
+        connects.append(database)
+        return real_connect(database, **kwargs)
+
+    monkeypatch.setattr(fingerprint_module.sqlite3, "connect", counting_connect)
+
+    for source in sources:
+        service.fingerprint(source)
+    service.close()
+
+    assert len(connects) == 1
+    later_run = FingerprintService(cache_path=tmp_path / "fingerprints.sqlite3")
+    assert [later_run.fingerprint(source) for source in sources] == [
+        hashlib.sha256(source.read_bytes()).hexdigest() for source in sources
+    ]
+    assert later_run.hashed_files == 0
+    later_run.close()
+
+
+def test_service_layer_reexports_shared_fingerprint_service() -> None:
+    assert service_module.get_fingerprint_service is fingerprint_module.get_fingerprint_service
+    assert service_module.FingerprintService is FingerprintService
@@ -1,20 +1,38 @@
 """Unit tests for nlp utilities.
 
-Tests for get_sentence_boundaries() function covering:
+Tests for get_sentence_boundaries() and get_sentence_boundaries_batch() covering:
 - Input validation (empty text, whitespace)
 - Sentence boundary detection accuracy
 - Lazy loading behavior
 - Model caching
 - Error handling for missing model
+- Batched segmentation matching per-text results
+- Segmentation backend registry
+- Windowed segmentation of long texts matching single-pass output
+- Model registry: single load under concurrency, warm-up, stats, fork sharing
 """
 
+import multiprocessing
+import sys
+import threading
 import time
 from unittest.mock import patch
 
 import pytest
 import spacy
 
-from src.data_extract.utils.nlp import get_sentence_boundaries
+import src.data_extract.utils.nlp as nlp_module
+from src.data_extract.utils.nlp import (
+    clear_nlp_models,
+    get_segmentation_backend,
+    get_sentence_boundaries,
+    get_sentence_boundaries_batch,
+    iter_sentence_boundaries,
+    nlp_model_stats,
+    register_segmentation_backend,
+    segmentation_backend_names,
+    warm_nlp_models,
+)
 
 pytestmark = [pytest.mark.P1, pytest.mark.unit]
 
@@ -235,3 +253,281 @@ class TestSentenceBoundaryEdgeCases:
         boundaries = get_sentence_boundaries(text)
 
         assert len(boundaries) == 2
+
+
+@pytest.mark.unit
+class TestSentenceBoundariesBatch:
+    """Tests for batched sentence boundary detection."""
+
+    TEXTS = [
+        "First sentence. Second sentence.",
+        "",
+        "Dr. Smith works at XYZ Corp. in the U.S. He is an expert.",
+        "   ",
+        "Really? Yes! Maybe not.",
+    ]
+
+    def test_batch_matches_single_text_results(self) -> None:
+        """Each non-empty text gets the same boundaries as a single call."""
+        batched = get_sentence_boundaries_batch(self.TEXTS, batch_size=2)
+
+        assert len(batched) == len(self.TEXTS)
+        for text, boundaries in zip(self.TEXTS, batched):
+            if text.strip():
+                assert boundaries == get_sentence_boundaries(text)
+            else:
+                assert boundaries == []
+
+    def test_batch_with_provided_nlp_model(self) -> None:
+        """Pre-loaded models are run through nlp.pipe with the same results."""
+        nlp = _load_test_nlp_model()
+
+        batched = get_sentence_boundaries_batch(self.TEXTS, nlp=nlp)
+
+        assert batched[0] == [15, 32]
+        assert batched[0] == get_sentence_boundaries(self.TEXTS[0], nlp=nlp)
+        assert batched[1] == [] and batched[3] == []
+
+    def test_batch_disables_non_sentence_components(self) -> None:
+        """Components that do not set sentence boundaries are not run."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        calls = []
+
+        @spacy.Language.component("test_ner_probe")
+        def _probe(doc):  # pragma: no cover - must never run
+            calls.append(doc)
+            return doc
+
+        nlp.add_pipe("test_ner_probe", name="ner")
+
+        assert get_sentence_boundaries_batch(["One. Two."], nlp=nlp) == [[4, 9]]
+        assert get_sentence_boundaries("One. Two.", nlp=nlp) == [4, 9]
+        assert calls == []
+
+    def test_invalid_batch_settings_raise_valueerror(self) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            get_sentence_boundaries_batch(["Text."], batch_size=0)
+        with pytest.raises(ValueError, match="n_process"):
+            get_sentence_boundaries_batch(["Text."], n_process=0)
+
+
+@pytest.mark.unit
+class TestSegmentationBackends:
+    """Tests for the pluggable segmentation backend registry."""
+
+    TEXTS = ["Dr. Smith visited the clinic. He met with Mrs. Johnson.", "", "Really? Yes!"]
+
+    def test_builtin_backends_are_registered(self) -> None:
+        assert {"parser", "senter", "sentencizer", "heuristic"} <= set(segmentation_backend_names())
+
+    @pytest.mark.parametrize("name", ["parser", "senter", "sentencizer", "heuristic"])
+    def test_backend_returns_boundaries_per_text(self, name: str) -> None:
+        boundaries = get_segmentation_backend(name)(self.TEXTS, 8, 1)
+
+        assert len(boundaries) == len(self.TEXTS)
+        assert boundaries[1] == []
+        assert boundaries[0][-1] == len(self.TEXTS[0])
+        assert boundaries[2] == [7, 12]
+
+    def test_backend_lookup_is_case_insensitive(self) -> None:
+        assert get_segmentation_backend(" Heuristic ") is get_segmentation_backend("heuristic")
+
+    def test_unknown_backend_raises_valueerror(self) -> None:
+        with pytest.raises(ValueError, match="Invalid segmentation backend 'fastest'"):
+            get_segmentation_backend("fastest")
+
+    def test_custom_backend_can_be_registered(self) -> None:
+        def _whole_text(texts, batch_size, n_process):
+            return [[len(text)] if text.strip() else [] for text in texts]
+
+        register_segmentation_backend("test_whole_text", _whole_text)
+
+        assert get_segmentation_backend("test_whole_text")(["A. B."], 1, 1) == [[5]]
+
+
+@pytest.mark.unit
+class TestWindowedSentenceBoundaries:
+    """Tests for iter_sentence_boundaries() on texts longer than one window."""
+
+    @staticmethod
+    def _nlp():
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp
+
+    @staticmethod
+    def _long_text(paragraph_breaks: bool) -> str:
+        separator = "\n\n" if paragraph_breaks else " "
+        paragraphs = [
+            " ".join(
+                f"Paragraph {index} sentence {number} reviews access controls."
+                for number in range(index % 7 + 1)
+            )
+            for index in range(200)
+        ]
+        return separator.join(paragraphs)
+
+    @pytest.mark.parametrize("paragraph_breaks", [True, False])
+    def test_windowed_matches_single_pass(self, paragraph_breaks: bool) -> None:
+        nlp = self._nlp()
+        text = self._long_text(paragraph_breaks)
+        single_pass = [sent.end_char for sent in nlp(text).sents]
+
+        windowed = list(
+            iter_sentence_boundaries(text, nlp=nlp, window_chars=1_000, overlap_chars=200)
+        )
+
+        assert windowed == single_pass
+
+    def test_text_longer_than_max_length_is_segmented(self) -> None:
+        nlp = self._nlp()
+        nlp.max_length = 2_000
+        text = self._long_text(paragraph_breaks=True)
+        assert len(text) > nlp.max_length
+
+        boundaries = get_sentence_boundaries(text, nlp=nlp)
+
+        assert boundaries == sorted(set(boundaries))
+        assert boundaries[-1] == len(text)
+        assert len(boundaries) == text.count(".")
+
+    def test_batch_segments_long_texts_in_windows(self) -> None:
+        nlp = self._nlp()
+        nlp.max_length = 2_000
+        long_text = self._long_text(paragraph_breaks=True)
+
+        short, long = get_sentence_boundaries_batch(["Short text. Done.", long_text], nlp=nlp)
+
+        assert short == [11, 17]
+        assert long == get_sentence_boundaries(long_text, nlp=nlp)
+
+    def test_sentence_longer_than_window_is_cut(self) -> None:
+        text = "word " * 500 + "end."
+
+        boundaries = list(
+            iter_sentence_boundaries(text, nlp=self._nlp(), window_chars=400, overlap_chars=50)
+        )
+
+        assert boundaries[-1] == len(text)
+        assert all(later > earlier for earlier, later in zip(boundaries, boundaries[1:]))
+
+    def test_invalid_overlap_raises_valueerror(self) -> None:
+        with pytest.raises(ValueError, match="overlap_chars"):
+            list(iter_sentence_boundaries("Text.", window_chars=100, overlap_chars=50))
+
+
+_MODEL_CACHE_ATTRS = (
+    "_nlp_model",
+    "_using_fallback_model",
+    "_senter_model",
+    "_senter_unavailable",
+    "_sentencizer_model",
+)
+
+
+@pytest.fixture
+def empty_model_cache():
+    """Start from an empty model cache and restore the previous one afterwards."""
+    saved = {name: getattr(nlp_module, name) for name in _MODEL_CACHE_ATTRS}
+    saved_stats = dict(nlp_module._model_stats)
+    clear_nlp_models()
+    yield
+    for name, value in saved.items():
+        setattr(nlp_module, name, value)
+    nlp_module._model_stats.clear()
+    nlp_module._model_stats.update(saved_stats)
+
+
+def _child_sees_inherited_model(queue) -> None:
+    stats = nlp_model_stats().get("sentencizer")
+    queue.put(stats is not None and nlp_module._sentencizer_model is not None)
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("empty_model_cache")
+class TestModelRegistry:
+    """Tests for loading, warming and sharing the cached spaCy pipelines."""
+
+    def test_concurrent_first_lookups_load_model_once(self) -> None:
+        calls = []
+
+        def _slow_load(*args, **kwargs):
+            calls.append(args)
+            time.sleep(0.05)
+            nlp = spacy.blank("en")
+            nlp.add_pipe("sentencizer")
+            return nlp
+
+        barrier = threading.Barrier(6)
+        results = []
+
+        def lookup() -> None:
+            barrier.wait()
+            results.append(get_sentence_boundaries("One. Two."))
+
+        with patch("spacy.load", side_effect=_slow_load):
+            threads = [threading.Thread(target=lookup) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 1
+        assert results == [[4, 9]] * 6
+
+    def test_warm_reports_load_time_and_resident_size(self) -> None:
+        stats = warm_nlp_models(["sentencizer", "heuristic"])
+
+        assert set(stats) == {"sentencizer"}
+        assert stats["sentencizer"].load_ms > 0
+        assert stats["sentencizer"].rss_delta_mb >= 0
+        assert nlp_model_stats() == stats
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/self/statm")
+    def test_resident_size_tracks_current_not_peak_rss(self) -> None:
+        before = nlp_module._resident_bytes()
+        block = b"x" * (64 * 2**20)
+        during = nlp_module._resident_bytes()
+        del block
+        after = nlp_module._resident_bytes()
+
+        assert during - before >= 48 * 2**20
+        # Peak RSS never falls; current RSS drops once the block is released.
+        assert after <= during - 32 * 2**20
+
+    def test_warm_does_not_reload_cached_model(self) -> None:
+        warm_nlp_models(["sentencizer"])
+        model = nlp_module._sentencizer_model
+
+        with patch.object(nlp_module, "_build_fallback_nlp") as build:
+            warm_nlp_models(["sentencizer"])
+
+        build.assert_not_called()
+        assert nlp_module._sentencizer_model is model
+
+    def test_warm_parser_without_model_records_fallback(self) -> None:
+        with patch("spacy.load", side_effect=OSError("Model not found")):
+            stats = warm_nlp_models()
+
+        assert stats["parser"].fallback is True
+        assert stats["parser"].model_name == "blank_en_sentencizer"
+
+    def test_warm_unknown_backend_raises_valueerror(self) -> None:
+        with pytest.raises(ValueError, match="Invalid segmentation backend"):
+            warm_nlp_models(["fastest"])
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+    )
+    def test_forked_child_inherits_warmed_model(self) -> None:
+        warm_nlp_models(["sentencizer"])
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+
+        child = context.Process(target=_child_sees_inherited_model, args=(queue,))
+        child.start()
+        inherited = queue.get(timeout=30)
+        child.join(timeout=30)
+
+        assert inherited is True
@@ -20,6 +20,7 @@ from data_extract.contracts import (
     ProcessJobResult,
     SemanticOutcome,
 )
+from data_extract.services.pipeline_service import PipelineFileResult, PipelineRunResult
 
 pytestmark = [pytest.mark.P0, pytest.mark.unit, pytest.mark.cli]
 
@@ -133,6 +134,13 @@ def test_version_flag_and_command_show_current_version(cli_runner: CliRunner) ->
         (["--chunk-size", "0"], EXIT_CONFIG_ERROR, "Invalid chunk size: 0"),
         (["--semantic-report-format", "yaml"], EXIT_CONFIG_ERROR, "Invalid semantic report format"),
         (["--semantic-graph-format", "svg"], EXIT_CONFIG_ERROR, "Invalid semantic graph format"),
+        (["--workers", "0"], EXIT_CONFIG_ERROR, "Invalid worker count: 0"),
+        (["--workers", "65"], EXIT_CONFIG_ERROR, "Invalid worker count: 65"),
+        (
+            ["--segmentation-backend", "bogus"],
+            EXIT_CONFIG_ERROR,
+            "Invalid segmentation backend 'bogus'",
+        ),
     ],
 )
 def test_process_validation_errors(
@@ -200,6 +208,8 @@ def test_process_builds_request_and_prints_status(
         "0.4",
         "--pipeline-profile",
         "advanced",
+        "--segmentation-backend",
+        "Sentencizer",
         "--non-interactive",
     ]
     result = cli_runner.invoke(app, args)
@@ -229,6 +239,7 @@ def test_process_builds_request_and_prints_status(
         "semantic_max_features": 1200,
         "semantic_n_components": 80,
         "pipeline_profile": "advanced",
+        "segmentation_backend": "sentencizer",
     }
     for key, expected in expected_values.items():
         assert getattr(request, key) == expected
@@ -298,3 +309,78 @@ def test_process_unexpected_exception_maps_to_failure_exit(
     result = cli_runner.invoke(app, ["process", "input"])
     assert result.exit_code == EXIT_FAILURE
     assert "Processing failed:" in result.output
+
+
+def test_batch_passes_segmentation_backend_to_pipeline(
+    cli_runner: CliRunner,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "doc.txt").write_text("First sentence. Second sentence.")
+    captured: dict[str, object] = {}
+
+    def fake_process_files(self, **kwargs):  # noqa: ANN001, ANN003, ANN202
+        captured.update(kwargs)
+        raise RuntimeError("stop after capture")
+
+    monkeypatch.setattr(services.PipelineService, "process_files", fake_process_files)
+
+    cli_runner.invoke(
+        app,
+        [
+            "batch",
+            str(input_dir),
+            "--output",
+            str(tmp_path / "output"),
+            "--segmentation-backend",
+            "heuristic",
+        ],
+    )
+
+    assert captured["segmentation_backend"] == "heuristic"
+
+
+def test_batch_streams_discovered_files_into_pipeline(
+    cli_runner: CliRunner,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    input_dir = tmp_path / "input"
+    (input_dir / "nested").mkdir(parents=True)
+    (input_dir / "a.txt").write_text("alpha")
+    (input_dir / "nested" / "b.txt").write_text("beta")
+    (input_dir / "c.md").write_text("gamma")
+    (input_dir / "b-link.txt").symlink_to(input_dir / "nested" / "b.txt")
+    consumed: list[Path] = []
+
+    def fake_process_files(self, files, **kwargs):  # noqa: ANN001, ANN003, ANN202
+        assert not isinstance(files, (list, tuple))
+        run = PipelineRunResult()
+        for file_path in files:
+            consumed.append(file_path)
+            run.processed.append(
+                PipelineFileResult(source_path=file_path, output_path=file_path, chunk_count=1)
+            )
+        return run
+
+    monkeypatch.setattr(services.PipelineService, "process_files", fake_process_files)
+
+    result = cli_runner.invoke(
+        app,
+        [
+            "batch",
+            str(input_dir),
+            "--output",
+            str(tmp_path / "output"),
+            "--pattern",
+            "*.txt",
+            "--recursive",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(consumed) == sorted(
+        [(input_dir / "a.txt").resolve(), (input_dir / "nested" / "b.txt").resolve()]
+    )
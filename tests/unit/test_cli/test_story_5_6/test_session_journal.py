@@ -0,0 +1,132 @@
+"""AC-5.6-1 & AC-5.6-2: Append-only session journal tests.
+
+Focuses on per-file outcome journaling:
+- Outcomes are appended without rewriting the snapshot
+- Resume replays every journaled outcome
+- Torn trailing records from a crash are ignored
+- Compaction folds the journal back into the snapshot
+
+Source module: src/data_extract/cli/session.py
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from data_extract.cli.session import SessionManager
+
+pytestmark = [
+    pytest.mark.P0,
+    pytest.mark.session_state,
+    pytest.mark.story_5_6,
+    pytest.mark.unit,
+    pytest.mark.cli,
+]
+
+
+def _start(tmp_path: Path) -> SessionManager:
+    manager = SessionManager(work_dir=tmp_path)
+    manager.start_session(source_dir=tmp_path / "source", total_files=10)
+    return manager
+
+
+def _record(manager: SessionManager, name: str) -> None:
+    manager.record_processed_file(
+        file_path=Path(f"/corpus/{name}"),
+        output_path=Path(f"/out/{name}.json"),
+        file_hash="",
+    )
+
+
+class TestSessionJournal:
+    """Test journaled per-file session progress."""
+
+    def test_records_append_to_journal_not_snapshot(self, tmp_path: Path) -> None:
+        """Recording outcomes leaves the snapshot untouched and grows the journal."""
+        manager = _start(tmp_path)
+        _record(manager, "a.pdf")
+        session_file = manager.session_dir / f"session-{manager.session_id}.json"
+        snapshot_before = session_file.read_text()
+
+        _record(manager, "b.pdf")
+        manager.record_failed_file(Path("/corpus/c.pdf"), "ExtractionError", "bad")
+
+        journal = manager.session_dir / f"session-{manager.session_id}.journal"
+        assert session_file.read_text() == snapshot_before
+        assert len(journal.read_text().splitlines()) == 3
+
+    def test_resume_replays_unsaved_outcomes(self, tmp_path: Path) -> None:
+        """A crash before save still resumes with every recorded file."""
+        manager = _start(tmp_path)
+        _record(manager, "a.pdf")
+        _record(manager, "b.pdf")
+        manager.record_failed_file(Path("/corpus/c.pdf"), "ExtractionError", "bad")
+        manager.increment_retry_count(Path("/corpus/c.pdf"))
+        session_id = manager.session_id
+        assert session_id is not None
+
+        restored = SessionManager(work_dir=tmp_path).load_session(session_id)
+
+        assert restored is not None
+        assert [entry["path"] for entry in restored.processed_files] == ["a.pdf", "b.pdf"]
+        assert restored.statistics.processed_count == 2
+        assert restored.statistics.failed_count == 1
+        assert restored.failed_files[0]["retry_count"] == 1
+
+        found = SessionManager(work_dir=tmp_path).find_incomplete_session(tmp_path / "source")
+        assert found is not None
+        assert found.statistics.processed_count == 2
+
+    def test_torn_record_is_skipped_and_appends_continue(self, tmp_path: Path) -> None:
+        """A partially written final record does not hide later outcomes."""
+        manager = _start(tmp_path)
+        _record(manager, "a.pdf")
+        session_id = manager.session_id
+        assert session_id is not None
+        journal = manager.session_dir / f"session-{session_id}.journal"
+        with journal.open("a", encoding="utf-8") as handle:
+            handle.write('{"seq": 2, "op": "proc')
+
+        resumed = SessionManager(work_dir=tmp_path)
+        resumed.load_session(session_id)
+        _record(resumed, "b.pdf")
+
+        restored = SessionManager(work_dir=tmp_path).load_session(session_id)
+        assert restored is not None
+        assert [entry["path"] for entry in restored.processed_files] == ["a.pdf", "b.pdf"]
+
+    def test_save_compacts_journal_into_snapshot(self, tmp_path: Path) -> None:
+        """Saving folds journaled outcomes into the snapshot and drops the journal."""
+        manager = _start(tmp_path)
+        _record(manager, "a.pdf")
+        _record(manager, "b.pdf")
+
+        manager.save_session()
+
+        journal = manager.session_dir / f"session-{manager.session_id}.journal"
+        session_file = manager.session_dir / f"session-{manager.session_id}.json"
+        snapshot = json.loads(session_file.read_text())
+        assert not journal.exists()
+        assert snapshot["statistics"]["processed_count"] == 2
+        assert snapshot["journal_seq"] == 2
+
+    def test_automatic_compaction_keeps_outcomes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Reaching the compaction threshold rewrites the snapshot without losing records."""
+        monkeypatch.setattr(SessionManager, "JOURNAL_COMPACT_RECORDS", 3)
+        manager = _start(tmp_path)
+        for index in range(5):
+            _record(manager, f"doc{index}.pdf")
+        session_id = manager.session_id
+        assert session_id is not None
+
+        journal = manager.session_dir / f"session-{session_id}.journal"
+        assert len(journal.read_text().splitlines()) == 2
+
+        restored = SessionManager(work_dir=tmp_path).load_session(session_id)
+        assert restored is not None
+        assert restored.statistics.processed_count == 5